@@ -7,35 +7,167 @@ WITH FULL JOB DESCRIPTIONS
 
 import asyncio
 import json
-import re
+import os
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
-from playwright.async_api import async_playwright, Page, Browser
+from contextlib import AsyncExitStack, asynccontextmanager
+from functools import partial
+from typing import AsyncContextManager, AsyncIterator, Awaitable, Callable, List, Dict, Optional, Tuple
+from playwright.async_api import async_playwright, Page, Browser, BrowserContext
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 import random
 import hashlib
+import time
+from collections import Counter
 
-import logging
-logging.basicConfig(
-    filename='scraper.log',
-    level=logging.INFO,
-    format='%(asctime)s - %(message)s'
+from config import (
+    KEYWORD_CONCURRENCY, DETAIL_POOL_SIZE, DETAIL_FETCH_TIMEOUT, HTTP_FAST_PATH, DESCRIPTION_CACHE,
+    INCREMENTAL_STOP_FRACTION, INCREMENTAL_CUTOFF_HOURS, STREAM_BUFFER, CHECKPOINT_FILE, REPLAY_LATENCY_MS,
+    PLATFORM_BASE_URLS, BROWSER_LAUNCH_ARGS, GLASSDOOR_LAUNCH_ARGS,
+)
+from browser_watchdog import BrowserWatchdog, launch_browser
+from card_extraction import CARD_SPECS, DETAIL_SPECS, extract_cards, normalise_card
+from checkpoint import ScrapeCheckpoint
+from date_parser import DateParser
+from deadline import DeadlineExceeded, cap_ms, check_deadline, current_deadline, deadline_scope
+from description_cache import DescriptionCache
+from detail_pool import DetailFetchPool
+from memory_scheduler import MemoryBudgetScheduler
+from http_fetcher import HttpFetcher, FetchBlocked, HTTP_FAST_PATH_AVAILABLE, detect_block
+from page_state import extract_state_cards
+from pagination import linked_pages, plan_pages
+from rate_limiter import DomainRateLimiter
+from resource_blocking import ResourceBlocker
+from session_archive import SessionArchive
+from text_normalise import JobRecord, clean_text, job_key, unique_key, unique_keys
+from time_budget import TimeBudgetAllocator
+from waits import (
+    goto_ready, read_text, wait_for_any_text,
+    wait_for_stable_count, wait_for_text_change, wait_until_hidden,
 )
 
+import logging
+from event_log import configure_logging, get_logger
+
+log = get_logger('scraper')  # run and keyword progress
+page_log = get_logger('scraper.pages')  # one summary line per results page
+job_log = get_logger('scraper.jobs')  # one line per job (silenced in summary mode)
+detail_log = get_logger('scraper.details')  # detail-page extraction (silenced in summary mode)
+
+class LazyBrowser:
+    """
+    Browser of one scrape, opened by the first get()
+    
+    Results and detail pages go over HTTP while that works, so a run the
+    fast path serves entirely never launches (or leases) Chromium. A failed
+    launch is raised to every caller instead of being retried per keyword.
+    """
+    
+    def __init__(self, open_session: Callable[[], AsyncContextManager[Browser]]):
+        self._open_session = open_session
+        self._stack = AsyncExitStack()
+        self._browser: Optional[Browser] = None
+        self._error: Optional[BaseException] = None
+        self._lock = asyncio.Lock()
+    
+    @property
+    def launched(self) -> bool:
+        return self._browser is not None
+    
+    async def get(self) -> Browser:
+        async with self._lock:
+            if self._error is not None:
+                raise self._error
+            if self._browser is None:
+                try:
+                    self._browser = await self._stack.enter_async_context(self._open_session())
+                except Exception as e:
+                    self._error = e
+                    raise
+        return self._browser
+    
+    async def __aenter__(self) -> 'LazyBrowser':
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self._stack.aclose()
+
+
 class JobScraper:
-    def __init__(self, headless: bool = False):
+    def __init__(self, headless: bool = False, keyword_concurrency: int = KEYWORD_CONCURRENCY,
+                 browser_manager=None, http_fast_path: bool = HTTP_FAST_PATH,
+                 description_cache=DESCRIPTION_CACHE, incremental: bool = False,
+                 stop_fraction: float = INCREMENTAL_STOP_FRACTION, prefilter: bool = False,
+                 checkpoint=None, resume: bool = False, rate_limiter=None,
+                 archive: Optional[SessionArchive] = None, base_urls: Optional[Dict[str, str]] = None):
         """
         Initialize the job scraper
         
         Args:
             headless: Run browser in headless mode (True for production, False for debugging)
+            keyword_concurrency: Keyword searches run at once as separate pages of one browser
+            browser_manager: Optional BrowserManager to lease a warm browser from
+                             (scrapes must then run on the manager's event loop)
+            http_fast_path: Fetch pages over plain HTTP first, escalating to the
+                            browser when blocked (needs httpx + selectolax)
+            description_cache: True to use the on-disk cache from config, False to
+                               disable it, or a DescriptionCache instance to share
+            incremental: Stop paginating a keyword once `stop_fraction` of a results
+                         page is already known (see load_known_jobs) or older than
+                         INCREMENTAL_CUTOFF_HOURS
+            prefilter: Drop cards that the dedup / 24h / existing-store post-processing
+                       would remove before fetching their detail pages
+            checkpoint: Path of (or ScrapeCheckpoint for) per-keyword progress written
+                        after every results page
+            resume: Continue keywords from the checkpoint instead of page 1; finished
+                    keywords are skipped and their jobs count as already seen
+            rate_limiter: DomainRateLimiter to share with other scrapers (a new one
+                          by default); it paces every page, tab and HTTP request
+            archive: SessionArchive that records every response of the session,
+                     or (replay mode) serves them back with no network access
+            base_urls: Site roots per platform overriding PLATFORM_BASE_URLS
+                       (e.g. a local fixture server for benchmarks)
         """
         self.headless = headless
+        self.browser_manager = browser_manager
+        self.keyword_concurrency = max(1, keyword_concurrency)
+        self.base_urls = dict(PLATFORM_BASE_URLS, **(base_urls or {}))
+        self.resource_blocker = ResourceBlocker(base_urls=self.base_urls)
+        self.rate_limiter = rate_limiter or DomainRateLimiter()
+        self.archive = archive
+        self.backend_stats = {}  # platform -> pages served per backend
+        self._http_blocked = {}  # platform -> True once the fast path was blocked
         self.jobs = []
         self.user_agents = [
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
             'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
         ]
+        self.http_fetcher = None
+        if http_fast_path:
+            if HTTP_FAST_PATH_AVAILABLE:
+                self.http_fetcher = HttpFetcher(self.user_agents, rate_limiter=self.rate_limiter,
+                                                archive=archive, base_urls=self.base_urls)
+            else:
+                log.warning("⚠️ HTTP fast path disabled: httpx/selectolax not installed, using browser only")
+        if description_cache is True:
+            description_cache = DescriptionCache()
+        self.description_cache = description_cache or None
+        self.incremental = incremental
+        self.stop_fraction = stop_fraction
+        self.prefilter = prefilter
+        self.stored_jobs = {}  # unique key -> posted datetime of jobs already stored (load_known_jobs)
+        self.seen_cards = {}  # unique key -> newest card date seen this run
+        self.incremental_stats = {}  # platform -> early-stop counters
+        self.prefilter_stats = {}  # platform -> cards dropped before detail fetch, by reason
+        self.scheduler_stats = {}  # memory scheduler counters of the last scrape_all_platforms run
+        self.partial_reasons = {}  # "platform: keyword" -> why it stopped before its last page
+        self.time_budget_stats = {}  # time allotted / used per platform in the last multi-platform run
+        self.date_parser = DateParser()  # one reference time for every relative date of the run
+        self.watchdog = BrowserWatchdog()
+        if isinstance(checkpoint, str):
+            checkpoint = ScrapeCheckpoint(checkpoint)
+        self.checkpoint = checkpoint
+        self.resume = resume and checkpoint is not None
     
     def generate_job_id(self, title: str, company: str, source: str) -> str:
         """Generate unique job ID based on title and company (cross-platform)"""
@@ -44,108 +176,50 @@ class JobScraper:
         return hashlib.md5(unique_string.encode()).hexdigest()[:12]
     
     def generate_unique_key(self, title: str, company: str) -> str:
-        """Generate key for duplicate detection"""
-        # Normalize text for better matching
-        title_clean = re.sub(r'[^\w\s]', '', title.lower().strip())
-        company_clean = re.sub(r'[^\w\s]', '', company.lower().strip())
-        return f"{company_clean}||{title_clean}"
+        """Generate key for duplicate detection (built jobs carry theirs, see text_normalise.job_key)"""
+        return unique_key(title, company)
     
     def clean_text(self, text: str) -> str:
         """Clean and normalize text"""
-        if not text:
-            return ""
-        text = re.sub(r'\s+', ' ', text)
-        text = re.sub(r'[^\w\s.,;:()\-$€£¥]', '', text)
-        return text.strip()
+        return clean_text(text)
+    
+    def listing_key(self, listing: Dict) -> str:
+        """Unique key a card's job will have (built from the cleaned fields, like _build_job)"""
+        return self.generate_unique_key(clean_text(listing['title']), clean_text(listing['company']))
     
     def parse_posted_date(self, date_text: str) -> str:
-        """Convert relative date to ISO format"""
-        try:
-            if not date_text:
-                print(f"    ⚠️ Empty date text, using current date")
-                return datetime.now().isoformat()
-                
-            date_text = date_text.lower().strip()
-            now = datetime.now()
-            
-            # Remove "last updated:" prefix if present
-            if 'last updated:' in date_text:
-                date_text = date_text.replace('last updated:', '').strip()
-            
-            # Debug: Print what we're parsing
-            print(f"    🔍 Parsing date: '{date_text[:100]}'")  # Limit to 100 chars for display
-            
-            # Check if text is too long (likely not a date)
-            if len(date_text) > 100:
-                print(f"    ⚠️ Text too long to be a date ({len(date_text)} chars), using current date")
-                return now.isoformat()
-
-            # Just posted / Today
-            if 'just posted' in date_text or 'today' in date_text:
-                print(f"    ✅ Parsed: just posted")
-                return now.isoformat()
-            
-            # Yesterday
-            if 'yesterday' in date_text or date_text == '1d':
-                calculated_date = now - timedelta(days=1)
-                print(f"    ✅ Parsed: yesterday -> {calculated_date.strftime('%Y-%m-%d')}")
-                return calculated_date.isoformat()
-            
-            # Minutes ago (check before hours because 'min' might contain 'm')
-            minutes_match = re.search(r'(\d+)\s*(?:minute|minutes|min|m)(?:\s+ago)?', date_text)
-            if minutes_match:
-                minutes = int(minutes_match.group(1))
-                calculated_date = now - timedelta(minutes=minutes)
-                print(f"    ✅ Parsed: {minutes} minutes ago -> {calculated_date.strftime('%Y-%m-%d %H:%M')}")
-                return calculated_date.isoformat()
-            
-            # Hours ago - FIXED to include "hr" format
-            hours_match = re.search(r'(\d+)\s*(?:hour|hours|hr|h)(?:\s+ago)?', date_text)
-            if hours_match:
-                hours = int(hours_match.group(1))
-                calculated_date = now - timedelta(hours=hours)
-                print(f"    ✅ Parsed: {hours} hours ago -> {calculated_date.strftime('%Y-%m-%d %H:%M')}")
-                return calculated_date.isoformat()
-            
-            # Days ago (most common format: "2d", "3 days ago", etc.)
-            days_match = re.search(r'(\d+)\s*(?:day|days|d)(?:\s+ago)?', date_text)
-            if days_match:
-                days = int(days_match.group(1))
-                calculated_date = now - timedelta(days=days)
-                print(f"    ✅ Parsed: {days} days ago -> {calculated_date.strftime('%Y-%m-%d')}")
-                return calculated_date.isoformat()
-            
-            # Weeks ago
-            weeks_match = re.search(r'(\d+)\s*(?:week|weeks|w)(?:\s+ago)?', date_text)
-            if weeks_match:
-                weeks = int(weeks_match.group(1))
-                calculated_date = now - timedelta(weeks=weeks)
-                print(f"    ✅ Parsed: {weeks} weeks ago -> {calculated_date.strftime('%Y-%m-%d')}")
-                return calculated_date.isoformat()
-            
-            # Months ago (approximate: 30 days per month)
-            months_match = re.search(r'(\d+)\s*(?:month|months|mo)(?:\s+ago)?', date_text)
-            if months_match:
-                months = int(months_match.group(1))
-                calculated_date = now - timedelta(days=months * 30)
-                print(f"    ✅ Parsed: {months} months ago -> {calculated_date.strftime('%Y-%m-%d')}")
-                return calculated_date.isoformat()
-            
-            # Special case: "0d" or "0h" means just posted
-            if date_text in ['0d', '0h', '0hr', '0m', '0 days', '0 hours']:
-                print(f"    ✅ Parsed: 0 time units (just posted)")
-                return now.isoformat()
-            
-            # If nothing matched, log and return current date
-            print(f"    ⚠️ Could not parse date: '{date_text[:50]}...', using current date")
-            return now.isoformat()
-
-        except Exception as e:
-            print(f"    ⚠️ Date parsing error for '{date_text[:50] if date_text else 'None'}': {str(e)}")
-            return datetime.now().isoformat()
+        """Convert a relative or absolute posted date to ISO format (measured from the run's start)"""
+        return self.date_parser.parse_iso(date_text)
+    
+    @asynccontextmanager
+    async def browser_session(self, platforms: Optional[List[str]] = None, **launch_kwargs) -> AsyncIterator[Browser]:
+        """
+        Yield a browser for one platform scrape
+        
+        Leases the shared warm browser when a browser_manager is set (it has
+        its own launch args), otherwise launches (and afterwards closes) a
+        private one with BROWSER_LAUNCH_ARGS, or GLASSDOOR_LAUNCH_ARGS when
+        one of `platforms` is Glassdoor. The watchdog kills the browser if it
+        stops responding meanwhile.
+        """
+        launch_kwargs.setdefault(
+            'args', GLASSDOOR_LAUNCH_ARGS if 'Glassdoor' in (platforms or []) else BROWSER_LAUNCH_ARGS)
+        if self.browser_manager is not None:
+            async with self.browser_manager.lease() as browser:
+                async with self.watchdog.guard(browser):
+                    yield browser
+            return
+        
+        async with async_playwright() as p:
+            browser = await launch_browser(p.chromium, headless=self.headless, **launch_kwargs)
+            try:
+                async with self.watchdog.guard(browser):
+                    yield browser
+            finally:
+                await browser.close()
     
-    async def setup_page_context(self, browser: Browser) -> Page:
-        """Setup browser context with anti-detection measures"""
+    async def setup_context(self, browser: Browser, platform: Optional[str] = None) -> BrowserContext:
+        """Setup browser context with anti-detection measures (and the platform's resource blocking)"""
         context = await browser.new_context(
             user_agent=random.choice(self.user_agents),
             viewport={'width': 1920, 'height': 1080},
@@ -163,17 +237,55 @@ class JobScraper:
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
         })
         
+        if platform:
+            await self.resource_blocker.attach(context, platform)
+        if self.archive is not None:
+            # Registered last, so in replay mode it answers before the resource blocker
+            await self.archive.attach(context)
+        if self.browser_manager is not None:
+            self.browser_manager.track_context(context)
+        return context
+    
+    async def setup_page_context(self, browser: Browser, platform: Optional[str] = None) -> Page:
+        """Open a page in a fresh anti-detection context"""
+        context = await self.setup_context(browser, platform)
         page = await context.new_page()
         return page
     
+    async def close_page_context(self, page: Page):
+        """Close a page together with the context created for it in setup_page_context"""
+        try:
+            await page.context.close()
+        except Exception:
+            pass
+    
+    async def run_keyword_tasks(self, keywords: List[str], worker, concurrency: Optional[int] = None):
+        """
+        Run `worker(keyword)` for every keyword, at most `concurrency` at a time
+        
+        Workers emit their jobs as they are built (see stream_jobs), so
+        concurrent searches never share a result list and a cancelled run
+        (e.g. by a platform timeout) has already handed over its partial work.
+        """
+        concurrency = max(1, concurrency or self.keyword_concurrency)
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def run_one(keyword: str):
+            async with semaphore:
+                await worker(keyword)
+        
+        log.info("⚡ Running %d keyword searches (%d at a time)", len(keywords), concurrency)
+        await asyncio.gather(*(run_one(keyword) for keyword in keywords))
+    
     async def extract_simplyhired_description(self, page: Page) -> str:
         """
         Extract full description from SimplyHired's right panel
         Based on actual HTML structure from screenshots
         """
         try:
-            # Wait for panel to load
-            await asyncio.sleep(3)
+            # Wait for panel content instead of a fixed delay
+            await wait_for_any_text(page, DETAIL_SPECS['SimplyHired']['description'],
+                                    min_chars=300, timeout=10000)
             
             # From the HTML images, the structure is:
             # <aside aria-label="Job Title">
@@ -192,16 +304,16 @@ class JobScraper:
                     if scroll_div:
                         all_text = await scroll_div.inner_text()
                         if all_text and len(all_text) > 300:
-                            print(f"        ✅ Got full description from scroll div: {len(all_text)} chars")
+                            detail_log.debug("✅ Description from scroll div: %d chars", len(all_text))
                             return all_text.strip()
                     
                     # Fallback: get from aside directly
                     all_text = await aside.inner_text()
                     if all_text and len(all_text) > 300:
-                        print(f"        ✅ Got full description from aside: {len(all_text)} chars")
+                        detail_log.debug("✅ Description from aside: %d chars", len(all_text))
                         return all_text.strip()
             except Exception as e:
-                print(f"        ⚠️ Strategy 1 failed: {str(e)}")
+                detail_log.debug("Strategy 1 failed: %s", e)
             
             # Strategy 2: Try by tabindex attribute (from HTML: div tabindex="0" class="css-1u3q0w0 scroll")
             try:
@@ -209,10 +321,10 @@ class JobScraper:
                 if scroll_div:
                     all_text = await scroll_div.inner_text()
                     if all_text and len(all_text) > 300:
-                        print(f"        ✅ Got description from tabindex scroll div: {len(all_text)} chars")
+                        detail_log.debug("✅ Description from tabindex scroll div: %d chars", len(all_text))
                         return all_text.strip()
             except Exception as e:
-                print(f"        ⚠️ Strategy 2 failed: {str(e)}")
+                detail_log.debug("Strategy 2 failed: %s", e)
             
             # Strategy 3: Get by specific class pattern
             try:
@@ -220,10 +332,10 @@ class JobScraper:
                 if content_div:
                     all_text = await content_div.inner_text()
                     if all_text and len(all_text) > 300:
-                        print(f"        ✅ Got description from content div: {len(all_text)} chars")
+                        detail_log.debug("✅ Description from content div: %d chars", len(all_text))
                         return all_text.strip()
             except Exception as e:
-                print(f"        ⚠️ Strategy 3 failed: {str(e)}")
+                detail_log.debug("Strategy 3 failed: %s", e)
             
             # Strategy 4: Try data-testid approach
             try:
@@ -231,650 +343,1175 @@ class JobScraper:
                 if body_container:
                     all_text = await body_container.inner_text()
                     if all_text and len(all_text) > 300:
-                        print(f"        ✅ Got description from body container: {len(all_text)} chars")
+                        detail_log.debug("✅ Description from body container: %d chars", len(all_text))
                         return all_text.strip()
             except Exception as e:
-                print(f"        ⚠️ Strategy 4 failed: {str(e)}")
+                detail_log.debug("Strategy 4 failed: %s", e)
             
             # If we got something but it's short, still return it
             if all_text:
-                print(f"        ⚠️ Got short description: {len(all_text)} chars")
+                detail_log.info("⚠️ Short description: %d chars", len(all_text))
                 return all_text.strip()
             
-            print(f"        ❌ No description found with any strategy")
+            detail_log.info("❌ No description found with any strategy")
             return ""
             
         except Exception as e:
-            print(f"        ❌ Error extracting description: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            detail_log.warning("❌ Error extracting description: %s", e, exc_info=True)
             return ""
     
+    async def read_simplyhired_details(self, detail_page: Page) -> Dict:
+        """Read description and posting timestamp from a loaded SimplyHired job view"""
+        posted_date_text = None
+        try:
+            date_elem = await detail_page.query_selector('span[data-testid="viewJobBodyPostingTimestamp"]')
+            if date_elem:
+                posted_date_text = await date_elem.inner_text()
+        except:
+            pass
+        
+        return {
+            'full_description': await self.extract_simplyhired_description(detail_page),
+            'posted_date_text': posted_date_text
+        }
+    
+    async def read_talent_details(self, detail_page: Page) -> Dict:
+        """Read the full description from a loaded Talent.com job page"""
+        # Extract full description
+        full_description = ""
+        
+        # Selectors based on your screenshot
+        description_selectors = [
+            'div.sc-fcd630a4-10.sc-fcd630a4-11.sc-6cde2aa1-10.cgBMEk.iroSSa.bEMPBB',
+            'div[class*="fcd630a4"]',
+            'div[class*="cgBMEk"]',
+            'span[class*="sc-fcd630a4-15"]',
+        ]
+        
+        # Wait for the description to render instead of a fixed delay
+        await wait_for_any_text(detail_page, DETAIL_SPECS['Talent.com']['description'],
+                                min_chars=100, timeout=10000)
+        
+        for selector in description_selectors:
+            try:
+                desc_elem = await detail_page.query_selector(selector)
+                if desc_elem:
+                    full_description = await desc_elem.inner_text()
+                    if len(full_description) > 100:  # Valid description
+                        break
+            except:
+                continue
+        
+        # If still not found, try getting all text content
+        if not full_description or len(full_description) < 100:
+            try:
+                # Get the main content area
+                main_content = await detail_page.query_selector('article, main, div[class*="jobcard"]')
+                if main_content:
+                    full_description = await main_content.inner_text()
+            except:
+                pass
+        
+        return {
+            'full_description': full_description.strip()
+        }
+    
     async def extract_talent_description(self, page: Page, job_url: str) -> Dict:
         """
         Extract full description from Talent.com by opening in new tab
         Returns dict with description and other details
         """
+        detail_page = None
         try:
             context = page.context
             detail_page = await context.new_page()
             
-            await detail_page.goto(job_url, wait_until='networkidle', timeout=30000)
-            await asyncio.sleep(random.uniform(2, 3))
-            
-            # Extract full description
-            full_description = ""
-            
-            # Selectors based on your screenshot
-            description_selectors = [
-                'div.sc-fcd630a4-10.sc-fcd630a4-11.sc-6cde2aa1-10.cgBMEk.iroSSa.bEMPBB',
-                'div[class*="fcd630a4"]',
-                'div[class*="cgBMEk"]',
-                'span[class*="sc-fcd630a4-15"]',
-            ]
-            
-            for selector in description_selectors:
-                try:
-                    desc_elem = await detail_page.query_selector(selector)
-                    if desc_elem:
-                        full_description = await desc_elem.inner_text()
-                        if len(full_description) > 100:  # Valid description
-                            break
-                except:
-                    continue
-            
-            # If still not found, try getting all text content
-            if not full_description or len(full_description) < 100:
-                try:
-                    # Get the main content area
-                    main_content = await detail_page.query_selector('article, main, div[class*="jobcard"]')
-                    if main_content:
-                        full_description = await main_content.inner_text()
-                except:
-                    pass
-            
+            await detail_page.goto(job_url, wait_until='domcontentloaded', timeout=cap_ms(30000))
+            details = await self.read_talent_details(detail_page)
             await detail_page.close()
-            
-            return {
-                'full_description': full_description.strip()
-            }
+            return details
             
         except Exception as e:
-            print(f"        ❌ Error opening detail page: {str(e)}")
+            detail_log.warning("❌ Error opening detail page %s: %s", job_url, e)
             try:
                 await detail_page.close()
             except:
                 pass
             return {'full_description': ""}
     
-    # ==================== SIMPLYHIRED SCRAPER ====================
-    async def scrape_simplyhired(self, keywords: List[str], location: str = "USA", max_pages: int = 5):
-        """Scrape SimplyHired with FULL descriptions from right panel"""
-        print("\n" + "="*60)
-        print("🔄 SCRAPING SIMPLYHIRED (WITH FULL DESCRIPTIONS)")
-        print("="*60)
-        
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=self.headless)
+    # ==================== SHARED PLATFORM PIPELINE ====================
+    def build_search_url(self, platform: str, keyword: str, location: str) -> str:
+        """First results page URL for a keyword"""
+        base_url = self.base_urls.get(platform)
+        if platform == 'SimplyHired':
+            query = keyword.replace(' ', '+')
+            return f"{base_url}/search?q={query}&l={location}&t=1"
+        if platform == 'Talent.com':
+            query = keyword.replace(' ', '-')
+            return f"{base_url}/jobs?k={query}&l={location}&date=1"
+        if platform == 'Glassdoor':
+            query = keyword.replace(' ', '-')
+            location_formatted = location.replace(' ', '-').lower()
+            return f"{base_url}/Job/{location_formatted}-{query}-jobs-SRCH_IL.0,13_IN1_KO14,31.htm?fromAge=1"
+        raise ValueError(f"Unknown platform: {platform}")
+    
+    def _backend_stats(self, platform: str) -> Dict:
+        return self.backend_stats.setdefault(platform, {
+            'search_http': 0,
+            'search_browser': 0,
+            'detail_http': 0,
+            'detail_browser': 0,
+            'pages_direct': 0,  # Next results page reached by a built URL
+            'pages_clicked': 0,  # ...or by clicking next (no URL could be built)
+            'escalations': {},
+        })
+    
+    def _record_escalation(self, platform: str, reason: str):
+        """Remember that the HTTP fast path failed so the rest of the run goes to the browser"""
+        escalations = self._backend_stats(platform)['escalations']
+        escalations[reason] = escalations.get(reason, 0) + 1
+        self._http_blocked[platform] = True
+        log.event(logging.WARNING, 'escalation', "🔁 %s: HTTP fast path unusable (%s), escalating to browser",
+                  platform, reason, platform=platform, reason=reason)
+    
+    def print_backend_report(self, platform: str):
+        stats = self._backend_stats(platform)
+        log.event(logging.INFO, 'backends',
+                  "🚦 %s backends: search %d http / %d browser, details %d http / %d browser, "
+                  "pagination %d direct / %d clicked, escalations %s",
+                  platform, stats['search_http'], stats['search_browser'], stats['detail_http'],
+                  stats['detail_browser'], stats['pages_direct'], stats['pages_clicked'],
+                  stats['escalations'] or 'none', platform=platform, **stats)
+    
+    @asynccontextmanager
+    async def _platform_pipeline(self, browsers: LazyBrowser, platform: str, location: str,
+                                 max_pages: int, emit: Callable[[Dict], Awaitable[None]]) -> AsyncIterator:
+        """
+        Set up one platform's detail pool, and yield the keyword worker
+        `worker(keyword)` that uses it and passes each built job to `emit`.
+        The detail context is only opened in `browsers` once a detail page
+        needs a tab. The reports are printed when the pipeline closes.
+        Glassdoor has no detail pages, so its worker needs no pool (and reads
+        `max_pages` as the number of loads).
+        """
+        if platform == 'Glassdoor':
+            async def worker(keyword: str):
+                await self._scrape_glassdoor_keyword(browsers, keyword, location, max_pages, emit)
             
-            for keyword in keywords:
-                print(f"\n📌 Searching for: '{keyword}'")
-                
+            try:
+                yield worker
+            finally:
+                self.resource_blocker.print_report(platform)
+            return
+        
+        readers = {
+            'SimplyHired': self.read_simplyhired_details,
+            'Talent.com': self.read_talent_details,
+        }
+        
+        async def load_over_http(url: str) -> Dict:
+            # The pool already waited for the rate limiter
+            return await self.http_fetcher.fetch_detail(url, platform, pace=False)
+        
+        async def open_detail_context() -> BrowserContext:
+            return await self.setup_context(await browsers.get(), platform)
+        
+        use_http = self.http_fetcher is not None and not self._http_blocked.get(platform)
+        detail_pool = DetailFetchPool(
+            open_detail_context,
+            readers[platform],
+            size=DETAIL_POOL_SIZE.get(platform, 4),
+            timeout=DETAIL_FETCH_TIMEOUT,
+            name=platform,
+            http_loader=load_over_http if use_http else None,
+            rate_limiter=self.rate_limiter
+        )
+        
+        async def worker(keyword: str):
+            await self._scrape_keyword(browsers, platform, keyword, location, max_pages, emit, detail_pool)
+        
+        try:
+            async with detail_pool:
+                yield worker
+        finally:
+            if detail_pool.context is not None:
+                await detail_pool.context.close()
+            stats = self._backend_stats(platform)
+            stats['detail_http'] += detail_pool.stats['http']
+            stats['detail_browser'] += detail_pool.stats['fetched']
+            self.resource_blocker.print_report(platform)
+            self.print_backend_report(platform)
+            if platform in self.prefilter_stats:
+                drops = self.prefilter_stats[platform]
+                log.event(logging.INFO, 'prefilter',
+                          "✂️ %s pre-filter: %d detail fetches saved (%d duplicate, %d stale, %d already stored)",
+                          platform, drops['fetches_saved'], drops['duplicate'], drops['stale'],
+                          drops['existing'], platform=platform, **drops)
+    
+    async def _scrape_platform(self, platform: str, keywords: List[str], location: str,
+                               max_pages: int, concurrency: Optional[int], emit: Callable[[Dict], Awaitable[None]]):
+        """Run every keyword of one platform against a shared (lazily opened) browser and detail pool"""
+        async with LazyBrowser(partial(self.browser_session, [platform])) as browsers:
+            async with self._platform_pipeline(browsers, platform, location, max_pages, emit) as worker:
+                await self.run_keyword_tasks(keywords, worker, concurrency)
+    
+    async def _scrape_scheduled(self, platforms: List[str], keywords: List[str], location: str,
+                                max_pages: int, memory_budget_mb: Optional[float],
+                                emit: Callable[[Dict], Awaitable[None]]):
+        """
+        Run every (platform, keyword) pair as a MemoryBudgetScheduler task
+        
+        Each free slot goes to the platform with the most estimated remaining
+        work (see TimeBudgetAllocator.pick), so a slow platform gets more of
+        the run's time instead of being cut off while a fast one idles.
+        """
+        scheduler = MemoryBudgetScheduler(**({'budget_mb': memory_budget_mb} if memory_budget_mb else {}))
+        deadline = current_deadline()
+        allocator = TimeBudgetAllocator(deadline.remaining() if deadline else 0, platforms)
+        self.scheduler_stats = scheduler.stats
+        self.time_budget_stats = allocator.report()
+        
+        def choose(pending: List[Tuple[str, Callable]], running: List[str]) -> int:
+            platform = allocator.pick(Counter(name.split(':', 1)[0] for name, _ in pending),
+                                      Counter(name.split(':', 1)[0] for name in running))
+            return next(i for i, (name, _) in enumerate(pending) if name.startswith(f"{platform}:"))
+        
+        async def timed(worker, platform: str, keyword: str):
+            started = time.monotonic()
+            try:
+                await worker(keyword)
+            finally:
+                allocator.record_task(platform, time.monotonic() - started)
+        
+        try:
+            async with LazyBrowser(partial(self.browser_session, platforms)) as browsers:
+                async with AsyncExitStack() as stack:
+                    workers = {
+                        platform: await stack.enter_async_context(
+                            self._platform_pipeline(browsers, platform, location, max_pages, emit)
+                        )
+                        for platform in platforms
+                    }
+                    await scheduler.run([
+                        (f"{platform}:{keyword}", partial(timed, workers[platform], platform, keyword))
+                        for keyword in keywords for platform in platforms
+                    ], chooser=choose)
+        finally:
+            self.time_budget_stats = allocator.report()
+            scheduler.print_report()
+    
+    async def stream_jobs(
+        self,
+        keywords: List[str],
+        location: str = "United States",
+        max_pages: int = 2,
+        platforms: Optional[List[str]] = None,
+        concurrency: Optional[int] = None,
+        scheduled: bool = False,
+        memory_budget_mb: Optional[float] = None
+    ) -> AsyncIterator[Dict]:
+        """
+        Yield each normalised job as soon as it is built
+        
+        Platforms are scraped one after the other (keywords `concurrency` at a
+        time), or, with `scheduled`, all (platform, keyword) pairs run under
+        the memory budget. At most STREAM_BUFFER finished jobs wait for the
+        consumer; scraping pauses when the consumer falls behind. Closing the
+        iterator early cancels the scrape.
+        
+        Checkpoint updates travel through the same queue and are applied when
+        the consumer asks for the item after them, i.e. once it is done with
+        every job of their page (save_stream has spooled them), so a resumed
+        run never skips a page whose jobs were lost.
+        
+        Example:
+            async for job in scraper.stream_jobs(['python developer'], platforms=['Talent.com']):
+                print(job['title'])
+        """
+        platforms = platforms or ['SimplyHired', 'Talent.com']
+        queue: asyncio.Queue = asyncio.Queue(maxsize=STREAM_BUFFER)
+        
+        async def produce():
+            try:
+                if scheduled:
+                    await self._scrape_scheduled(platforms, keywords, location, max_pages,
+                                                 memory_budget_mb, queue.put)
+                else:
+                    for platform in platforms:
+                        await self._scrape_platform(platform, keywords, location, max_pages,
+                                                    concurrency, queue.put)
+            finally:
+                if self.http_fetcher is not None:
+                    await self.http_fetcher.close()
+                if self.description_cache is not None:
+                    self.description_cache.flush()
+                    self.description_cache.print_report()
+                self.rate_limiter.print_report()
+                if self.archive is not None:
+                    self.archive.print_report()
+        
+        producer = asyncio.create_task(produce())
+        getter = None
+        try:
+            while not (producer.done() and queue.empty()):
+                getter = asyncio.ensure_future(queue.get())
+                await asyncio.wait({getter, producer}, return_when=asyncio.FIRST_COMPLETED)
+                if getter.done():
+                    item = getter.result()
+                    if callable(item):
+                        item()  # Checkpoint update queued after its page's jobs
+                    else:
+                        yield item
+                else:
+                    getter.cancel()  # Producer finished; drain what is left
+            producer.result()  # Surface a producer error
+        finally:
+            if getter is not None and not getter.done():
+                getter.cancel()
+            if self.checkpoint is not None:
+                self.checkpoint.save()
+            if not producer.done():
+                producer.cancel()
+                await asyncio.gather(producer, return_exceptions=True)
+    
+    async def scrape_all_platforms(
+        self,
+        keywords: List[str],
+        location: str = "United States",
+        max_pages: int = 2,
+        platforms: Optional[List[str]] = None,
+        memory_budget_mb: Optional[float] = None
+    ) -> List[Dict]:
+        """
+        Scrape every (platform, keyword) pair as a task under a memory budget
+        
+        Tasks share one browser and one detail pool per platform. New tasks
+        are admitted only while the process tree (Chromium included) is
+        projected to stay under `memory_budget_mb` (see MemoryBudgetScheduler),
+        so parallelism follows what the instance can hold.
+        
+        Args:
+            keywords: List of search keywords
+            location: Job location
+            max_pages: Pages per keyword
+            platforms: Platforms to scrape (default SimplyHired and Talent.com; add
+                       'Glassdoor' to include it, with max_pages as its loads)
+            memory_budget_mb: RSS budget (default MEMORY_BUDGET_MB from config)
+        
+        Returns:
+            List of all scraped jobs (also kept in self.jobs)
+        """
+        platforms = platforms or ['SimplyHired', 'Talent.com']
+        
+        log.event(logging.INFO, 'run_start',
+                  "🚀 MEMORY-SCHEDULED SCRAPING: %s | keywords %s | %s | %d pages per keyword",
+                  ', '.join(platforms), keywords, location, max_pages,
+                  platforms=platforms, keywords=keywords, location=location, max_pages=max_pages)
+        
+        # Jobs land in self.jobs as they arrive, so a caller timeout keeps partial results
+        async for job in self.stream_jobs(keywords, location, max_pages, platforms,
+                                          scheduled=True, memory_budget_mb=memory_budget_mb):
+            self.jobs.append(job)
+        return self.jobs
+    
+    # ==================== STREAM STAGES ====================
+    async def stream_unique(self, jobs: AsyncIterator[Dict]) -> AsyncIterator[Dict]:
+        """
+        Streaming remove_duplicates: drop a job when one with the same title +
+        company and an equal or newer posted_date was already passed on. A newer
+        duplicate is passed on too; save_stream keeps only the newest per key.
+        Only keys and dates are held in memory.
+        """
+        newest = {}
+        removed = 0
+        async for job in jobs:
+            key = job_key(job)
+            date = job.get('posted_date') or ''
+            if key in newest and date <= newest[key]:
+                removed += 1
+                continue
+            newest[key] = date
+            yield job
+        log.info("🗑️  Removed %d duplicate jobs (same title + company)", removed)
+    
+    async def stream_recent(self, jobs: AsyncIterator[Dict], hours: float = 24) -> AsyncIterator[Dict]:
+        """Streaming filter_last_24_hours (jobs with an unparseable date are kept)"""
+        cutoff_time = datetime.now() - timedelta(hours=hours)
+        removed = 0
+        async for job in jobs:
+            try:
+                if datetime.fromisoformat(job['posted_date'].replace('Z', '')) < cutoff_time:
+                    removed += 1
+                    continue
+            except Exception:
+                pass
+            yield job
+        log.info("⏰ Filtered to last %g hours: Removed %d old jobs", hours, removed)
+    
+    async def stream_new(self, jobs: AsyncIterator[Dict], filename: str = 'jobs_output.json') -> AsyncIterator[Dict]:
+        """Streaming remove_duplicates_from_existing (keeps reposts made 24h+ later)"""
+        stored = {}
+        try:
+            with open(filename, 'r', encoding='utf-8') as f:
+                content = f.read().strip()
+            for job in (json.loads(content).get('jobs', []) if content else []):
+                key = job_key(job)
                 try:
-                    page = await self.setup_page_context(browser)
-                    
-                    query = keyword.replace(' ', '+')
-                    url = f"https://www.simplyhired.com/search?q={query}&l={location}&t=1"
-                    
-                    print(f"  📄 Loading search results...")
-                    await page.goto(url, wait_until='networkidle', timeout=60000)
-                    await asyncio.sleep(random.uniform(3, 5))
-                    
-                    for page_num in range(1, max_pages + 1):
-                        try:
-                            await page.wait_for_selector('h2[data-testid="searchSerpJobTitle"]', timeout=1800000)
-                            await asyncio.sleep(2)
-        
-                            # CLOSE POPUP IF IT APPEARS
-                            try:
-                                close_button = await page.query_selector('button[data-testid="cta-closeModal"]')
-                                if not close_button:
-                                    close_button = await page.query_selector('div[class*="sc-4e5e0f9c-0"] button')
-
-                                if close_button:
-                                    is_visible = await close_button.is_visible()
-                                    if is_visible:
-                                        print(f"  🚫 Closing popup...")
-                                        await close_button.click()
-                                        await asyncio.sleep(1)
-                            except Exception as e:
-                                pass
-
-                            job_cards = await page.query_selector_all('div[data-testid="searchSerpJob"]')
-                            print(f"  📄 Page {page_num}: Found {len(job_cards)} jobs")
-                            
-                            for idx, card in enumerate(job_cards):
-                                try:
-                                    title_elem = await card.query_selector('h2[data-testid="searchSerpJobTitle"] a')
-                                    title = await title_elem.inner_text() if title_elem else None
-                                    job_url = await title_elem.get_attribute('href') if title_elem else None
-                                    
-                                    if job_url and not job_url.startswith('http'):
-                                        job_url = f"https://www.simplyhired.com{job_url}"
-                                    
-                                    if not title:
-                                        continue
-                                    
-                                    company_elem = await card.query_selector('span[data-testid="companyName"]')
-                                    if not company_elem:
-                                        text_elems = await card.query_selector_all('p.chakra-text')
-                                        company = "Unknown"
-                                        for elem in text_elems:
-                                            text = await elem.inner_text()
-                                            if "—" in text:
-                                                company = text.split("—")[0].strip()
-                                                break
-                                    else:
-                                        company = await company_elem.inner_text()
-                                    
-                                    location_elem = await card.query_selector('span[data-testid="searchSerpJobLocation"]')
-                                    if not location_elem:
-                                        location_elem = await card.query_selector('p.chakra-text.css-1sawo7p')
-                                    job_location = await location_elem.inner_text() if location_elem else location
-                                    
-                                    salary_elem = await card.query_selector('p[data-testid="searchSerpJobSalaryConfirmed"]')
-                                    salary = "Not specified"
-                                    if salary_elem:
-                                        salary = await salary_elem.inner_text()
-                                    
-                                    date_elem = await card.query_selector('p[data-testid="searchSerpJobDateStamp"]')
-                                    if not date_elem:
-                                        date_elem = await card.query_selector('span.css-5yilgw')
-                                    posted_date_text = await date_elem.inner_text() if date_elem else None
-                                    
-                                    # Debug: Print what we extracted
-                                    if posted_date_text:
-                                        print(f"      📅 Date text found: '{posted_date_text}'")
-                                    else:
-                                        print(f"      ⚠️ No date element found, using default (just posted)")
-                                        posted_date_text = "just posted"
-                                    
-                                    posted_date = self.parse_posted_date(posted_date_text)
-                                    
-                                    # SHORT description from listing (as fallback)
-                                    desc_elem = await card.query_selector('p[data-testid="searchSerpJobSnippet"]')
-                                    if not desc_elem:
-                                        desc_elem = await card.query_selector('p.chakra-text.css-jhqp7z')
-                                    short_description = await desc_elem.inner_text() if desc_elem else ""
-                                    
-                                    # NOW CLICK THE JOB TO LOAD DESCRIPTION IN RIGHT PANEL
-                                    print(f"    📝 Job {idx + 1}: {title[:50]}...")
-                                    
-                                    try:
-                                        # Click the job title to load details in right panel
-                                        await title_elem.click()
-                                        await asyncio.sleep(2)  # Wait for right panel to load
-                                        
-                                        # Try to get more accurate date from detail panel
-                                        # data-testid="viewJobBodyPostingTimestamp" in the detail view
-                                        try:
-                                            detail_date_elem = await page.query_selector('span[data-testid="viewJobBodyPostingTimestamp"]')
-                                            if detail_date_elem:
-                                                detail_date_text = await detail_date_elem.inner_text()
-                                                if detail_date_text and len(detail_date_text) < 50:
-                                                    posted_date_text = detail_date_text
-                                                    print(f"      📅 Detail date found: '{posted_date_text}'")
-                                                    posted_date = self.parse_posted_date(posted_date_text)
-                                        except:
-                                            pass
-                                        
-                                        # Extract FULL description from right panel
-                                        full_description = await self.extract_simplyhired_description(page)
-                                        
-                                        if full_description and len(full_description) > len(short_description):
-                                            description = full_description
-                                            print(f"      ✅ Got full description ({len(full_description)} chars)")
-                                        else:
-                                            description = short_description
-                                            print(f"      ⚠️ Using short description ({len(short_description)} chars)")
-                                    
-                                    except Exception as e:
-                                        print(f"      ⚠️ Could not get full description: {str(e)}")
-                                        description = short_description
-                                    
-                                    if title and company:
-                                        job_data = {
-                                            'job_id': self.generate_job_id(title, company, 'SimplyHired'),
-                                            'title': self.clean_text(title),
-                                            'company': self.clean_text(company),
-                                            'location': self.clean_text(job_location),
-                                            'job_type': 'Full-time',
-                                            'description': self.clean_text(description),
-                                            'url': job_url,
-                                            'posted_date': posted_date,
-                                            'salary': self.clean_text(salary),
-                                            'source': 'SimplyHired',
-                                            'fetched_at': datetime.now().isoformat()
-                                        }
-                                        self.jobs.append(job_data)
-                                    
-                                    # Small delay between jobs
-                                    await asyncio.sleep(random.uniform(0.5, 1))
-                                                    
-                                except Exception as e:
-                                    print(f"      ❌ Error: {str(e)}")
-                                    continue
-                            
-                            print(f"  ✅ Extracted {len(job_cards)} jobs from page {page_num}")
-                            logging.info(f"SimplyHired: Extracted {len(job_cards)} jobs from page {page_num}")
-                            
-                            if page_num < max_pages:
-                                next_button = await page.query_selector('a[data-testid="pageNumberBlockNext"]')
-                                if not next_button:
-                                    next_button = await page.query_selector('a.chakra-link.css-16mmgjw')
-                                
-                                if next_button:
-                                    print(f"  ⏭️ Clicking next page...")
-                                    await next_button.click()
-                                    await asyncio.sleep(random.uniform(3, 5))
-                                else:
-                                    print(f"  ⏹️ No more pages available")
-                                    break
-                            
-                        except Exception as e:
-                            print(f"  ❌ Error on page {page_num}: {str(e)}")
-                            break
-                    
-                    await page.close()
-                    
-                except Exception as e:
-                    print(f"  ❌ Error searching '{keyword}': {str(e)}")
+                    stored[key] = datetime.fromisoformat(job['posted_date'].replace('Z', ''))
+                except Exception:
+                    stored[key] = None
+        except FileNotFoundError:
+            log.info("📄 No existing file found (%s), keeping all jobs", filename)
+        except Exception as e:
+            log.warning("⚠️ Error loading existing jobs: %s", e)
+        
+        removed = 0
+        async for job in jobs:
+            key = job_key(job)
+            if key in stored:
+                try:
+                    new_date = datetime.fromisoformat(job['posted_date'].replace('Z', ''))
+                    repost = stored[key] is not None and (new_date - stored[key]).total_seconds() >= 24 * 3600
+                except Exception:
+                    repost = False
+                if not repost:
+                    removed += 1
                     continue
-            
-            await browser.close()
+                job_log.info("♻️ Repost detected: %.40s... at %.20s...", job['title'], job['company'])
+            yield job
+        log.info("🔄 Compared with existing jobs: Removed %d already-scraped jobs", removed)
     
-    # ==================== GLASSDOOR SCRAPER ====================
-    async def scrape_glassdoor(self, keywords: List[str], location: str = "United States", max_loads: int = 5):
-        """Scrape Glassdoor with Show More button clicking"""
-        print("\n" + "="*60)
-        print("🔄 SCRAPING GLASSDOOR")
-        print("="*60)
+    async def save_stream(self, jobs: AsyncIterator[Dict], filename: str = 'jobs_output.json') -> Dict[str, int]:
+        """
+        Streaming save_to_json: each job is appended to a spool file as it
+        arrives and merged into `filename` at the end (only the newest job per
+        title + company is kept). Returns the number of new jobs per source.
         
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=self.headless,
-                args=[
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-dev-shm-usage',
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox',
-                    '--disable-web-security',
-                    '--disable-features=IsolateOrigins,site-per-process',
-                ]
-            )
+        When the run fails the spool is kept, and the next save_stream (the
+        resumed run) merges its jobs too.
+        """
+        spool_path = f"{filename}.spool"
+        newest = {}  # unique key -> spool line number of its newest job
+        sources = {}
+        # A spool left by a run that failed before merging holds jobs its
+        # checkpoint already counts as scraped: they are merged with this run's
+        count = 0  # spool lines
+        last_line = '\n'
+        try:
+            with open(spool_path, 'r', encoding='utf-8') as spool:
+                for last_line in spool:
+                    try:
+                        newest[job_key(json.loads(last_line))] = count
+                    except ValueError:
+                        pass  # Line cut off by a crash
+                    count += 1
+            log.info("↩️ Merging %d jobs spooled by an interrupted run", len(newest))
+        except FileNotFoundError:
+            pass
+        
+        with open(spool_path, 'a', encoding='utf-8') as spool:
+            if not last_line.endswith('\n'):
+                spool.write('\n')  # Keep a cut-off line (already counted) on its own
+            try:
+                async for job in jobs:
+                    newest[job_key(job)] = count
+                    spool.write(json.dumps(job, ensure_ascii=False) + '\n')
+                    spool.flush()  # Written before the checkpoint moves past its page
+                    count += 1
+            except BaseException:
+                log.warning("⚠️ Scrape stopped before saving; %d spooled jobs are kept in %s for the next run",
+                            count, spool_path)
+                raise
+        
+        keep = set(newest.values())
+        new_jobs = []
+        with open(spool_path, 'r', encoding='utf-8') as spool:
+            for line_no, line in enumerate(spool):
+                if line_no in keep:
+                    job = json.loads(line)
+                    sources[job.get('source', 'Unknown')] = sources.get(job.get('source', 'Unknown'), 0) + 1
+                    new_jobs.append(job)
+        
+        # save_to_json merges with the stored jobs; self.jobs is restored afterwards
+        previous, self.jobs = self.jobs, new_jobs
+        try:
+            self.save_to_json(filename)
+        finally:
+            self.jobs = previous
+        os.remove(spool_path)  # Only once everything is merged into `filename`
+        return sources
+    
+    async def _read_results_page(self, page: Page, platform: str) -> Tuple[List[Dict], Dict[int, Optional[str]]]:
+        """
+        Wait for the rendered result cards and read them all in one round-trip
+        -> (raw cards, pagination.linked_pages of the page)
+        """
+        # Cards are rendered once their count stops changing
+        await wait_for_stable_count(page, CARD_SPECS[platform]['card'], timeout=30000)
+        if platform == 'SimplyHired':
+            await self._close_simplyhired_popup(page)
+        
+        # The embedded state blob is only written on a full page load, so after
+        # client-side pagination it still describes page 1: use it only when its
+        # first job matches the first rendered card
+        html = await page.content()
+        links = linked_pages(html, platform)
+        state_cards = extract_state_cards(html, platform)
+        if state_cards:
+            first_title = await read_text(page, CARD_SPECS[platform]['fields']['title'][0]['selector'])
+            if first_title and state_cards[0].get('title') == first_title:
+                return state_cards, links
+        return await extract_cards(page, platform), links
+    
+    async def _go_to_next_page(self, page: Page, platform: str, page_num: int) -> bool:
+        """Move the browser page to the next results page; False when there is none"""
+        if platform == 'SimplyHired':
+            return await self._next_simplyhired_page(page)
+        return await self._next_talent_page(page, page_num)
+    
+    def load_known_jobs(self, filename: str = 'jobs_output.json') -> int:
+        """
+        Load the unique keys (and posting dates) of already stored jobs. They
+        count as known for the incremental crawl, and the card pre-filter drops
+        them unless reposted 24h+ later (like remove_duplicates_from_existing).
+        """
+        try:
+            with open(filename, 'r', encoding='utf-8') as f:
+                content = f.read().strip()
+            existing_jobs = json.loads(content).get('jobs', []) if content else []
+        except FileNotFoundError:
+            return 0
+        except Exception as e:
+            log.warning("⚠️ Error loading known jobs: %s", e)
+            return 0
+        
+        for job in existing_jobs:
+            key = job_key(job)
+            try:
+                self.stored_jobs[key] = datetime.fromisoformat(job['posted_date'].replace('Z', ''))
+            except Exception:
+                self.stored_jobs[key] = None
+        log.info("📚 %d known jobs loaded from %s", len(existing_jobs), filename)
+        return len(existing_jobs)
+    
+    def _note_partial(self, platform: str, keyword: str, error: Exception) -> str:
+        """Record why a keyword stopped early: 'deadline', 'browser_hung' or 'error: ...'"""
+        deadline = current_deadline()
+        if isinstance(error, DeadlineExceeded):
+            reason = error.reason
+        elif deadline is not None and deadline.expired:
+            reason = deadline.reason  # e.g. the watchdog killed the browser mid-call
+        else:
+            reason = f"error: {str(error)[:200]}"
+        self.partial_reasons[f"{platform}: {keyword}"] = reason
+        return reason
+    
+    def _card_date(self, listing: Dict) -> Optional[datetime]:
+        """Posting time of a listing card (exact timestamp or parsed relative date)"""
+        try:
+            return datetime.fromisoformat(listing.get('posted_at') or self.parse_posted_date(listing['date_text']))
+        except (TypeError, ValueError):
+            return None
+    
+    def _drop_reason(self, key: str, card_date: Optional[datetime], cutoff: datetime) -> Optional[str]:
+        """Why post-processing would drop this card: 'stale', 'duplicate', 'existing' or None"""
+        if card_date is not None and card_date < cutoff:
+            return 'stale'  # filter_last_24_hours
+        if key in self.seen_cards:
+            seen_date = self.seen_cards[key]
+            # remove_duplicates keeps the more recent posting (the first one on ties)
+            if seen_date is None or card_date is None or card_date <= seen_date:
+                return 'duplicate'
+        if key in self.stored_jobs:
+            stored_date = self.stored_jobs[key]
+            # remove_duplicates_from_existing keeps reposts made 24h+ later
+            if stored_date is None or card_date is None or (card_date - stored_date).total_seconds() < 24 * 3600:
+                return 'existing'
+        return None
+    
+    def _screen_cards(self, platform: str, keyword: str, listings: List[Dict]) -> Tuple[List[Dict], bool]:
+        """
+        Card-level checks between list extraction and detail fetches
+        
+        Returns (listings to fetch details for, exhausted). With `prefilter`
+        cards that remove_duplicates / filter_last_24_hours /
+        remove_duplicates_from_existing would drop are removed before their
+        detail page is fetched. With `incremental`, exhausted is True when at
+        least `stop_fraction` of the page is known or stale.
+        """
+        if not listings or not (self.prefilter or self.incremental):
+            return listings, False
+        
+        cutoff = datetime.now() - timedelta(hours=INCREMENTAL_CUTOFF_HOURS)
+        kept = []
+        known = stale = 0
+        drops = self.prefilter_stats.setdefault(platform, {'stale': 0, 'duplicate': 0, 'existing': 0, 'fetches_saved': 0})
+        for listing in listings:
+            key = self.listing_key(listing)
+            card_date = self._card_date(listing)
+            reason = self._drop_reason(key, card_date, cutoff)
             
-            for keyword in keywords:
-                print(f"\n📌 Searching for: '{keyword}'")
-                
+            if key in self.seen_cards or key in self.stored_jobs:
+                known += 1
+            elif reason == 'stale':
+                stale += 1
+            
+            seen_date = self.seen_cards.get(key)
+            if key not in self.seen_cards or (card_date and seen_date and card_date > seen_date):
+                self.seen_cards[key] = card_date
+            
+            if self.prefilter and reason:
+                drops[reason] += 1
+                drops['fetches_saved'] += 1
+            else:
+                kept.append(listing)
+        
+        if self.prefilter and len(kept) < len(listings):
+            job_log.info("✂️ Pre-filter: %d/%d cards dropped before detail fetch",
+                         len(listings) - len(kept), len(listings))
+        
+        exhausted = self.incremental and (known + stale) / len(listings) >= self.stop_fraction
+        if exhausted:
+            stats = self.incremental_stats.setdefault(platform, {'keywords_stopped_early': 0, 'known': 0, 'stale': 0})
+            stats['keywords_stopped_early'] += 1
+            stats['known'] += known
+            stats['stale'] += stale
+            log.event(logging.INFO, 'early_stop',
+                      "⏹️ '%s': %d known + %d stale of %d cards, stopping pagination",
+                      keyword, known, stale, len(listings), platform=platform, keyword=keyword,
+                      known=known, stale=stale, cards=len(listings))
+        return kept, exhausted
+    
+    def _cached_details(self, platform: str, listings: List[Dict]) -> Dict[str, Dict]:
+        """{url: details} for listings whose description is cached and unchanged"""
+        if self.description_cache is None:
+            return {}
+        cached = {}
+        for listing in listings:
+            job_id = self.generate_job_id(listing['title'], listing['company'], platform)
+            details = self.description_cache.get(listing['url'], listing['snippet'], job_id)
+            if details is not None:
+                cached[listing['url']] = details
+        if cached:
+            job_log.info("💾 %d/%d descriptions from cache", len(cached), len(listings))
+        return cached
+    
+    def _store_details(self, platform: str, listings: List[Dict], fetched: Dict[str, Dict]):
+        """Cache the detail pages just read (one write per results page)"""
+        if self.description_cache is None:
+            return
+        for listing in listings:
+            details = fetched.get(listing['url'])
+            if details:
+                job_id = self.generate_job_id(listing['title'], listing['company'], platform)
+                self.description_cache.put(listing['url'], listing['snippet'], details, job_id)
+        self.description_cache.flush()
+    
+    def _build_job(self, platform: str, listing: Dict, full_details: Dict) -> Optional[Dict]:
+        """Combine a listing card with its detail page into the final job dict"""
+        title = listing['title']
+        posted_date_text = listing['date_text']
+        
+        if listing.get('posted_at'):
+            # Exact timestamp from the embedded page state
+            posted_date = listing['posted_at']
+        else:
+            # The SimplyHired detail view has a more accurate date
+            # (data-testid="viewJobBodyPostingTimestamp")
+            detail_date_text = full_details.get('posted_date_text')
+            if detail_date_text and len(detail_date_text) < 50:
+                posted_date_text = detail_date_text
+            posted_date = self.parse_posted_date(posted_date_text)
+        
+        short_description = listing['snippet']
+        full_description = full_details.get('full_description', '')
+        full = bool(full_description) and len(full_description) > len(short_description)
+        description = full_description if full else short_description
+        
+        if not (title and listing['company']):
+            return None
+        
+        job_log.event(logging.INFO, 'job', "%s %s: %.50s (%d chars, posted %s)",
+                      '📝' if full else '⚠️', platform, title, len(description), posted_date_text or posted_date,
+                      platform=platform, url=listing['url'], full_description=full,
+                      description_chars=len(description), date_text=posted_date_text)
+        
+        # The unique key is computed here, once, from the cleaned title and company
+        return JobRecord({
+            'job_id': self.generate_job_id(title, listing['company'], platform),
+            'title': self.clean_text(title),
+            'company': self.clean_text(listing['company']),
+            'location': self.clean_text(listing['location']),
+            'job_type': 'Full-time',
+            'description': self.clean_text(description),
+            'url': listing['url'],
+            'posted_date': posted_date,
+            'salary': self.clean_text(listing['salary']),
+            'source': platform,
+            'fetched_at': datetime.now().isoformat()
+        })
+    
+    async def _scrape_keyword(self, browsers: LazyBrowser, platform: str, keyword: str, location: str,
+                              max_pages: int, emit: Callable[[Dict], Awaitable[None]],
+                              detail_pool: DetailFetchPool):
+        """
+        Scrape all result pages of one keyword, passing each built job to `emit`
+        
+        Results pages are fetched over plain HTTP while that works; on a block
+        or a client-side-only page the keyword continues in a browser page
+        opened at the same URL.
+        
+        Later pages are addressed by URLs built from the page numbers / cursor
+        tokens a page links to (see pagination.py). Over HTTP, every planned
+        page is requested at once (paced by the rate limiter) and processed
+        in order; the browser navigates to planned URLs directly. Clicking
+        the next-page control is the fallback when no URL can be built.
+        """
+        log.info("📌 %s: searching for '%s'", platform, keyword)
+        
+        first_url = url = self.build_search_url(platform, keyword, location)
+        planned: Dict[int, str] = {}  # page number -> URL built without clicking
+        prefetched: Dict[int, asyncio.Future] = {}  # page number -> fetch_results task
+        start_page, seen_keys = 1, []
+        if self.checkpoint is not None and self.resume:
+            state = self.checkpoint.get(platform, keyword, location)
+            if state:
+                seen_keys = list(state['seen_keys'])
+                for key in seen_keys:  # Already scraped by the interrupted run
+                    self.seen_cards.setdefault(key, None)
+                if state['done']:
+                    log.info("⏭️ '%s' already finished (%d jobs), skipping", keyword, len(seen_keys))
+                    return
+                url, start_page = state['next_url'], state['page_num']
+                log.info("↩️ Resuming '%s' at page %d (%d jobs already seen)", keyword, start_page, len(seen_keys))
+        
+        page = None
+        try:
+            for page_num in range(start_page, max_pages + 1):
                 try:
-                    page = await self.setup_page_context(browser)
-                    
-                    query = keyword.replace(' ', '-')
-                    location_formatted = location.replace(' ', '-').lower()
-                    url = f"https://www.glassdoor.com/Job/{location_formatted}-{query}-jobs-SRCH_IL.0,13_IN1_KO14,31.htm?fromAge=1"
-
-                    await page.add_init_script("""
-                        Object.defineProperty(navigator, 'webdriver', {
-                            get: () => undefined
-                        });
-                        Object.defineProperty(navigator, 'plugins', {
-                            get: () => [1, 2, 3, 4, 5]
-                        });
-                        Object.defineProperty(navigator, 'languages', {
-                            get: () => ['en-US', 'en']
-                        });
-                    """)
+                    check_deadline()
+                    page_started = time.monotonic()
+                    cards, next_url, served_by = None, None, 'browser'
                     
-                    print(f"  📄 Loading: {url}")
-                    await page.goto('https://www.glassdoor.com', wait_until='networkidle', timeout=60000)
-                    await asyncio.sleep(random.uniform(3, 5))
-
-                    await page.goto(url, wait_until='networkidle', timeout=60000)
-                    await asyncio.sleep(random.uniform(6, 9))
-
-                    await page.evaluate('window.scrollTo(0, document.body.scrollHeight / 4)')
-                    await asyncio.sleep(random.uniform(1, 2))
+                    if self.http_fetcher is not None and not self._http_blocked.get(platform):
+                        try:
+                            fetch = prefetched.pop(page_num, None) or self.http_fetcher.fetch_results(
+                                url, platform, page_num)
+                            cards, next_url, links = await fetch
+                            served_by = 'http'
+                        except FetchBlocked as e:
+                            self._record_escalation(platform, e.reason)
+                            await self._cancel_prefetch(prefetched)
                     
-                    content = await page.content()
-                    if 'captcha' in content.lower() or 'blocked' in content.lower():
-                        print("  ⚠️ CAPTCHA/Block detected!")
-                        if not self.headless:
-                            print("  ⏸️  Please solve CAPTCHA manually in the browser")
-                            print("  Press Enter when done...")
-                            input()
-                            content = await page.content()
-                            if 'captcha' in content.lower() or 'blocked' in content.lower():
-                                print("  ❌ Still blocked, skipping Glassdoor")
-                                await page.close()
-                                continue
+                    if cards is None:
+                        if page is None:
+                            page = await self.setup_page_context(await browsers.get(), platform)
+                            page_log.debug("📄 Loading search results...")
+                            await self._goto_paced(page, url, CARD_SPECS[platform]['card'])
+                        # One round-trip for every card on the page
+                        cards, links = await self._read_results_page(page, platform)
+                        if cards:
+                            self.rate_limiter.success(url)
                         else:
-                            print("  ❌ Skipping Glassdoor (run with headless=False to solve CAPTCHA)")
-                            await page.close()
+                            self.rate_limiter.backoff(url, 'empty')
+                    
+                    # Request every further page this one makes addressable right away,
+                    # so they download while this page's details are fetched
+                    planned.update(plan_pages(platform, first_url, links, page_num, max_pages))
+                    if served_by == 'http':
+                        for number, page_url in planned.items():
+                            if number > page_num and number not in prefetched:
+                                prefetched[number] = asyncio.ensure_future(
+                                    self.http_fetcher.fetch_results(page_url, platform, number))
+                    
+                    self._backend_stats(platform)[f'search_{served_by}'] += 1
+                    loaded_s = time.monotonic() - page_started
+                    
+                    # Read the listing first, then fetch all detail pages through the pool
+                    listings = []
+                    for card in cards:
+                        listing = normalise_card(card, platform, location, self.base_urls[platform])
+                        if listing is None:
                             continue
+                        if not (listing['posted_at'] or listing['date_text']):
+                            listing['date_text'] = "just posted"  # No date element
+                        listings.append(listing)
+                    read = len(listings)
+                    page_keys = [self.listing_key(listing) for listing in listings]
                     
-                    loads = 0
-                    while loads < max_loads:
-                        loads += 1
-                        
-                        try:
-                            await page.wait_for_selector('li[data-test="jobListing"]', timeout=1800000)
-                            await asyncio.sleep(2)
-                        except:
-                            print(f"  ⚠️ No job listings found")
-                            break
-                        
-                        job_cards = await page.query_selector_all('li[data-test="jobListing"]')
-                        print(f"  📄 Load {loads}: Found {len(job_cards)} total jobs")
-                        
-                        for card in job_cards:
-                            try:
-                                data_jobid = await card.get_attribute('data-jobid')
-                                if any(job.get('job_id', '').endswith(data_jobid or '') for job in self.jobs):
-                                    continue
-                                
-                                title_elem = await card.query_selector('a[data-test="job-title"]')
-                                if not title_elem:
-                                    title_elem = await card.query_selector('a.JobCard_jobTitle__GLyJ1')
-                                title = await title_elem.inner_text() if title_elem else None
-                                job_url = await title_elem.get_attribute('href') if title_elem else None
-                                
-                                if job_url and not job_url.startswith('http'):
-                                    job_url = f"https://www.glassdoor.com{job_url}"
-                                
-                                if not title:
-                                    continue
-                                
-                                company_elem = await card.query_selector('span[data-test="employer-name"]')
-                                if not company_elem:
-                                    company_elem = await card.query_selector('div.EmployerProfile_profileContainer__28h9t span')
-                                company = await company_elem.inner_text() if company_elem else "Unknown"
-                                
-                                location_elem = await card.query_selector('div[data-test="emp-location"]')
-                                if not location_elem:
-                                    location_elem = await card.query_selector('div.JobCard_location__Ds1fM')
-                                job_location = await location_elem.inner_text() if location_elem else location
-                                
-                                salary_elem = await card.query_selector('div[data-test="detailSalary"]')
-                                if not salary_elem:
-                                    salary_elem = await card.query_selector('div.JobCard_salaryEstimate__OpbTW')
-                                salary = await salary_elem.inner_text() if salary_elem else "Not specified"
-                                
-                                desc_elem = await card.query_selector('div[data-test="descSnippet"]')
-                                if not desc_elem:
-                                    desc_elem = await card.query_selector('div.JobCard_jobDescriptionSnippet__l1tnl')
-                                description = await desc_elem.inner_text() if desc_elem else ""
-                                
-                                if title and company:
-                                    job_data = {
-                                        'job_id': self.generate_job_id(title, company, f'Glassdoor-{data_jobid}'),
-                                        'title': self.clean_text(title),
-                                        'company': self.clean_text(company),
-                                        'location': self.clean_text(job_location),
-                                        'job_type': 'Full-time',
-                                        'description': self.clean_text(description),
-                                        'url': job_url,
-                                        'posted_date': datetime.now().isoformat(),
-                                        'salary': self.clean_text(salary),
-                                        'source': 'Glassdoor',
-                                        'fetched_at': datetime.now().isoformat()
-                                    }
-                                    self.jobs.append(job_data)
-                            
-                            except Exception as e:
-                                continue
-                        
-                        if loads < max_loads:
-                            try:
-                                show_more = await page.query_selector('button:has-text("Show more jobs")')
-                                if not show_more:
-                                    show_more = await page.query_selector('button.button_Button__o_a9q')
-                                
-                                if show_more:
-                                    is_visible = await show_more.is_visible()
-                                    if is_visible:
-                                        print(f"  ⏬ Clicking 'Show more jobs'...")
-                                        await show_more.click()
-                                        await asyncio.sleep(random.uniform(3, 5))
-                                    else:
-                                        print(f"  ⏹️ No more jobs to load")
-                                        break
-                                else:
-                                    print(f"  ⏹️ Show more button not found")
-                                    break
-                            except Exception as e:
-                                print(f"  ⚠️ Could not load more jobs: {str(e)}")
-                                break
+                    # Drop cards post-processing would discard; deeper pages will
+                    # only hold more of what this one has once it is mostly known
+                    listings, exhausted = self._screen_cards(platform, keyword, listings)
                     
-                    print(f"  ✅ Total extracted: {loads} loads")
-                    logging.info(f"Glassdoor: Extracted jobs from {loads} loads")
-                    await page.close()
-                    await asyncio.sleep(random.uniform(5, 8))
+                    # Descriptions cached by an earlier run need no detail page
+                    details = self._cached_details(platform, listings)
                     
-                except Exception as e:
-                    print(f"  ❌ Error: {str(e)}")
-                    continue
-            
-            await browser.close()
-    
-    # ==================== TALENT.COM SCRAPER ====================
-    async def scrape_talent(self, keywords: List[str], location: str = "USA", max_pages: int = 5):
-        """Scrape Talent.com with FULL descriptions (opens new tab)"""
-        print("\n" + "="*60)
-        print("🔄 SCRAPING TALENT.COM (WITH FULL DESCRIPTIONS)")
-        print("="*60)
-        
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=self.headless)
-            
-            for keyword in keywords:
-                print(f"\n📌 Searching for: '{keyword}'")
-                
-                try:
-                    page = await self.setup_page_context(browser)
+                    # NOW FETCH FULL DESCRIPTIONS IN PARALLEL TABS
+                    details_started = time.monotonic()
+                    to_fetch = [listing for listing in listings if listing['url'] not in details]
+                    cached = len(details)
+                    fetched = await detail_pool.fetch_all([listing['url'] for listing in to_fetch])
+                    self._store_details(platform, to_fetch, fetched)
+                    details.update(fetched)
+                    details_s = time.monotonic() - details_started
                     
-                    query = keyword.replace(' ', '-')
-                    url = f"https://www.talent.com/jobs?k={query}&l={location}&date=1"
+                    built = 0
+                    for listing in listings:
+                        job_data = self._build_job(platform, listing, details.get(listing['url']) or {})
+                        if job_data:
+                            built += 1
+                            await emit(job_data)
                     
-                    print(f"  📄 Loading search results...")
-                    await page.goto(url, wait_until='networkidle', timeout=60000)
-                    await asyncio.sleep(random.uniform(4, 6))
+                    total_s = time.monotonic() - page_started
+                    page_log.event(logging.INFO, 'page', "✅ %s '%s' page %d: %d cards, %d jobs (%s, %.1fs)",
+                                   platform, keyword, page_num, len(cards), built, served_by, total_s,
+                                   platform=platform, keyword=keyword, page=page_num, served_by=served_by,
+                                   cards=len(cards), screened_out=read - len(listings), cached=cached,
+                                   fetched=sum(1 for d in fetched.values() if d and d.get('full_description')),
+                                   jobs=built, load_s=round(loaded_s, 3), details_s=round(details_s, 3),
+                                   total_s=round(total_s, 3))
                     
-                    for page_num in range(1, max_pages + 1):
-                        try:
-                            await page.wait_for_selector('section[data-testid^="jobcard-container"]', timeout=1800000)
-                            await asyncio.sleep(2)
-                            
-                            job_cards = await page.query_selector_all('section[data-testid^="jobcard-container"]')
-                            print(f"  📄 Page {page_num}: Found {len(job_cards)} jobs")
-                            
-                            for idx, card in enumerate(job_cards):
-                                try:
-                                    title_elem = await card.query_selector('h2[color="#30183F"]')
-                                    if not title_elem:
-                                        title_elem = await card.query_selector('h2.sc-fcd630a4-20')
-                                    title = await title_elem.inner_text() if title_elem else None
-
-                                    link_elem = await card.query_selector('a[href*="/view?id="]')
-                                    if not link_elem:
-                                        link_elem = await card.query_selector('a.sc-d93925ca-5')
-                                    job_url = await link_elem.get_attribute('href') if link_elem else None
-
-                                    if job_url and not job_url.startswith('http'):
-                                        job_url = f"https://www.talent.com{job_url}"
-
-                                    if not title or not job_url:
-                                        continue
-                                    
-                                    company_elem = await card.query_selector('span[color="#691F74"]')
-                                    if not company_elem:
-                                        company_elem = await card.query_selector('span.sc-fcd630a4-12')
-                                    company = await company_elem.inner_text() if company_elem else "Unknown"
-
-                                    location_elem = await card.query_selector('span[color="#222222"]')
-                                    if not location_elem:
-                                        location_elem = await card.query_selector('span.sc-fcd630a4-11')
-                                    job_location = await location_elem.inner_text() if location_elem else location
-
-                                    # FIXED: Talent.com date is in a specific span with class pattern
-                                    # Looking for the "Last updated: X day ago" text in the card header
-                                    date_elem = None
-                                    try:
-                                        # Try multiple selectors for the date element
-                                        # The date is usually in a span near the top of the card
-                                        date_elem = await card.query_selector('span.sc-fcd630a4-5:has-text("ago")')
-                                        if not date_elem:
-                                            date_elem = await card.query_selector('span.sc-fcd630a4-6:has-text("ago")')
-                                        if not date_elem:
-                                            # Try to find any span containing "day ago" or "hour ago"
-                                            all_spans = await card.query_selector_all('span')
-                                            for span in all_spans:
-                                                span_text = await span.inner_text()
-                                                if 'ago' in span_text.lower() or 'day' in span_text.lower() or 'hour' in span_text.lower():
-                                                    # Check if it's actually a date (short text)
-                                                    if len(span_text) < 50:  # Date text should be short
-                                                        date_elem = span
-                                                        break
-                                    except:
-                                        pass
-                                    
-                                    posted_date_text = await date_elem.inner_text() if date_elem else None
-                                    
-                                    # Debug: Print what we extracted
-                                    if posted_date_text:
-                                        print(f"      📅 Date text found: '{posted_date_text}'")
-                                    else:
-                                        print(f"      ⚠️ No date element found, using default (just posted)")
-                                        posted_date_text = "just posted"
-                                    
-                                    posted_date = self.parse_posted_date(posted_date_text)
-
-                                    salary = "Not specified"
-                                    all_text = await card.inner_text()
-                                    if "$" in all_text:
-                                        salary_match = re.search(r'\$[\d,]+(?:\s*-\s*\$[\d,]+)?(?:\s*(?:per|/)\s*(?:hour|year|annum))?', all_text)
-                                        if salary_match:
-                                            salary = salary_match.group(0)
-
-                                    # SHORT description from listing (as fallback)
-                                    desc_elem = await card.query_selector('span[class*="sc-fcd630a4-5"]')
-                                    short_description = await desc_elem.inner_text() if desc_elem else ""
-                                    short_description = short_description.split("Show more")[0].strip()
-
-                                    # NOW OPEN NEW TAB TO GET FULL DESCRIPTION
-                                    print(f"    📝 Job {idx + 1}: {title[:50]}...")
-                                    
-                                    try:
-                                        full_details = await self.extract_talent_description(page, job_url)
-                                        
-                                        if full_details and full_details['full_description'] and len(full_details['full_description']) > len(short_description):
-                                            description = full_details['full_description']
-                                            print(f"      ✅ Got full description ({len(description)} chars)")
-                                        else:
-                                            description = short_description
-                                            print(f"      ⚠️ Using short description ({len(short_description)} chars)")
-                                    
-                                    except Exception as e:
-                                        print(f"      ⚠️ Could not get full description: {str(e)}")
-                                        description = short_description
-
-                                    if title and company:
-                                        job_data = {
-                                            'job_id': self.generate_job_id(title, company, 'Talent'),
-                                            'title': self.clean_text(title),
-                                            'company': self.clean_text(company),
-                                            'location': self.clean_text(job_location),
-                                            'job_type': 'Full-time',
-                                            'description': self.clean_text(description),
-                                            'url': job_url,
-                                            'posted_date': posted_date,
-                                            'salary': self.clean_text(salary),
-                                            'source': 'Talent.com',
-                                            'fetched_at': datetime.now().isoformat()
-                                        }
-                                        self.jobs.append(job_data)
-                                    
-                                    # Small delay between jobs
-                                    await asyncio.sleep(random.uniform(1, 2))
-
-                                except Exception as e:
-                                    print(f"      ❌ Error: {str(e)}")
-                                    continue
-                            
-                            print(f"  ✅ Extracted {len(job_cards)} jobs from page {page_num}")
-                            logging.info(f"Talent.com: Extracted {len(job_cards)} jobs from page {page_num}")
-                            
-                            if page_num < max_pages:
-                                # Look for next page link in pagination nav
-                                next_button = None
-                                pagination = await page.query_selector('nav.sc-5ec0130d-0')
-                                if not pagination:
-                                    pagination = await page.query_selector('nav[class*="eRQgGg"]')
-
-                                if pagination:
-                                    # Find the link with title="2", "3", etc. or the next arrow
-                                    all_links = await pagination.query_selector_all('a')
-                                    for link in all_links:
-                                        title_attr = await link.get_attribute('title')
-                                        if title_attr and title_attr.isdigit() and int(title_attr) == page_num + 1:
-                                            next_button = link
-                                            break
-                                        
-                                    # If not found, look for arrow/svg indicating next
-                                    if not next_button:
-                                        for link in all_links:
-                                            svg = await link.query_selector('svg')
-                                            if svg:
-                                                # Check if it's the "next" arrow (usually the last one)
-                                                next_button = link
-                                                break
-                                
-                                if next_button:
-                                    print(f"  ⏭️ Clicking next page...")
-                                    
-                                    # Get the href and clean it
-                                    href = await next_button.get_attribute('href')
-                                    if href and 'showSignInModal=true' in href:
-                                        # Remove the popup trigger
-                                        href = href.replace('&showSignInModal=true', '').replace('showSignInModal=true&', '')
-                                        await page.goto(f"https://www.talent.com{href}", wait_until='networkidle', timeout=60000)
-                                    else:
-                                        await next_button.click()
-                                    
-                                    await asyncio.sleep(random.uniform(3, 5))
-                                else:
-                                    print(f"  ⏹️ No more pages available")
-                                    break
-                            
-                        except Exception as e:
-                            print(f"  ❌ Error on page {page_num}: {str(e)}")
-                            break
+                    done = exhausted or page_num >= max_pages
+                    if not done:
+                        stats = self._backend_stats(platform)
+                        if page_num + 1 in planned:
+                            url = planned[page_num + 1]
+                            stats['pages_direct'] += 1
+                            if served_by == 'browser':
+                                await self._goto_paced(page, url, CARD_SPECS[platform]['card'])
+                        elif served_by == 'http':
+                            if next_url:
+                                url = next_url  # Paced by the fetcher's rate limiter
+                            else:
+                                done = True
+                        elif await self._go_to_next_page(page, platform, page_num):
+                            url = page.url
+                            stats['pages_clicked'] += 1
+                        else:
+                            done = True
+                        if done:
+                            log.info("⏹️ '%s': no more pages available", keyword)
                     
-                    await page.close()
+                    # A resumed run continues at the next page; the update is applied
+                    # once the consumer has taken this page's jobs (see stream_jobs)
+                    if self.checkpoint is not None:
+                        await emit(partial(self.checkpoint.update, platform, keyword, location, url,
+                                           page_num + 1, page_keys, done))
+                    if done:
+                        break
                     
                 except Exception as e:
-                    print(f"  ❌ Error searching '{keyword}': {str(e)}")
-                    continue
+                    reason = self._note_partial(platform, keyword, e)
+                    log.error("❌ %s '%s': error on page %d: %s", platform, keyword, page_num, reason)
+                    break
             
-            await browser.close()
+        except Exception as e:
+            self._note_partial(platform, keyword, e)
+            log.error("❌ %s: error searching '%s': %s", platform, keyword, e)
+        finally:
+            # Pages beyond an early stop or an error are not needed any more
+            await self._cancel_prefetch(prefetched)
+            if page:
+                await self.close_page_context(page)
+        
+        if self.checkpoint is not None:
+            await emit(self.checkpoint.save)  # One write per keyword, after its last update
+    
+    @staticmethod
+    async def _cancel_prefetch(prefetched: Dict[int, asyncio.Future]):
+        for task in prefetched.values():
+            task.cancel()
+        await asyncio.gather(*prefetched.values(), return_exceptions=True)
+        prefetched.clear()
     
+    # ==================== SIMPLYHIRED SCRAPER ====================
+    async def scrape_simplyhired(self, keywords: List[str], location: str = "USA", max_pages: int = 5,
+                                 concurrency: Optional[int] = None):
+        """
+        Scrape SimplyHired with FULL descriptions from the job view pages
+        
+        Args:
+            keywords: List of search keywords
+            location: Job location
+            max_pages: Pages per keyword
+            concurrency: Keywords searched at once (defaults to self.keyword_concurrency)
+        """
+        log.info("🔄 SCRAPING SIMPLYHIRED (WITH FULL DESCRIPTIONS)")
+        
+        # Jobs land in self.jobs as they arrive, so a caller timeout keeps partial results
+        async for job in self.stream_jobs(keywords, location, max_pages, ['SimplyHired'], concurrency):
+            self.jobs.append(job)
+    
+    async def _close_simplyhired_popup(self, page: Page):
+        """CLOSE POPUP IF IT APPEARS"""
+        try:
+            close_button = await page.query_selector('button[data-testid="cta-closeModal"]')
+            if not close_button:
+                close_button = await page.query_selector('div[class*="sc-4e5e0f9c-0"] button')
+
+            if close_button:
+                is_visible = await close_button.is_visible()
+                if is_visible:
+                    page_log.debug("🚫 Closing popup...")
+                    await close_button.click()
+                    await wait_until_hidden(close_button)
+        except Exception:
+            pass
+    
+    async def _goto_paced(self, page: Page, url: str, selector: str, timeout: float = 60000):
+        """
+        goto_ready in the domain's rate-limiter slot; a page that never shows
+        `selector` because it is a bot wall or empty makes the domain back off
+        """
+        await self.rate_limiter.acquire(url)
+        try:
+            await goto_ready(page, url, selector, timeout=timeout)
+        except PlaywrightTimeoutError:
+            try:
+                reason = detect_block(200, await page.content()) or 'empty'
+            except Exception:
+                reason = 'empty'
+            self.rate_limiter.backoff(url, reason)
+            raise
+    
+    async def _next_simplyhired_page(self, page: Page) -> bool:
+        """Click SimplyHired's next-page link; False when there is none"""
+        next_button = await page.query_selector('a[data-testid="pageNumberBlockNext"]')
+        if not next_button:
+            next_button = await page.query_selector('a.chakra-link.css-16mmgjw')
+        
+        if not next_button:
+            return False
+        
+        page_log.debug("⏭️ Clicking next page...")
+        first_title = await read_text(page, 'h2[data-testid="searchSerpJobTitle"]')
+        await self.rate_limiter.acquire(page.url)
+        await next_button.click()
+        # Next page is rendered client-side: wait for the first card to change
+        await wait_for_text_change(page, 'h2[data-testid="searchSerpJobTitle"]', first_title)
+        return True
+    
+    # ==================== GLASSDOOR SCRAPER ====================
+    async def scrape_glassdoor(self, keywords: List[str], location: str = "United States", max_loads: int = 5,
+                               concurrency: Optional[int] = None):
+        """
+        Scrape Glassdoor with Show More button clicking
+        
+        Args:
+            keywords: List of search keywords
+            location: Job location
+            max_loads: Results loads per keyword (the first one plus 'Show more jobs' clicks)
+            concurrency: Keywords searched at once (defaults to self.keyword_concurrency)
+        """
+        log.info("🔄 SCRAPING GLASSDOOR")
+        
+        # Jobs land in self.jobs as they arrive, so a caller timeout keeps partial results
+        async for job in self.stream_jobs(keywords, location, max_loads, ['Glassdoor'], concurrency):
+            self.jobs.append(job)
+    
+    async def _glassdoor_unblocked(self, page: Page, url: str) -> bool:
+        """
+        Wait for the listings or a bot wall, whichever renders first (selector
+        checks, no full-HTML scan). In a visible browser the user gets two
+        minutes to solve a CAPTCHA; False when the page stays blocked.
+        """
+        spec = CARD_SPECS['Glassdoor']
+        await page.wait_for_selector(f"{spec['card']}, {spec['block']}", state='attached', timeout=cap_ms(60000))
+        if await page.query_selector(spec['block']) is None:
+            return True
+        
+        log.warning("⚠️ Glassdoor: CAPTCHA/Block detected!")
+        self.rate_limiter.backoff(url, 'captcha')
+        if self.headless:
+            log.error("❌ Skipping Glassdoor (run with headless=False to solve CAPTCHA)")
+            return False
+        
+        log.warning("⏸️  Please solve CAPTCHA manually in the browser (waiting up to 2 minutes)...")
+        try:
+            await page.wait_for_selector(spec['card'], state='attached', timeout=cap_ms(120000))
+            return True
+        except PlaywrightTimeoutError:
+            log.error("❌ Still blocked, skipping Glassdoor")
+            return False
+    
+    async def _scrape_glassdoor_keyword(self, browsers: LazyBrowser, keyword: str, location: str,
+                                        max_loads: int, emit: Callable[[Dict], Awaitable[None]]):
+        """
+        Scrape one Glassdoor search, passing each built job to `emit`
+        
+        The results list grows in place with every 'Show more jobs' click, so
+        only the listings past the index watermark (those appended since the
+        last load) are read and built. Descriptions are the card snippets.
+        """
+        log.info("📌 Glassdoor: searching for '%s'", keyword)
+        spec = CARD_SPECS['Glassdoor']
+        url = self.build_search_url('Glassdoor', keyword, location)
+        
+        page = None
+        try:
+            page = await self.setup_page_context(await browsers.get(), 'Glassdoor')
+            await page.add_init_script("""
+                Object.defineProperty(navigator, 'webdriver', {
+                    get: () => undefined
+                });
+                Object.defineProperty(navigator, 'plugins', {
+                    get: () => [1, 2, 3, 4, 5]
+                });
+                Object.defineProperty(navigator, 'languages', {
+                    get: () => ['en-US', 'en']
+                });
+            """)
+            
+            page_log.debug("📄 Loading: %s", url)
+            # The home page first, for the session cookies the search expects
+            home = self.base_urls['Glassdoor']
+            await self.rate_limiter.acquire(home)
+            await page.goto(home, wait_until='domcontentloaded', timeout=cap_ms(60000))
+            await self.rate_limiter.acquire(url)
+            await page.goto(url, wait_until='domcontentloaded', timeout=cap_ms(60000))
+            
+            if not await self._glassdoor_unblocked(page, url):
+                self.partial_reasons[f"Glassdoor: {keyword}"] = 'blocked'
+                return
+            
+            read = 0  # Watermark: listings before this index were already read
+            seen_ids = set()
+            for load in range(1, max_loads + 1):
+                check_deadline()
+                load_started = time.monotonic()
+                try:
+                    # Until the newly loaded listings have rendered
+                    await wait_for_stable_count(page, spec['card'], timeout=30000, min_count=read + 1)
+                except PlaywrightTimeoutError:
+                    if read:
+                        log.info("⏹️ '%s': no more job listings loaded", keyword)
+                    else:
+                        log.warning("⚠️ Glassdoor '%s': no job listings found", keyword)
+                        self.rate_limiter.backoff(url, 'empty')
+                    break
+                self.rate_limiter.success(url)
+                
+                cards = await extract_cards(page, 'Glassdoor', start=read)
+                read += len(cards)
+                
+                listings = []
+                for card in cards:
+                    listing = normalise_card(card, 'Glassdoor', location, self.base_urls['Glassdoor'])
+                    if listing is None or listing['listing_id'] in seen_ids:
+                        continue
+                    seen_ids.add(listing['listing_id'])
+                    listing['date_text'] = listing['date_text'] or "just posted"
+                    listings.append(listing)
+                unique = len(listings)
+                listings, exhausted = self._screen_cards('Glassdoor', keyword, listings)
+                
+                built = 0
+                for listing in listings:
+                    job_data = self._build_job('Glassdoor', listing, {})
+                    if job_data:
+                        built += 1
+                        await emit(job_data)
+                
+                total_s = time.monotonic() - load_started
+                page_log.event(logging.INFO, 'page', "✅ Glassdoor '%s' load %d: %d new cards, %d jobs (%d total, %.1fs)",
+                               keyword, load, len(cards), built, read, total_s,
+                               platform='Glassdoor', keyword=keyword, page=load, served_by='browser',
+                               cards=len(cards), screened_out=unique - len(listings), cached=0, fetched=0,
+                               jobs=built, total_s=round(total_s, 3))
+                
+                if load == max_loads or exhausted:
+                    break
+                show_more = None
+                for selector in spec['load_more']:
+                    show_more = await page.query_selector(selector)
+                    if show_more:
+                        break
+                if not show_more or not await show_more.is_visible():
+                    log.info("⏹️ '%s': no more jobs to load", keyword)
+                    break
+                page_log.debug("⏬ Clicking 'Show more jobs'...")
+                await self.rate_limiter.acquire(url)
+                await show_more.click()
+            
+            log.info("✅ Glassdoor '%s': %d jobs extracted", keyword, read)
+        
+        except Exception as e:
+            self._note_partial('Glassdoor', keyword, e)
+            log.error("❌ Glassdoor: error searching '%s': %s", keyword, e)
+        finally:
+            if page:
+                await self.close_page_context(page)
+    
+    # ==================== TALENT.COM SCRAPER ====================
+    async def scrape_talent(self, keywords: List[str], location: str = "USA", max_pages: int = 5,
+                            concurrency: Optional[int] = None):
+        """
+        Scrape Talent.com with FULL descriptions (detail pages in pooled tabs)
+        
+        Args:
+            keywords: List of search keywords
+            location: Job location
+            max_pages: Pages per keyword
+            concurrency: Keywords searched at once (defaults to self.keyword_concurrency)
+        """
+        log.info("🔄 SCRAPING TALENT.COM (WITH FULL DESCRIPTIONS)")
+        
+        # Jobs land in self.jobs as they arrive, so a caller timeout keeps partial results
+        async for job in self.stream_jobs(keywords, location, max_pages, ['Talent.com'], concurrency):
+            self.jobs.append(job)
+    
+    async def _next_talent_page(self, page: Page, page_num: int) -> bool:
+        """Follow Talent.com's pagination nav to page_num + 1; False when there is none"""
+        # Look for next page link in pagination nav
+        next_button = None
+        pagination = await page.query_selector('nav.sc-5ec0130d-0')
+        if not pagination:
+            pagination = await page.query_selector('nav[class*="eRQgGg"]')
+
+        if pagination:
+            # Find the link with title="2", "3", etc. or the next arrow
+            all_links = await pagination.query_selector_all('a')
+            for link in all_links:
+                title_attr = await link.get_attribute('title')
+                if title_attr and title_attr.isdigit() and int(title_attr) == page_num + 1:
+                    next_button = link
+                    break
+                
+            # If not found, look for arrow/svg indicating next
+            if not next_button:
+                for link in all_links:
+                    svg = await link.query_selector('svg')
+                    if svg:
+                        # Check if it's the "next" arrow (usually the last one)
+                        next_button = link
+                        break
+        
+        if not next_button:
+            return False
+        
+        page_log.debug("⏭️ Clicking next page...")
+        
+        # Get the href and clean it
+        href = await next_button.get_attribute('href')
+        if href and 'showSignInModal=true' in href:
+            # Remove the popup trigger
+            href = href.replace('&showSignInModal=true', '').replace('showSignInModal=true&', '')
+            await self._goto_paced(page, f"{self.base_urls['Talent.com']}{href}",
+                                   'section[data-testid^="jobcard-container"]')
+        else:
+            first_title = await read_text(page, 'section[data-testid^="jobcard-container"] h2')
+            await self.rate_limiter.acquire(page.url)
+            await next_button.click()
+            await wait_for_text_change(page, 'section[data-testid^="jobcard-container"] h2', first_title)
+        
+        return True
+
     # ==================== UTILITY METHODS ====================
     def remove_duplicates(self):
         """Remove duplicate jobs based on company + title, keep most recent"""
         unique_jobs = {}
 
-        for job in self.jobs:
-            # Create unique key from company + title
-            key = self.generate_unique_key(job.get('title', ''), job.get('company', ''))
+        for job, key in zip(self.jobs, unique_keys(self.jobs)):
 
             if key not in unique_jobs:
                 # First occurrence - add it
@@ -894,7 +1531,7 @@ class JobScraper:
                 
         removed = len(self.jobs) - len(unique_jobs)
         self.jobs = list(unique_jobs.values())
-        print(f"\n🗑️  Removed {removed} duplicate jobs (same title + company)")
+        log.info("🗑️  Removed %d duplicate jobs (same title + company)", removed)
 
     def remove_duplicates_from_existing(self, filename: str = 'jobs_output.json'):
         """Remove jobs that already exist in the output file (unless reposted after 24h)"""
@@ -908,13 +1545,12 @@ class JobScraper:
                     existing_jobs = data.get('jobs', [])
             
             if not existing_jobs:
-                print(f"📄 No existing jobs found in {filename}")
+                log.info("📄 No existing jobs found in %s", filename)
                 return
             
             # Create lookup dict: key -> (job, posted_date)
             existing_lookup = {}
-            for job in existing_jobs:
-                key = self.generate_unique_key(job.get('title', ''), job.get('company', ''))
+            for job, key in zip(existing_jobs, unique_keys(existing_jobs)):
                 try:
                     posted_date = datetime.fromisoformat(job['posted_date'].replace('Z', ''))
                     existing_lookup[key] = (job, posted_date)
@@ -925,9 +1561,7 @@ class JobScraper:
             filtered_jobs = []
             removed_count = 0
             
-            for job in self.jobs:
-                key = self.generate_unique_key(job.get('title', ''), job.get('company', ''))
-                
+            for job, key in zip(self.jobs, unique_keys(self.jobs)):
                 if key not in existing_lookup:
                     # Completely new job
                     filtered_jobs.append(job)
@@ -944,7 +1578,7 @@ class JobScraper:
                             if time_diff.total_seconds() >= 24 * 3600:  # 24 hours
                                 # Reposted after 24h - keep it
                                 filtered_jobs.append(job)
-                                print(f"  ♻️ Repost detected: {job['title'][:40]}... at {job['company'][:20]}...")
+                                job_log.info("♻️ Repost detected: %.40s... at %.20s...", job['title'], job['company'])
                             else:
                                 # Same job within 24h - skip
                                 removed_count += 1
@@ -952,17 +1586,17 @@ class JobScraper:
                             # Can't determine date - skip to be safe
                             removed_count += 1
                             
-                    except Exception as e:
+                    except Exception:
                         # Date parsing error - skip this job
                         removed_count += 1
             
             self.jobs = filtered_jobs
-            print(f"🔄 Compared with existing jobs: Removed {removed_count} already-scraped jobs")
+            log.info("🔄 Compared with existing jobs: Removed %d already-scraped jobs", removed_count)
             
         except FileNotFoundError:
-            print(f"📄 No existing file found ({filename}), keeping all jobs")
+            log.info("📄 No existing file found (%s), keeping all jobs", filename)
         except Exception as e:
-            print(f"⚠️ Error loading existing jobs: {str(e)}")
+            log.warning("⚠️ Error loading existing jobs: %s", e)
     
     def filter_last_24_hours(self):
         """Filter jobs to only include those from last 24 hours"""
@@ -979,7 +1613,7 @@ class JobScraper:
         
         removed = len(self.jobs) - len(filtered)
         self.jobs = filtered
-        print(f"⏰ Filtered to last 24 hours: Removed {removed} old jobs")
+        log.info("⏰ Filtered to last 24 hours: Removed %d old jobs", removed)
     
     def save_to_json(self, filename: str = 'jobs_output.json'):
         """Save jobs to JSON file, merging with existing jobs"""
@@ -992,13 +1626,13 @@ class JobScraper:
                     data = json.loads(content)
                     existing_jobs = data.get('jobs', [])
                 else:
-                    print(f"📄 File {filename} is empty, starting fresh")
+                    log.info("📄 File %s is empty, starting fresh", filename)
         except FileNotFoundError:
-            print(f"📄 No existing file found, creating new {filename}")
+            log.info("📄 No existing file found, creating new %s", filename)
         except json.JSONDecodeError as e:
-            print(f"⚠️ Invalid JSON in {filename}, starting fresh. Error: {str(e)}")
+            log.warning("⚠️ Invalid JSON in %s, starting fresh. Error: %s", filename, e)
         except Exception as e:
-            print(f"⚠️ Error loading existing jobs: {str(e)}, starting fresh")
+            log.warning("⚠️ Error loading existing jobs: %s, starting fresh", e)
         
         # Merge: existing + new jobs
         all_jobs = existing_jobs + self.jobs
@@ -1013,9 +1647,9 @@ class JobScraper:
         try:
             with open(filename, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
-            print(f"\n💾 Saved {len(self.jobs)} NEW jobs (Total: {len(all_jobs)} jobs in {filename})")
+            log.info("💾 Saved %d NEW jobs (Total: %d jobs in %s)", len(self.jobs), len(all_jobs), filename)
         except Exception as e:
-            print(f"❌ Error saving to {filename}: {str(e)}")
+            log.error("❌ Error saving to %s: %s", filename, e)
     
     def get_stats(self):
         """Print scraping statistics"""
@@ -1024,14 +1658,8 @@ class JobScraper:
             source = job.get('source', 'Unknown')
             sources[source] = sources.get(source, 0) + 1
         
-        print("\n" + "="*60)
-        print("📊 SCRAPING SUMMARY")
-        print("="*60)
-        print(f"Total Jobs Scraped: {len(self.jobs)}")
-        print(f"\nBy Source:")
-        for source, count in sources.items():
-            print(f"  • {source}: {count} jobs")
-        print("="*60)
+        log.event(logging.INFO, 'summary', "📊 SCRAPING SUMMARY: %d jobs scraped, by source %s",
+                  len(self.jobs), sources, jobs=len(self.jobs), sources=sources)
     
     def get_jobs(self) -> List[Dict]:
         """Return the scraped jobs"""
@@ -1040,14 +1668,15 @@ class JobScraper:
     def clear_jobs(self):
         """Clear the jobs list to free memory"""
         self.jobs = []
-        print("🗑️  Jobs list cleared from memory")
+        log.debug("🗑️  Jobs list cleared from memory")
     
     async def scrape_all_platforms_sequential(
         self,
         keywords: List[str],
         location: str = "United States",
         max_pages: int = 2,
-        platform_timeout: int = 150  # 2.5 minutes per platform
+        platform_timeout: int = 150,  # 2.5 minutes per platform on average
+        total_timeout: Optional[float] = None
     ) -> List[Dict]:
         """
         Scrape all platforms SEQUENTIALLY with memory optimization
@@ -1055,107 +1684,78 @@ class JobScraper:
         This approach:
         - Scrapes one platform at a time
         - Closes browser after each platform to free memory
-        - Has per-platform timeout to prevent hanging
+        - Shares one time budget between the platforms: each gets an equal
+          share of what is left, so time a fast platform does not use rolls
+          over to the next one instead of being wasted
         - Keeps memory under 512 MB
         
         Args:
             keywords: List of search keywords
             location: Job location
             max_pages: Pages per keyword (default 2 for free tier)
-            platform_timeout: Max seconds per platform (default 150s = 2.5 min)
+            platform_timeout: Average seconds per platform (default 150s = 2.5 min)
+            total_timeout: Seconds for the whole run (default platform_timeout x platforms)
         
         Returns:
             List of all scraped jobs
         """
         all_jobs = []
         platforms_scraped = []
+        platforms = [('SimplyHired', self.scrape_simplyhired), ('Talent.com', self.scrape_talent)]
+        allocator = TimeBudgetAllocator(total_timeout or platform_timeout * len(platforms),
+                                        [name for name, _ in platforms])
         
-        print("\n" + "="*60)
-        print("🚀 SEQUENTIAL PLATFORM SCRAPING (MEMORY OPTIMIZED)")
-        print("="*60)
-        print(f"📍 Keywords: {keywords}")
-        print(f"📍 Location: {location}")
-        print(f"📍 Pages per keyword: {max_pages}")
-        print(f"⏱️  Timeout per platform: {platform_timeout}s")
-        print("="*60)
-        
-        # Platform 1: SimplyHired
-        print("\n🎯 PHASE 1/2: SimplyHired")
-        try:
-            scrape_task = self.scrape_simplyhired(
-                keywords=keywords,
-                location=location,
-                max_pages=max_pages
-            )
-            
-            await asyncio.wait_for(scrape_task, timeout=platform_timeout)
-            
-            # Collect jobs from this platform
-            platform_jobs = self.get_jobs()
-            all_jobs.extend(platform_jobs)
-            platforms_scraped.append(f"SimplyHired ({len(platform_jobs)} jobs)")
-            
-            print(f"✅ SimplyHired completed: {len(platform_jobs)} jobs scraped")
-            
-            # Clear memory before next platform
-            self.clear_jobs()
-            
-        except asyncio.TimeoutError:
-            print(f"⏱️  SimplyHired timed out after {platform_timeout}s - continuing to next platform")
-            # Keep whatever jobs were collected
-            platform_jobs = self.get_jobs()
-            all_jobs.extend(platform_jobs)
-            platforms_scraped.append(f"SimplyHired ({len(platform_jobs)} jobs, timed out)")
-            self.clear_jobs()
-            
-        except Exception as e:
-            print(f"❌ SimplyHired error: {str(e)} - continuing to next platform")
-            platforms_scraped.append("SimplyHired (failed)")
-        
-        # Small delay between platforms
-        await asyncio.sleep(2)
+        log.event(logging.INFO, 'run_start',
+                  "🚀 SEQUENTIAL PLATFORM SCRAPING: keywords %s | %s | %d pages per keyword | "
+                  "%.0fs shared by %d platforms", keywords, location, max_pages, allocator.total, len(platforms),
+                  keywords=keywords, location=location, max_pages=max_pages, time_budget_s=allocator.total)
         
-        # Platform 2: Talent.com
-        print("\n🎯 PHASE 2/2: Talent.com")
-        try:
-            scrape_task = self.scrape_talent(
-                keywords=keywords,
-                location=location,
-                max_pages=max_pages
-            )
-            
-            await asyncio.wait_for(scrape_task, timeout=platform_timeout)
-            
-            # Collect jobs from this platform
-            platform_jobs = self.get_jobs()
-            all_jobs.extend(platform_jobs)
-            platforms_scraped.append(f"Talent.com ({len(platform_jobs)} jobs)")
+        for phase, (name, scrape) in enumerate(platforms, 1):
+            if phase > 1:
+                # Small delay between platforms
+                await asyncio.sleep(2)
             
-            print(f"✅ Talent.com completed: {len(platform_jobs)} jobs scraped")
-            
-            # Clear memory
-            self.clear_jobs()
-            
-        except asyncio.TimeoutError:
-            print(f"⏱️  Talent.com timed out after {platform_timeout}s - continuing")
-            platform_jobs = self.get_jobs()
-            all_jobs.extend(platform_jobs)
-            platforms_scraped.append(f"Talent.com ({len(platform_jobs)} jobs, timed out)")
-            self.clear_jobs()
+            allotted = allocator.allot(name)
+            started = time.monotonic()
+            log.info("🎯 PHASE %d/%d: %s (%.0fs)", phase, len(platforms), name, allotted)
+            try:
+                # The deadline stops page loads cleanly; wait_for is the hard stop
+                with deadline_scope(allotted):
+                    await asyncio.wait_for(
+                        scrape(keywords=keywords, location=location, max_pages=max_pages),
+                        timeout=allotted
+                    )
+                
+                # Collect jobs from this platform
+                platform_jobs = self.get_jobs()
+                all_jobs.extend(platform_jobs)
+                platforms_scraped.append(f"{name} ({len(platform_jobs)} jobs)")
+                
+                log.info("✅ %s completed: %d jobs scraped", name, len(platform_jobs))
+                
+            except asyncio.TimeoutError:
+                log.warning("⏱️  %s timed out after %.0fs - continuing", name, allotted)
+                # Keep whatever jobs were collected
+                platform_jobs = self.get_jobs()
+                all_jobs.extend(platform_jobs)
+                platforms_scraped.append(f"{name} ({len(platform_jobs)} jobs, timed out)")
+                
+            except Exception as e:
+                log.error("❌ %s error: %s - continuing", name, e)
+                platforms_scraped.append(f"{name} (failed)")
             
-        except Exception as e:
-            print(f"❌ Talent.com error: {str(e)}")
-            platforms_scraped.append("Talent.com (failed)")
+            finally:
+                allocator.finish(name, time.monotonic() - started)
+                # Clear memory before next platform
+                self.clear_jobs()
         
         # Store all jobs back in self.jobs for further processing
         self.jobs = all_jobs
+        self.time_budget_stats = allocator.report()
         
-        print("\n" + "="*60)
-        print("📊 SEQUENTIAL SCRAPING COMPLETED")
-        print("="*60)
-        print(f"Total jobs collected: {len(all_jobs)}")
-        print(f"Platforms: {', '.join(platforms_scraped)}")
-        print("="*60)
+        log.event(logging.INFO, 'run_end', "📊 SEQUENTIAL SCRAPING COMPLETED: %d jobs | %s | time used %s",
+                  len(all_jobs), ', '.join(platforms_scraped), self.time_budget_stats['used'],
+                  jobs=len(all_jobs), platforms=platforms_scraped, time_budget=self.time_budget_stats)
         
         return all_jobs
 
@@ -1174,60 +1774,63 @@ async def main():
     
     LOCATION = 'United States'
     
-    scraper = JobScraper(headless=False)
-    
-    print("🚀 Starting Multi-Platform Job Scraper (WITH FULL DESCRIPTIONS)")
-    print(f"📅 Target: Jobs from last 24 hours")
-    print(f"🔍 Keywords: {', '.join(SEARCH_KEYWORDS[:3])}...")
-    print(f"📍 Location: {LOCATION}\n")
-    
-    print("\n🎯 PHASE 1: SimplyHired")
-    await scraper.scrape_simplyhired(
-        keywords=SEARCH_KEYWORDS[:2],
-        location=LOCATION,
-        max_pages=5
-    )
-    
-    print("\n🎯 PHASE 2: Talent.com")
-    await scraper.scrape_talent(
-        keywords=SEARCH_KEYWORDS[:2],
-        location=LOCATION,
-        max_pages=5
-    )
+    # SCRAPER_ARCHIVE=record captures the session's responses to SESSION_ARCHIVE_PATH;
+    # SCRAPER_ARCHIVE=replay re-runs it from there offline (SCRAPER_REPLAY_LATENCY_MS
+    # per response). The description cache is off then, so every detail page is served.
+    archive_mode = os.getenv('SCRAPER_ARCHIVE')
+    archive = None
+    if archive_mode:
+        latency = os.getenv('SCRAPER_REPLAY_LATENCY_MS')
+        archive = SessionArchive(mode=archive_mode, latency_ms=float(latency) if latency else REPLAY_LATENCY_MS)
     
-    #print("\n🎯 PHASE 3: Glassdoor")
-    #await scraper.scrape_glassdoor(
-    #    keywords=SEARCH_KEYWORDS[:1],
-    #    location=LOCATION,
-    #    max_loads=5
-    #)
+    # Incremental crawl: deep pages are skipped once results stop being new.
+    # An interrupted run leaves a checkpoint; the next one resumes from it.
+    scraper = JobScraper(headless=False, incremental=True, prefilter=True,
+                         checkpoint=CHECKPOINT_FILE, resume=True,
+                         description_cache=archive is None, archive=archive)
+    scraper.load_known_jobs('jobs_output.json')
     
-    # Remove duplicates within newly scraped jobs
-    scraper.remove_duplicates()
+    log.info("🚀 Starting Multi-Platform Job Scraper (WITH FULL DESCRIPTIONS): jobs from the last 24 hours, "
+             "keywords %s..., location %s", ', '.join(SEARCH_KEYWORDS[:3]), LOCATION)
+    log.info("🎯 PHASE 1: SimplyHired → PHASE 2: Talent.com → PHASE 3: Glassdoor (streamed)")
     
-    # Filter to last 24 hours
-    scraper.filter_last_24_hours()
-    
-    # Remove jobs that already exist in file (unless reposted after 24h)
-    scraper.remove_duplicates_from_existing('jobs_output.json')
-    
-    # Save to file (merges with existing)
-    scraper.save_to_json('jobs_output.json')
-    scraper.get_stats()
+    # Jobs flow through dedup / 24h filter / existing-store check into the
+    # output file as they are built, so memory holds only in-flight jobs
+    try:
+        jobs = scraper.stream_jobs(
+            keywords=SEARCH_KEYWORDS[:2],
+            location=LOCATION,
+            max_pages=10,
+            platforms=['SimplyHired', 'Talent.com', 'Glassdoor']
+        )
+        jobs = scraper.stream_unique(jobs)
+        jobs = scraper.stream_recent(jobs)
+        jobs = scraper.stream_new(jobs, 'jobs_output.json')
+        sources = await scraper.save_stream(jobs, 'jobs_output.json')
+        
+        # Everything is saved, so the next run starts from page 1 again
+        scraper.checkpoint.clear()
+    finally:
+        # A failed run's recording is kept too (it is what reproduces the failure)
+        if archive is not None:
+            await archive.close()
     
-    print("\n✅ Scraping completed successfully!")
+    log.event(logging.INFO, 'summary', "📊 SCRAPING SUMMARY: %d new jobs saved, by source %s",
+              sum(sources.values()), sources, jobs=sum(sources.values()), sources=sources)
+    log.info("✅ Scraping completed successfully!")
     
-    return scraper.get_jobs()
+    return sources
 
 
 if __name__ == "__main__":
-    jobs = asyncio.run(main())
+    configure_logging(log_file='scraper.log')
+    sources = asyncio.run(main())
+    
+    # Jobs were streamed to disk; the new ones are at the end of the file
+    with open('jobs_output.json', 'r', encoding='utf-8') as f:
+        jobs = json.load(f)['jobs'][-sum(sources.values()):] if sum(sources.values()) else []
     
-    print("\n📄 Sample Jobs (first 3):")
     for i, job in enumerate(jobs[:3], 1):
-        print(f"\n{i}. {job['title']} at {job['company']}")
-        print(f"   Location: {job['location']}")
-        print(f"   Posted: {job['posted_date'][:10]}")
-        print(f"   Description Length: {len(job['description'])} characters")
-        print(f"   Source: {job['source']}")
-        print(f"   URL: {job['url']}")
\ No newline at end of file
+        log.event(logging.INFO, 'sample_job', "📄 Sample %d: %s at %s (%s, posted %s, %d chars, %s) %s",
+                  i, job['title'], job['company'], job['location'], job['posted_date'][:10],
+                  len(job['description']), job['source'], job['url'])
\ No newline at end of file
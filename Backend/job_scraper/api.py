@@ -4,7 +4,7 @@ Synchronous endpoint that returns scraped jobs in n8n format
 """
 
 import asyncio
-import json
+import atexit
 import logging
 import os
 import time
@@ -16,6 +16,13 @@ from flask import Flask, request, jsonify
 from flask_cors import CORS
 
 from Screp import JobScraper
+from browser_manager import BrowserManager
+from checkpoint import checkpoint_path
+from config import CHECKPOINT_FILE
+from deadline import deadline_scope
+from description_cache import DescriptionCache
+from event_log import configure_logging, get_logger
+from rate_limiter import DomainRateLimiter
 
 # Set Playwright browser path BEFORE any imports
 os.environ['PLAYWRIGHT_BROWSERS_PATH'] = os.getenv(
@@ -23,20 +30,30 @@ os.environ['PLAYWRIGHT_BROWSERS_PATH'] = os.getenv(
     '/opt/render/project/src/browsers'
 )
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('api.log'),
-        logging.StreamHandler()
-    ]
-)
-logger = logging.getLogger(__name__)
+# JSON-lines logging through a background writer (LOG_LEVEL / LOG_LEVELS / LOG_MODE in config)
+configure_logging(log_file='api.log')
+logger = get_logger('api')
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for n8n
 
+# Warm browser shared by all scrape requests (launched on first use, recycled by page count / RSS)
+browser_manager = BrowserManager(headless=os.getenv('DEBUG', 'false').lower() != 'true')
+atexit.register(browser_manager.shutdown)
+
+# Descriptions read by earlier requests (skips their detail pages)
+description_cache = DescriptionCache()
+atexit.register(description_cache.close)
+
+# Per-domain request rates learned by earlier requests (a new scrape starts at the safe rate)
+rate_limiter = DomainRateLimiter()
+
+# Request caps: memory is bounded by the scheduler, these bound the run time
+MAX_KEYWORDS = 10
+MAX_PAGES = 5
+SCRAPE_TIMEOUT = 420  # Seconds of request deadline for a scrape (gunicorn timeout is 600)
+SCRAPE_GRACE = 30  # Extra seconds before a scrape that overran its deadline is cancelled
+
 # Global variable to track scraping progress
 scraping_progress = {
     'status': 'idle',
@@ -55,7 +72,7 @@ def heartbeat_logger(interval=300):
     while scraping_progress['status'] == 'running':
         time.sleep(interval)
         if scraping_progress['status'] == 'running':
-            logger.info(f"🔄 Still scraping... processed {scraping_progress['jobs_count']} jobs")
+            logger.info("🔄 Still scraping... processed %d jobs", scraping_progress['jobs_count'])
             scraping_progress['last_heartbeat'] = datetime.now().isoformat()
 
 
@@ -103,37 +120,42 @@ async def run_scraper(
     platform: Optional[str] = None,
     keywords: Optional[List[str]] = None,
     pages: int = 1,
-    location: str = "United States"
+    location: str = "United States",
+    resume: bool = False
 ) -> Dict:
     """
     Run the job scraper with specified parameters (MEMORY OPTIMIZED)
     
-    This function uses sequential scraping to stay within 512 MB memory limit.
-    Platforms are scraped one at a time with browser cleanup between each.
+    Every (platform, keyword) pair is a task; the memory scheduler admits
+    tasks only while process RSS (Chromium included) stays under MEMORY_BUDGET_MB,
+    so the 512 MB limit is respected without a fixed serial plan.
     
     Args:
         platform: Platform to scrape (SimplyHired, Talent.com) or None/all for both
         keywords: List of job search keywords
-        pages: Number of pages to scrape per keyword (max 2 recommended for free tier)
+        pages: Number of pages to scrape per keyword (capped at MAX_PAGES)
         location: Job location
+        resume: Continue keywords from the checkpoint of an interrupted scrape
     
     Returns:
         Dictionary with success status and jobs data
     """
     global scraping_progress
+    scraper = None
     
     try:
         # Default parameters
         if keywords is None:
             keywords = ['python developer', 'react developer']
         
-        # Limit to reasonable values for Render free tier (512 MB)
-        # Recommended: 2 keywords, 2 pages = ~200-250 MB peak memory
-        pages = min(pages, 2)  # Max 2 pages for free tier
-        keywords = keywords[:2]  # Max 2 keywords for free tier
+        # Memory is bounded by the scheduler; these caps only bound run time
+        pages = min(pages, MAX_PAGES)
+        keywords = keywords[:MAX_KEYWORDS]
         
-        logger.info(f"🚀 Starting scraper - Platform: {platform}, Keywords: {keywords}, Pages: {pages}, Location: {location}")
-        logger.info(f"💾 Memory optimization: Sequential scraping enabled")
+        logger.event(logging.INFO, 'scrape_start', "🚀 Starting scraper - Platform: %s, Keywords: %s, Pages: %d, Location: %s",
+                     platform, keywords, pages, location,
+                     platform=platform, keywords=keywords, pages=pages, location=location)
+        logger.info("💾 Memory optimization: memory-budget scheduler enabled")
         
         # Initialize scraper (headless=True for production, False for local debugging)
         # Set DEBUG=true in environment to see browser window
@@ -143,7 +165,14 @@ async def run_scraper(
         if is_debug:
             logger.info("🐛 DEBUG mode: Browser will be VISIBLE")
         
-        scraper = JobScraper(headless=headless_mode)
+        # Results are deduplicated and filtered to the last 24 hours below, so
+        # such cards are dropped before their detail fetch (prefilter) and pages
+        # of stale or already-seen cards end a keyword early (incremental crawl).
+        # Each search has its own checkpoint, so concurrent requests never share one.
+        checkpoint = checkpoint_path(CHECKPOINT_FILE, platform or 'all', location, *sorted(keywords))
+        scraper = JobScraper(headless=headless_mode, browser_manager=browser_manager,
+                             description_cache=description_cache, incremental=True, prefilter=True,
+                             checkpoint=checkpoint, resume=resume, rate_limiter=rate_limiter)
         
         # Update progress
         scraping_progress['status'] = 'running'
@@ -156,39 +185,48 @@ async def run_scraper(
         
         # Scrape based on platform parameter
         if platform is None or platform.lower() == 'all':
-            logger.info("📋 Scraping all platforms SEQUENTIALLY (SimplyHired → Talent.com)")
-            
-            # Use the new sequential scraper method
-            await scraper.scrape_all_platforms_sequential(
-                keywords=keywords,
-                location=location,
-                max_pages=pages,
-                platform_timeout=150  # 2.5 min per platform
-            )
-            
-            scraping_progress['jobs_count'] = len(scraper.jobs)
-            logger.info(f"✅ Sequential scraping completed: {len(scraper.jobs)} total jobs")
-        
+            logger.info("📋 Scraping all platforms under the memory budget")
+            scrape = scraper.scrape_all_platforms(keywords=keywords, location=location, max_pages=pages)
         elif platform.lower() == 'simplyhired':
             logger.info("📋 Scraping SimplyHired only")
-            await scraper.scrape_simplyhired(
-                keywords=keywords,
-                location=location,
-                max_pages=pages
-            )
-            scraping_progress['jobs_count'] = len(scraper.jobs)
-        
+            scrape = scraper.scrape_simplyhired(keywords=keywords, location=location, max_pages=pages)
         elif platform.lower() in ['talent', 'talent.com']:
             logger.info("📋 Scraping Talent.com only")
-            await scraper.scrape_talent(
-                keywords=keywords,
-                location=location,
-                max_pages=pages
-            )
-            scraping_progress['jobs_count'] = len(scraper.jobs)
-        
+            scrape = scraper.scrape_talent(keywords=keywords, location=location, max_pages=pages)
+        elif platform.lower() == 'glassdoor':
+            logger.info("📋 Scraping Glassdoor only")
+            scrape = scraper.scrape_glassdoor(keywords=keywords, location=location, max_loads=pages)
         else:
-            raise ValueError(f"Unknown platform: {platform}. Use 'all', 'simplyhired', or 'talent'")
+            raise ValueError(f"Unknown platform: {platform}. Use 'all', 'simplyhired', 'talent' or 'glassdoor'")
+        
+        # Every navigation, wait and detail fetch is capped by what is left of
+        # SCRAPE_TIMEOUT; the hard stop after a grace period only catches a
+        # step that ignores it. Jobs collected so far stay in scraper.jobs.
+        with deadline_scope(SCRAPE_TIMEOUT):
+            try:
+                await asyncio.wait_for(scrape, timeout=SCRAPE_TIMEOUT + SCRAPE_GRACE)
+            except asyncio.TimeoutError:
+                scraper.partial_reasons['run'] = 'hard_timeout'
+                logger.warning("⏱️ Scrape overran its deadline by %ds, returning partial results", SCRAPE_GRACE)
+        
+        scraping_progress['jobs_count'] = len(scraper.jobs)
+        logger.info("✅ Scraping completed: %d total jobs", len(scraper.jobs))
+        if scraper.scheduler_stats:
+            logger.event(logging.INFO, 'scheduler', "🧮 Memory scheduler: %s", scraper.scheduler_stats,
+                         stats=scraper.scheduler_stats)
+        if scraper.time_budget_stats:
+            logger.event(logging.INFO, 'time_budget', "⏱️ Time budget: %s", scraper.time_budget_stats,
+                         stats=scraper.time_budget_stats)
+        if scraper.partial_reasons:
+            logger.event(logging.WARNING, 'partial', "⚠️ Partial results: %s", scraper.partial_reasons,
+                         reasons=scraper.partial_reasons)
+        
+        logger.info("🛡️ Resource blocking: %s", scraper.resource_blocker.report())
+        logger.info("🚦 Page backends: %s", scraper.backend_stats)
+        logger.info("💾 Description cache: %s", description_cache.stats)
+        logger.info("🐢 Request rates: %s", rate_limiter.rates())
+        logger.info("⏹️ Incremental early stops: %s", scraper.incremental_stats)
+        logger.info("✂️ Pre-filter (detail fetches saved): %s", scraper.prefilter_stats)
         
         # Process results (deduplication + filtering)
         logger.info("🔄 Processing results: removing duplicates and filtering...")
@@ -204,14 +242,23 @@ async def run_scraper(
         scraping_progress['jobs_count'] = len(jobs)
         scraping_progress['last_heartbeat'] = scraped_at
         
-        logger.info(f"✅ Scraping completed successfully: {len(jobs)} jobs after deduplication")
+        logger.event(logging.INFO, 'scrape_end', "✅ Scraping completed successfully: %d jobs after deduplication",
+                     len(jobs), jobs=len(jobs))
         
-        return format_jobs_for_n8n(jobs, scraped_at)
+        result = format_jobs_for_n8n(jobs, scraped_at)
+        # Keywords cut short by the deadline, a hung browser or an error
+        result['partial'] = bool(scraper.partial_reasons)
+        result['partial_reasons'] = scraper.partial_reasons
+        if not scraper.partial_reasons:
+            scraper.checkpoint.clear()  # Nothing left to resume
+        return result
     
     except Exception as e:
         scraping_progress['status'] = 'error'
         scraping_progress['last_heartbeat'] = datetime.now().isoformat()
-        logger.error(f"❌ Scraping error: {str(e)}")
+        logger.error("❌ Scraping error: %s", e, exc_info=True)
+        if scraper is not None:
+            scraper.checkpoint.clear()  # Its progress covers jobs that were never returned
         raise
 
 
@@ -267,6 +314,9 @@ def health_check():
         'timestamp': datetime.now().isoformat(),
         'scraping_status': scraping_progress['status'],
         'browser': browser_status,
+        'browser_pool': browser_manager.status(),
+        'description_cache': dict(description_cache.stats, entries=len(description_cache)),
+        'rate_limits': rate_limiter.rates(),
         'environment': {
             'playwright_path': os.getenv('PLAYWRIGHT_BROWSERS_PATH', 'not set'),
             'python_version': os.sys.version.split()[0]
@@ -281,10 +331,11 @@ def scrape_jobs():
     
     Request body (all optional):
     {
-        "platform": "all",  // or "simplyhired", "talent", null (defaults to "all")
-        "keywords": ["python developer", "react developer"],  // max 2 recommended
-        "pages": 2,  // max 2 recommended for 512 MB limit
-        "location": "United States"
+        "platform": "all",  // or "simplyhired", "talent", "glassdoor", null (defaults to "all")
+        "keywords": ["python developer", "react developer"],  // up to MAX_KEYWORDS
+        "pages": 2,  // up to MAX_PAGES; memory is bounded by the scheduler
+        "location": "United States",
+        "resume": false  // true: continue where a timed-out / crashed scrape stopped
     }
     
     Response format:
@@ -292,6 +343,8 @@ def scrape_jobs():
         "success": true,
         "total_jobs": 180,
         "scraped_at": "2025-11-13T00:05:00.000000",
+        "partial": false,  // true when a keyword stopped early (see partial_reasons)
+        "partial_reasons": {},  // e.g. {"Talent.com: python developer": "deadline"}
         "jobs": [
             {
                 "job_id": "abc123",
@@ -309,10 +362,9 @@ def scrape_jobs():
     }
     
     Memory optimization:
-    - Sequential scraping (one platform at a time)
-    - Browser cleanup between platforms
-    - Max 2 keywords, 2 pages recommended
-    - Peak memory: ~400-450 MB
+    - (platform, keyword) tasks admitted only while RSS stays under MEMORY_BUDGET_MB
+    - One warm browser, recycled by page count / RSS
+    - Peak memory: below MEMORY_BUDGET_MB (450 MB by default)
     """
     try:
         # Log request
@@ -325,6 +377,7 @@ def scrape_jobs():
         keywords = data.get('keywords', ['python developer', 'react developer'])
         pages = data.get('pages', 2)  # Default 2 pages for free tier
         location = data.get('location', 'United States')
+        resume = bool(data.get('resume', False))  # Continue an interrupted scrape
         
         # Validate parameters
         if not isinstance(keywords, list) or len(keywords) == 0:
@@ -344,30 +397,31 @@ def scrape_jobs():
             }), 400
         
         # Warn if exceeding recommended limits
-        if len(keywords) > 2:
-            logger.warning(f"⚠️  {len(keywords)} keywords requested (recommended: 2 for free tier)")
-        if pages > 2:
-            logger.warning(f"⚠️  {pages} pages requested (recommended: 2 for free tier)")
+        if len(keywords) > MAX_KEYWORDS:
+            logger.warning("⚠️  %d keywords requested, only the first %d are scraped", len(keywords), MAX_KEYWORDS)
+        if pages > MAX_PAGES:
+            logger.warning("⚠️  %d pages requested, capped at %d", pages, MAX_PAGES)
         
         # Log parameters
-        logger.info(f"Parameters - Platform: {platform}, Keywords: {keywords}, Pages: {pages}, Location: {location}")
-        logger.info(f"💾 Memory mode: Sequential scraping enabled")
+        logger.info("Parameters - Platform: %s, Keywords: %s, Pages: %s, Location: %s", platform, keywords, pages, location)
+        logger.info("💾 Memory mode: memory-budget scheduler")
         
-        # Run scraper synchronously (this will block until complete)
-        result = asyncio.run(run_scraper(
+        # Run scraper on the warm browser's event loop (this will block until complete)
+        result = browser_manager.run(run_scraper(
             platform=platform,
             keywords=keywords,
             pages=pages,
-            location=location
+            location=location,
+            resume=resume
         ))
         
         # Return results
-        logger.info(f"✅ Returning {result['total_jobs']} jobs to client")
+        logger.info("✅ Returning %d jobs to client", result['total_jobs'])
         return jsonify(result), 200
     
     except ValueError as e:
         # Validation error
-        logger.error(f"❌ Validation error: {str(e)}")
+        logger.error("❌ Validation error: %s", e)
         return jsonify({
             'success': False,
             'error': str(e),
@@ -377,7 +431,7 @@ def scrape_jobs():
     
     except Exception as e:
         # Internal server error
-        logger.error(f"❌ Server error: {str(e)}", exc_info=True)
+        logger.error("❌ Server error: %s", e, exc_info=True)
         return jsonify({
             'success': False,
             'error': f"Internal server error: {str(e)}",
@@ -422,10 +476,10 @@ if __name__ == '__main__':
         logger.warning("⚠️  Chromium not found - scraping may fail!")
         logger.info("Run: playwright install chromium")
     
-    logger.info(f"🚀 Starting Flask server on port {port}")
-    logger.info(f"📍 API endpoint: http://localhost:{port}/api/scrape-jobs")
-    logger.info(f"💡 Test with: curl -X POST http://localhost:{port}/api/scrape-jobs -H 'Content-Type: application/json' -d '{{\"keywords\":[\"python\"],\"pages\":1}}'")
+    logger.info("🚀 Starting Flask server on port %s", port)
+    logger.info("📍 API endpoint: http://localhost:%s/api/scrape-jobs", port)
+    logger.info("💡 Test with: curl -X POST http://localhost:%s/api/scrape-jobs -H 'Content-Type: application/json' -d '{\"keywords\":[\"python\"],\"pages\":1}'", port)
     
     
-    logger.info(f"🚀 Starting Job Scraper API on port {port}")
+    logger.info("🚀 Starting Job Scraper API on port %s", port)
     app.run(host='0.0.0.0', port=port, debug=debug)
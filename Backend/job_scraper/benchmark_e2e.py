@@ -0,0 +1,246 @@
+"""
+End-to-End Throughput Benchmark
+Drives JobScraper (or the Flask API) against the local fixture job board and
+reports jobs/minute, p50/p95 per-job latency and peak process-tree memory
+(Chromium included) to a JSON file. Exits with status 1 when a result
+regresses past the stored baseline for the same scenario.
+
+Per-job latency is the time from the fixture serving the results page a job
+is listed on to the scraper building that job (its fetched_at).
+
+benchmark_baseline.json holds the scraper-mode baseline. It was recorded
+with the HTTP fast path serving every page, so the browser path (and api
+mode) is untested by it; record a baseline where Chromium is installed
+before relying on those numbers.
+
+Usage:
+    python benchmark_e2e.py --jobs 100 --latency-ms 50
+    python benchmark_e2e.py --mode api --jobs 1000 --keywords 2
+    python benchmark_e2e.py --jobs 100 --update-baseline
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from event_log import configure_logging
+from fixture_server import PAGE_SIZE, FixtureJobBoard
+from memory_monitor import process_tree_rss_mb
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+BASELINE_FILE = os.path.join(HERE, 'benchmark_baseline.json')
+RESULTS_FILE = os.path.join(HERE, 'benchmark_results.json')
+KEYWORDS = ['python developer', 'data scientist', 'machine learning engineer', 'software engineer',
+            'full stack developer', 'devops engineer', 'frontend developer', 'backend developer']
+PLATFORMS = ['SimplyHired', 'Talent.com']
+
+# metric -> True when higher is better
+GATED_METRICS = {'jobs_per_min': True, 'latency_p95_s': False, 'peak_rss_mb': False}
+
+
+class PeakMemorySampler:
+    """Samples process-tree RSS on a background thread and keeps the peak"""
+
+    def __init__(self, interval: float = 0.25):
+        self.interval = interval
+        self.peak_mb = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='rss-sampler', daemon=True)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak_mb = max(self.peak_mb, process_tree_rss_mb())
+            self._stop.wait(self.interval)
+
+    def __enter__(self) -> 'PeakMemorySampler':
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._stop.set()
+        self._thread.join()
+        self.peak_mb = max(self.peak_mb, process_tree_rss_mb())
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile (None for no values)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+# ==================== DRIVERS ====================
+async def run_scraper(board: FixtureJobBoard, keywords: List[str], max_pages: int,
+                      rps: float) -> Tuple[List[Dict], int]:
+    """Stream every job of the fixture searches straight from JobScraper"""
+    from Screp import JobScraper
+    from rate_limiter import DomainRateLimiter
+
+    # No description cache: every run must fetch every detail page
+    scraper = JobScraper(headless=True, base_urls=board.base_urls, description_cache=False,
+                         rate_limiter=DomainRateLimiter(initial_rps=rps, max_rps=rps))
+    jobs = [job async for job in scraper.stream_jobs(keywords, 'United States', max_pages, PLATFORMS)]
+    return jobs, max_pages
+
+
+def run_api(board: FixtureJobBoard, keywords: List[str], max_pages: int, rps: float) -> Tuple[List[Dict], int]:
+    """
+    POST one scrape request to the Flask app (warm browser, scheduler,
+    deadline and all); returns the jobs and the page count the API used
+    """
+    # api / config must be imported after this, in a scratch directory for
+    # their cache and checkpoint files
+    os.environ['SIMPLYHIRED_BASE_URL'] = board.base_urls['SimplyHired']
+    os.environ['TALENT_BASE_URL'] = board.base_urls['Talent.com']
+    os.chdir(tempfile.mkdtemp(prefix='scraper-bench-'))
+    import api
+    from config import PLATFORM_BASE_URLS
+    if PLATFORM_BASE_URLS['SimplyHired'] != board.base_urls['SimplyHired']:
+        raise RuntimeError("config was imported before the fixture URLs were set")
+
+    api.rate_limiter.initial_rps = api.rate_limiter.max_rps = rps
+    pages = min(max_pages, api.MAX_PAGES)
+    try:
+        response = api.app.test_client().post('/api/scrape-jobs', json={
+            'platform': 'all', 'keywords': keywords, 'pages': pages,
+        })
+        body = response.get_json()
+        if response.status_code != 200:
+            raise RuntimeError(f"API returned {response.status_code}: {body.get('error')}")
+        return body['jobs'], pages
+    finally:
+        api.browser_manager.shutdown()
+
+
+# ==================== REPORTING ====================
+def summarise(jobs: List[Dict], board: FixtureJobBoard, elapsed: float, peak_mb: float,
+              expected_jobs: int) -> Dict:
+    latencies = []
+    for job in jobs:
+        served_at = board.served_at.get(job.get('url'))
+        if served_at is not None and job.get('fetched_at'):
+            latencies.append(datetime.fromisoformat(job['fetched_at']).timestamp() - served_at)
+    p50, p95 = percentile(latencies, 50), percentile(latencies, 95)
+    return {
+        'jobs': len(jobs),
+        'expected_jobs': expected_jobs,
+        'elapsed_s': round(elapsed, 2),
+        'jobs_per_min': round(len(jobs) / elapsed * 60, 1) if elapsed else 0.0,
+        'latency_p50_s': round(p50, 3) if p50 is not None else None,
+        'latency_p95_s': round(p95, 3) if p95 is not None else None,
+        'peak_rss_mb': round(peak_mb, 1),
+        'fixture_requests': board.requests,
+    }
+
+
+def check_regressions(metrics: Dict, baseline: Optional[Dict], tolerance: float) -> List[str]:
+    """Human-readable regressions of `metrics` against `baseline` (empty when none)"""
+    if not baseline:
+        return []
+    regressions = []
+    if metrics['jobs'] < baseline['jobs']:
+        regressions.append(f"jobs: {metrics['jobs']} < baseline {baseline['jobs']}")
+    for name, higher_is_better in GATED_METRICS.items():
+        current, reference = metrics.get(name), baseline.get(name)
+        if current is None or not reference:
+            continue
+        if higher_is_better and current < reference * (1 - tolerance):
+            regressions.append(f"{name}: {current} < baseline {reference} - {tolerance:.0%}")
+        elif not higher_is_better and current > reference * (1 + tolerance):
+            regressions.append(f"{name}: {current} > baseline {reference} + {tolerance:.0%}")
+    return regressions
+
+
+def load_json(path: str) -> Dict:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="End-to-end scraper benchmark against the fixture job board")
+    parser.add_argument('--mode', choices=['scraper', 'api'], default='scraper')
+    parser.add_argument('--jobs', type=int, default=100, help="Jobs per search (10 to 10000)")
+    parser.add_argument('--keywords', type=int, default=2, help="Number of keywords searched")
+    parser.add_argument('--latency-ms', type=float, default=0, help="Injected latency per fixture response")
+    parser.add_argument('--rps', type=float, default=50, help="Rate limit per domain (the fixture is one host)")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="Allowed regression vs the baseline")
+    parser.add_argument('--output', default=RESULTS_FILE)
+    parser.add_argument('--baseline', default=BASELINE_FILE)
+    parser.add_argument('--update-baseline', action='store_true', help="Store this run as the scenario's baseline")
+    args = parser.parse_args()
+
+    if not 10 <= args.jobs <= 10000:
+        parser.error("--jobs must be between 10 and 10000")
+    keywords = KEYWORDS[:max(1, args.keywords)]
+    scenario = f"{args.mode}-{args.jobs}jobs-{len(keywords)}kw-{args.latency_ms:g}ms"
+    output, baseline_path = os.path.abspath(args.output), os.path.abspath(args.baseline)
+    configure_logging()  # LOG_MODE=summary to measure without the per-job events
+
+    print("=" * 60)
+    print(f"⏱️  BENCHMARK {scenario}")
+    print("=" * 60)
+
+    with FixtureJobBoard(jobs=args.jobs, latency_ms=args.latency_ms) as board:
+        max_pages = max(board.pages(platform) for platform in PLATFORMS)
+        with PeakMemorySampler() as sampler:
+            started = time.monotonic()
+            if args.mode == 'api':
+                jobs, max_pages = run_api(board, keywords, max_pages, args.rps)
+            else:
+                jobs, max_pages = asyncio.run(run_scraper(board, keywords, max_pages, args.rps))
+            elapsed = time.monotonic() - started
+        # The API caps pages per keyword, so it may see only part of each search
+        expected = sum(min(args.jobs, max_pages * PAGE_SIZE[platform]) for platform in PLATFORMS) * len(keywords)
+        metrics = summarise(jobs, board, elapsed, sampler.peak_mb, expected)
+
+    baselines = load_json(baseline_path)
+    regressions = check_regressions(metrics, baselines.get(scenario), args.tolerance)
+    result = {
+        'scenario': scenario,
+        'run_at': datetime.now().isoformat(),
+        'settings': {'mode': args.mode, 'jobs_per_search': args.jobs, 'keywords': keywords,
+                     'platforms': PLATFORMS, 'latency_ms': args.latency_ms, 'rps': args.rps,
+                     'max_pages': max_pages},
+        'metrics': metrics,
+        'baseline': baselines.get(scenario),
+        'regressions': regressions,
+    }
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(result, f, indent=2)
+
+    print("\n" + "=" * 60)
+    print(f"📊 {scenario}")
+    print("=" * 60)
+    for name, value in metrics.items():
+        print(f"  {name}: {value}")
+    print(f"  -> {output}")
+
+    if args.update_baseline:
+        baselines[scenario] = metrics
+        with open(baseline_path, 'w', encoding='utf-8') as f:
+            json.dump(baselines, f, indent=2, sort_keys=True)
+        print(f"📌 Baseline for {scenario} updated in {baseline_path}")
+        return 0
+    if regressions:
+        print("\n❌ Regressed past the baseline:")
+        for regression in regressions:
+            print(f"  • {regression}")
+        return 1
+    print("\n✅ No regressions" + ("" if scenario in baselines else " (no baseline stored for this scenario)"))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
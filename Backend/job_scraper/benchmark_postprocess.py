@@ -0,0 +1,298 @@
+"""
+Post-Processing Micro-Benchmarks
+Times the JobScraper post-processing hot paths (dedup, existing-store
+comparison, 24h filter, date parsing, text cleaning, JSON save) on synthetic
+jobs at 1k to 1M scale, records their allocations with tracemalloc, and
+appends every run to a JSON-lines history so changes can be compared.
+
+Synthetic jobs have the shape _build_job produces, descriptions sized like
+real ones (median ~2.7k chars, 200 to 8k), ~10% duplicates and ~30% older
+than 24 hours.
+
+Usage:
+    python benchmark_postprocess.py
+    python benchmark_postprocess.py --sizes 1000 10000 100000 1000000
+    python benchmark_postprocess.py --functions clean_text parse_posted_date --no-alloc
+"""
+
+import argparse
+import contextlib
+import gc
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+from Screp import JobScraper
+from text_normalise import JobRecord, key_part, unique_keys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+HISTORY_FILE = os.path.join(HERE, 'benchmark_postprocess_history.jsonl')
+DEFAULT_SIZES = [1000, 10000, 100000]
+
+_WORDS = ('design build maintain scalable services python api cloud data pipeline team product customers '
+          'testing deployment monitoring performance security review mentor collaborate deliver requirements '
+          'experience years degree benefits remote hybrid salary equity 401(k) health dental vision').split()
+_PUNCTUATION = ['.', ',', ';', ':', ' -', ' •', ' —', '!', '?', ' (e.g.)', ' & ', ' / ', ' $120,000', ' 100%']
+_ROLES = ['Python Developer', 'Data Scientist', 'Backend Engineer', 'Frontend Developer', 'DevOps Engineer',
+          'Machine Learning Engineer', 'Full Stack Developer', 'Data Engineer', 'Site Reliability Engineer']
+_SENIORITY = ['', 'Senior ', 'Junior ', 'Lead ', 'Staff ', 'Principal ']
+_COMPANIES = ['Acme', 'Globex', 'Initech', 'Umbrella', 'Hooli', 'Stark Industries', 'Wayne Enterprises',
+              'Wonka', 'Cyberdyne', 'Soylent', 'Tyrell', 'Aperture']
+_CITIES = ['New York, NY', 'Austin, TX', 'Seattle, WA', 'Remote', 'Chicago, IL', 'Denver, CO', 'Boston, MA']
+# Date texts as the job boards show them
+_DATE_TEXTS = ['Just posted', 'Today', 'Yesterday', '1d', '3d', '5 days ago', '2 hours ago', '14h', '30+ days ago',
+               '45 minutes ago', '1 week ago', '2 months ago', 'Last updated: 3 hours ago', '0d', 'Posted 2 hr',
+               'Active 6 days ago', 'Employer active 2 days ago', 'New']
+
+DESCRIPTION_POOL = 2000  # distinct descriptions, shared by reference between jobs
+
+
+# ==================== SYNTHETIC DATA ====================
+def synthetic_description(rng: random.Random) -> str:
+    """Raw job-page text: lognormal length around 2.7k chars, with the whitespace and symbols clean_text strips"""
+    target = int(min(8000, max(200, rng.lognormvariate(math.log(2700), 0.6))))
+    parts, length = [], 0
+    while length < target:
+        word = rng.choice(_WORDS)
+        if rng.random() < 0.08:
+            word += rng.choice(_PUNCTUATION)
+        separator = rng.choice(['\n\n', '\n', '\t', '  ']) if rng.random() < 0.05 else ' '
+        parts.append(word + separator)
+        length += len(word) + len(separator)
+    return ''.join(parts)
+
+
+def synthetic_jobs(count: int, seed: int = 42, duplicate_fraction: float = 0.1,
+                   stale_fraction: float = 0.3) -> List[Dict]:
+    """`count` jobs in the shape _build_job returns (JobRecords carrying their unique key)"""
+    rng = random.Random(seed)
+    descriptions = [synthetic_description(rng) for _ in range(min(count, DESCRIPTION_POOL))]
+    now = datetime.now()
+    jobs = []
+    for index in range(count):
+        if jobs and rng.random() < duplicate_fraction:
+            # Same title + company posted again (another platform or a repost)
+            original = rng.choice(jobs)
+            title, company = original['title'], original['company']
+        else:
+            title = f"{rng.choice(_SENIORITY)}{rng.choice(_ROLES)} {index}"
+            company = f"{rng.choice(_COMPANIES)} {rng.randrange(count)}"
+        hours = rng.uniform(25, 24 * 30) if rng.random() < stale_fraction else rng.uniform(0, 23)
+        source = rng.choice(['SimplyHired', 'Talent.com', 'Glassdoor'])
+        jobs.append(JobRecord({
+            'job_id': f"{index:012x}",
+            'title': title,
+            'company': company,
+            'location': rng.choice(_CITIES),
+            'job_type': 'Full-time',
+            'description': rng.choice(descriptions),
+            'url': f"https://www.example.com/{source.lower()}/job/{index}",
+            'posted_date': (now - timedelta(hours=hours)).isoformat(),
+            'salary': f"${rng.randrange(70, 200) * 1000:,} per year" if rng.random() < 0.6 else 'Not specified',
+            'source': source,
+            'fetched_at': now.isoformat(),
+        }))
+    return jobs
+
+
+def write_jobs_file(path: str, jobs: List[Dict]):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'scraped_at': datetime.now().isoformat(), 'total_jobs': len(jobs), 'jobs': jobs}, f,
+                  ensure_ascii=False)
+
+
+# ==================== CASES ====================
+# Each case prepares its inputs (untimed) and returns the call to measure
+Case = Callable[[List[Dict], str], Callable[[], object]]
+
+
+def _scraper_with(jobs: List[Dict]) -> JobScraper:
+    scraper = JobScraper(headless=True, http_fast_path=False, description_cache=False)
+    scraper.jobs = list(jobs)
+    return scraper
+
+
+def case_remove_duplicates(jobs: List[Dict], workdir: str) -> Callable[[], object]:
+    return _scraper_with(jobs).remove_duplicates
+
+
+def case_remove_duplicates_from_existing(jobs: List[Dict], workdir: str) -> Callable[[], object]:
+    # Stored file: the older half of the run's jobs plus as many others
+    path = os.path.join(workdir, 'existing.json')
+    write_jobs_file(path, jobs[::2] + synthetic_jobs(len(jobs) // 2, seed=7))
+    scraper = _scraper_with(jobs)
+    return lambda: scraper.remove_duplicates_from_existing(path)
+
+
+def case_filter_last_24_hours(jobs: List[Dict], workdir: str) -> Callable[[], object]:
+    return _scraper_with(jobs).filter_last_24_hours
+
+
+def case_parse_posted_date(jobs: List[Dict], workdir: str) -> Callable[[], object]:
+    rng = random.Random(1)
+    texts = [rng.choice(_DATE_TEXTS) for _ in jobs]
+    scraper = _scraper_with([])
+    return lambda: [scraper.parse_posted_date(text) for text in texts]
+
+
+def case_parse_posted_dates_batch(jobs: List[Dict], workdir: str) -> Callable[[], object]:
+    rng = random.Random(1)
+    texts = [rng.choice(_DATE_TEXTS) for _ in jobs]
+    parser = _scraper_with([]).date_parser
+    return lambda: parser.epochs(texts)
+
+
+def case_clean_text(jobs: List[Dict], workdir: str) -> Callable[[], object]:
+    scraper = _scraper_with([])
+    return lambda: [scraper.clean_text(job['description']) for job in jobs]
+
+
+def case_unique_keys(jobs: List[Dict], workdir: str) -> Callable[[], object]:
+    # Plain dicts, as loaded from the output file, with the key-part memo cold
+    plain = [dict(job) for job in jobs]
+    key_part.cache_clear()
+    return lambda: unique_keys(plain)
+
+
+def case_save_to_json(jobs: List[Dict], workdir: str) -> Callable[[], object]:
+    # Merges into a stored file as large as the run, like a daily append
+    path = os.path.join(workdir, 'jobs_output.json')
+    write_jobs_file(path, jobs)
+    scraper = _scraper_with(jobs)
+    return lambda: scraper.save_to_json(path)
+
+
+CASES: Dict[str, Case] = {
+    'remove_duplicates': case_remove_duplicates,
+    'remove_duplicates_from_existing': case_remove_duplicates_from_existing,
+    'filter_last_24_hours': case_filter_last_24_hours,
+    'parse_posted_date': case_parse_posted_date,
+    'parse_posted_dates_batch': case_parse_posted_dates_batch,
+    'clean_text': case_clean_text,
+    'unique_keys': case_unique_keys,
+    'save_to_json': case_save_to_json,
+}
+
+
+# ==================== MEASUREMENT ====================
+def measure(case: Case, jobs: List[Dict], repeat: int, track_alloc: bool) -> Dict:
+    """Best-of-`repeat` wall time, then one tracemalloc pass (tracing slows the call down)"""
+    timings = []
+    allocated = peak = None
+    with tempfile.TemporaryDirectory(prefix='postprocess-bench-') as workdir:
+        for _ in range(repeat):
+            call = case(jobs, workdir)
+            gc.collect()
+            with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                started = time.perf_counter()
+                call()
+                timings.append(time.perf_counter() - started)
+        if track_alloc:
+            call = case(jobs, workdir)
+            gc.collect()
+            tracemalloc.start()
+            try:
+                before, _ = tracemalloc.get_traced_memory()
+                with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                    call()
+                current, peak_traced = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            allocated = current - before
+            peak = peak_traced - before
+    best = min(timings)
+    return {
+        'seconds': round(best, 6),
+        'mean_seconds': round(sum(timings) / len(timings), 6),
+        'us_per_job': round(best / len(jobs) * 1e6, 3),
+        'retained_mb': round(allocated / 1e6, 2) if allocated is not None else None,
+        'peak_alloc_mb': round(peak / 1e6, 2) if peak is not None else None,
+    }
+
+
+# ==================== HISTORY ====================
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=HERE, capture_output=True,
+                              text=True, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def last_results(history_file: str) -> Dict[Tuple[str, int], Dict]:
+    """(function, size) -> most recent recorded result"""
+    latest = {}
+    try:
+        with open(history_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    run = json.loads(line)
+                    for result in run.get('results', []):
+                        latest[(result['function'], result['size'])] = result
+    except FileNotFoundError:
+        pass
+    return latest
+
+
+def _change(current: float, previous: Optional[float]) -> str:
+    if not previous:
+        return ''
+    return f" ({(current - previous) / previous:+.0%} vs last)"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Micro-benchmarks of the post-processing hot paths")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="Job counts to test")
+    parser.add_argument('--functions', nargs='+', choices=list(CASES), default=list(CASES))
+    parser.add_argument('--repeat', type=int, default=3, help="Timed runs per case (best is reported)")
+    parser.add_argument('--no-alloc', action='store_true', help="Skip the tracemalloc pass")
+    parser.add_argument('--history', default=HISTORY_FILE, help="JSON-lines file every run is appended to")
+    parser.add_argument('--note', default='', help="Free-text label stored with the run")
+    args = parser.parse_args()
+
+    previous = last_results(args.history)
+    results = []
+    print("=" * 60)
+    print("⏱️  POST-PROCESSING BENCHMARKS")
+    print("=" * 60)
+    for size in args.sizes:
+        print(f"\n📦 {size:,} jobs")
+        jobs = synthetic_jobs(size)
+        repeat = args.repeat if size < 1_000_000 else 1
+        for name in args.functions:
+            result = dict(function=name, size=size,
+                          **measure(CASES[name], jobs, repeat, track_alloc=not args.no_alloc))
+            results.append(result)
+            last = previous.get((name, size), {})
+            alloc = (f", peak {result['peak_alloc_mb']} MB allocated"
+                     if result['peak_alloc_mb'] is not None else "")
+            print(f"  {name:<34} {result['seconds']:>9.3f}s  {result['us_per_job']:>9.2f} µs/job"
+                  f"{_change(result['seconds'], last.get('seconds'))}{alloc}")
+        del jobs
+        gc.collect()
+
+    run = {
+        'run_at': datetime.now().isoformat(),
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'machine': f"{platform.system()} {platform.machine()} ({os.cpu_count()} CPUs)",
+        'note': args.note,
+        'results': results,
+    }
+    with open(args.history, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(run) + '\n')
+    print(f"\n📈 Run appended to {args.history}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
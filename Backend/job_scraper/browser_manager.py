@@ -0,0 +1,255 @@
+"""
+Persistent Browser Manager
+Keeps one warm Chromium alive for the API service instead of launching per request
+"""
+
+import asyncio
+import threading
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional
+
+from playwright.async_api import async_playwright, Browser, BrowserContext
+
+from config import (
+    BROWSER_LAUNCH_ARGS,
+    BROWSER_RECYCLE_PAGES,
+    BROWSER_RECYCLE_RSS_MB,
+    BROWSER_HEALTH_INTERVAL,
+)
+from memory_monitor import process_tree_rss_mb
+from browser_watchdog import close_or_kill, launch_browser
+from event_log import get_logger
+
+logger = get_logger(__name__)
+
+
+class BrowserManager:
+    """
+    Long-lived Chromium owned by the service
+
+    The browser lives on a dedicated event loop thread, because Flask runs
+    every request in its own asyncio.run() and a Playwright browser cannot be
+    shared across event loops. Requests submit their scrape coroutine with
+    run(); scrapers lease the browser and open fresh contexts in it.
+
+    The browser is recycled (closed and relaunched once no scrape is using
+    it) after `max_pages` pages or when the process tree goes above
+    `max_rss_mb`, and relaunched automatically if it crashes.
+    """
+
+    def __init__(
+        self,
+        headless: bool = True,
+        launch_args: Optional[List[str]] = None,
+        max_pages: int = BROWSER_RECYCLE_PAGES,
+        max_rss_mb: float = BROWSER_RECYCLE_RSS_MB,
+        health_interval: float = BROWSER_HEALTH_INTERVAL
+    ):
+        """
+        Args:
+            headless: Run browser in headless mode
+            launch_args: Extra Chromium command line flags
+            max_pages: Recycle after this many pages were opened
+            max_rss_mb: Recycle when process tree RSS exceeds this (MB)
+            health_interval: Seconds between background health checks (0 disables)
+        """
+        self.headless = headless
+        self.launch_args = list(BROWSER_LAUNCH_ARGS if launch_args is None else launch_args)
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb
+        self.health_interval = health_interval
+
+        self.stats = {
+            'launches': 0,
+            'recycles': 0,
+            'crashes': 0,
+            'kills': 0,  # Browsers that hung on close and had their processes killed
+            'pages_served': 0,
+            'last_health_check': None,
+            'last_health_ok': None,
+        }
+        self._pages_since_launch = 0
+        self._active_leases = 0
+        self._recycle_pending = False
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._lock: Optional[asyncio.Lock] = None
+        self._playwright = None
+        self._browser: Optional[Browser] = None
+        self._health_task: Optional[asyncio.Task] = None
+
+    # ==================== EVENT LOOP THREAD ====================
+    def start(self):
+        """Start the manager's event loop thread (idempotent, the browser launches lazily)"""
+        with self._start_lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=self._loop.run_forever, name='browser-manager', daemon=True)
+            self._thread.start()
+            asyncio.run_coroutine_threadsafe(self._init_loop_state(), self._loop).result()
+
+    async def _init_loop_state(self):
+        self._lock = asyncio.Lock()
+        if self.health_interval:
+            self._health_task = asyncio.create_task(self._health_loop())
+
+    def run(self, coro, timeout: Optional[float] = None):
+        """Run a coroutine on the manager's loop from any thread and return its result"""
+        self.start()
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        return future.result(timeout)
+
+    def shutdown(self):
+        """Close the browser and stop the loop thread"""
+        if not self._loop or not self._thread or not self._thread.is_alive():
+            return
+        try:
+            self.run(self._stop(), timeout=30)
+        except Exception as e:
+            logger.warning("⚠️ Browser manager shutdown error: %s", e)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+
+    async def _stop(self):
+        if self._health_task:
+            self._health_task.cancel()
+        await self._close_browser()
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
+
+    # ==================== BROWSER LIFECYCLE ====================
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[Browser]:
+        """
+        Yield the shared browser for one scrape (must run on the manager's loop)
+
+        Callers open their own contexts and close them when done; the
+        browser itself is never closed by a caller.
+        """
+        async with self._lock:
+            if self._recycle_pending and self._active_leases == 0:
+                await self._recycle()
+            if not self.is_connected():
+                await self._launch()
+            self._active_leases += 1
+            browser = self._browser
+
+        try:
+            yield browser
+        finally:
+            self._active_leases -= 1
+            self._check_recycle()
+            if self._recycle_pending and self._active_leases == 0:
+                async with self._lock:
+                    if self._recycle_pending and self._active_leases == 0:
+                        await self._recycle()
+
+    def track_context(self, context: BrowserContext):
+        """Count pages opened in a context handed out by this manager"""
+        context.on('page', lambda _page: self._on_page_opened())
+
+    def is_connected(self) -> bool:
+        return self._browser is not None and self._browser.is_connected()
+
+    def _on_page_opened(self):
+        self.stats['pages_served'] += 1
+        self._pages_since_launch += 1
+        if self.max_pages and self._pages_since_launch >= self.max_pages:
+            self._recycle_pending = True
+
+    def _on_disconnected(self, browser: Browser):
+        if browser is self._browser:
+            self.stats['crashes'] += 1
+            self._browser = None
+            logger.warning("⚠️ Shared browser disconnected - will relaunch on next lease")
+
+    def _check_recycle(self):
+        if self.max_rss_mb and process_tree_rss_mb() > self.max_rss_mb:
+            self._recycle_pending = True
+
+    async def _launch(self):
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        self._browser = await launch_browser(self._playwright.chromium, headless=self.headless, args=self.launch_args)
+        self._browser.on('disconnected', self._on_disconnected)
+        self._pages_since_launch = 0
+        self._recycle_pending = False
+        self.stats['launches'] += 1
+        logger.info("🌐 Shared browser launched (launch #%d)", self.stats['launches'])
+
+    async def _recycle(self):
+        logger.info("♻️ Recycling shared browser after %d pages (%.0f MB RSS)",
+                    self._pages_since_launch, process_tree_rss_mb())
+        self.stats['recycles'] += 1
+        await self._close_browser()
+        self._recycle_pending = False
+
+    async def _close_browser(self):
+        browser, self._browser = self._browser, None
+        if browser is not None and await close_or_kill(browser):
+            self.stats['kills'] += 1
+
+    # ==================== HEALTH CHECKS ====================
+    async def health_check(self, timeout: float = 10) -> bool:
+        """
+        Open and close a throwaway context; relaunch the browser if it does not respond
+
+        A slow ping under load does not mean the browser is gone, so while
+        scrapes hold a lease it is only marked for recycling (done when the
+        last lease is released) instead of being closed under them.
+        """
+        self.stats['last_health_check'] = datetime.now().isoformat()
+        if self._browser is None:
+            self.stats['last_health_ok'] = None  # Not launched yet
+            return True
+
+        try:
+            async def ping():
+                context = await self._browser.new_context()
+                await context.close()
+            await asyncio.wait_for(ping(), timeout=timeout)
+            self.stats['last_health_ok'] = True
+            return True
+        except Exception as e:
+            self.stats['last_health_ok'] = False
+            reason = str(e) or type(e).__name__
+            async with self._lock:
+                if self._active_leases:
+                    logger.warning("⚠️ Shared browser failed health check (%s) - "
+                                   "recycling once %d active scrape(s) finish", reason, self._active_leases)
+                    self._recycle_pending = True
+                else:
+                    logger.warning("⚠️ Shared browser failed health check (%s) - relaunching", reason)
+                    await self._close_browser()
+                    await self._launch()
+            return False
+
+    async def _health_loop(self):
+        while True:
+            await asyncio.sleep(self.health_interval)
+            try:
+                await self.health_check()
+                if self._active_leases == 0:
+                    self._check_recycle()
+                    if self._recycle_pending and self._browser is not None:
+                        async with self._lock:
+                            if self._active_leases == 0:
+                                await self._recycle()
+            except Exception as e:
+                logger.warning("⚠️ Browser health loop error: %s", e)
+
+    def status(self) -> Dict:
+        """Snapshot for the /health endpoint (does not touch the browser)"""
+        return {
+            'running': self.is_connected(),
+            'active_scrapes': self._active_leases,
+            'pages_since_launch': self._pages_since_launch,
+            'recycle_pending': self._recycle_pending,
+            'process_tree_rss_mb': round(process_tree_rss_mb(), 1),
+            **self.stats,
+        }
@@ -0,0 +1,126 @@
+"""
+Browser Watchdog
+Detects a Chromium that stopped responding, kills it and ends the affected scrape
+"""
+
+import asyncio
+import os
+import signal
+import uuid
+import weakref
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional
+
+from playwright.async_api import Browser, BrowserType
+
+from config import WATCHDOG_INTERVAL, WATCHDOG_TIMEOUT
+from deadline import Deadline, current_deadline
+from event_log import get_logger
+from memory_monitor import child_pids, process_cmdline, process_name
+
+logger = get_logger(__name__)
+
+_BROWSER_PROCESS_NAMES = ('chrome', 'chromium', 'headless_shell')
+# Chromium ignores switches it does not know; this one marks the main
+# process of each browser we launch, so a kill never hits another browser
+_BROWSER_ID_SWITCH = '--scraper-browser-id='
+_browser_ids: 'weakref.WeakKeyDictionary[Browser, str]' = weakref.WeakKeyDictionary()
+
+
+async def launch_browser(browser_type: BrowserType, **launch_kwargs) -> Browser:
+    """Launch a browser whose processes kill_browser_processes can find"""
+    browser_id = uuid.uuid4().hex
+    args = list(launch_kwargs.pop('args', None) or []) + [f'{_BROWSER_ID_SWITCH}{browser_id}']
+    browser = await browser_type.launch(args=args, **launch_kwargs)
+    _browser_ids[browser] = browser_id
+    return browser
+
+
+def browser_pids(browser: Browser) -> List[int]:
+    """Main process and descendants of a browser started by launch_browser ([] if not found)"""
+    browser_id = _browser_ids.get(browser)
+    if browser_id is None:
+        return []
+    switch = f'{_BROWSER_ID_SWITCH}{browser_id}'
+    for pid in child_pids():
+        if any(name in process_name(pid).lower() for name in _BROWSER_PROCESS_NAMES) \
+                and switch in process_cmdline(pid):
+            return [pid] + child_pids(pid)
+    return []
+
+
+def kill_browser_processes(browser: Browser) -> List[int]:
+    """SIGKILL the processes of one browser (see launch_browser); returns the killed pids"""
+    killed = []
+    for pid in browser_pids(browser):  # Listed before killing, while children still have their parent
+        try:
+            os.kill(pid, signal.SIGKILL)
+            killed.append(pid)
+        except OSError:
+            pass
+    return killed
+
+
+async def close_or_kill(browser: Browser, timeout: float = 5) -> bool:
+    """Close a browser, killing its processes when close() itself hangs; True if it had to kill"""
+    try:
+        await asyncio.wait_for(browser.close(), timeout=timeout)
+        return False
+    except Exception:
+        killed = kill_browser_processes(browser)
+        logger.warning("⚠️ Browser did not close, killed %d of its Chromium processes", len(killed))
+        return True
+
+
+class BrowserWatchdog:
+    """
+    Pings a browser while a scrape uses it
+
+    A ping opens and closes a throwaway context. When a ping gets no answer
+    within `timeout` seconds the browser is killed (so every pending
+    Playwright call fails fast instead of hanging) and the scrape's deadline
+    is expired with reason 'browser_hung', which makes it return its partial
+    results. A BrowserManager relaunches the browser on the next lease.
+    """
+
+    def __init__(self, interval: float = WATCHDOG_INTERVAL, timeout: float = WATCHDOG_TIMEOUT):
+        self.interval = interval
+        self.timeout = timeout
+        self.stats = {'pings': 0, 'hangs': 0}
+
+    async def ping(self, browser: Browser) -> bool:
+        self.stats['pings'] += 1
+        try:
+            async def open_and_close():
+                context = await browser.new_context()
+                await context.close()
+            await asyncio.wait_for(open_and_close(), timeout=self.timeout)
+            return True
+        except Exception:
+            return False
+
+    async def _watch(self, browser: Browser, deadline: Optional[Deadline]):
+        while True:
+            await asyncio.sleep(self.interval)
+            if not browser.is_connected():
+                return  # Closed or crashed: pending calls fail on their own
+            if not await self.ping(browser):
+                self.stats['hangs'] += 1
+                logger.warning("⚠️ Browser unresponsive for %ss - killing it", self.timeout)
+                if deadline is not None:
+                    deadline.expire('browser_hung')
+                await close_or_kill(browser)
+                return
+
+    @asynccontextmanager
+    async def guard(self, browser: Browser) -> AsyncIterator[Browser]:
+        """Watch `browser` for the duration of the block"""
+        if not self.interval:
+            yield browser
+            return
+        task = asyncio.create_task(self._watch(browser, current_deadline()))
+        try:
+            yield browser
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
@@ -0,0 +1,228 @@
+"""
+Batch Job Card Extraction
+Reads every job card on a results page with a single page.evaluate call
+"""
+
+from typing import Dict, List, Optional
+
+from playwright.async_api import Page
+
+from config import PLATFORM_BASE_URLS
+
+# Selector fallback chains per platform.
+#
+# Each field is a list of rules tried in order; the first rule that finds an
+# element wins (even if its text is empty), like the query_selector chains
+# they replace. A rule has:
+#   selector  CSS selector inside the card (omit to use the card itself)
+#   attr      read this attribute instead of the text
+#   contains  only accept elements whose text contains one of these (case-insensitive)
+#   max_len   only accept elements whose text is shorter than this
+#   split     keep the text before this separator
+#   regex     keep the first regex match (rule is skipped when nothing matches)
+CARD_SPECS = {
+    'SimplyHired': {
+        'card': 'div[data-testid="searchSerpJob"]',
+        'required': ['title'],
+        'fields': {
+            'title': [{'selector': 'h2[data-testid="searchSerpJobTitle"] a'}],
+            'url': [{'selector': 'h2[data-testid="searchSerpJobTitle"] a', 'attr': 'href'}],
+            'company': [
+                {'selector': 'span[data-testid="companyName"]'},
+                {'selector': 'p.chakra-text', 'contains': ['—'], 'split': '—'},
+            ],
+            'location': [
+                {'selector': 'span[data-testid="searchSerpJobLocation"]'},
+                {'selector': 'p.chakra-text.css-1sawo7p'},
+            ],
+            'salary': [{'selector': 'p[data-testid="searchSerpJobSalaryConfirmed"]'}],
+            'date_text': [
+                {'selector': 'p[data-testid="searchSerpJobDateStamp"]'},
+                {'selector': 'span.css-5yilgw'},
+            ],
+            'snippet': [
+                {'selector': 'p[data-testid="searchSerpJobSnippet"]'},
+                {'selector': 'p.chakra-text.css-jhqp7z'},
+            ],
+        },
+    },
+    'Talent.com': {
+        'card': 'section[data-testid^="jobcard-container"]',
+        'required': ['title', 'url'],
+        'fields': {
+            'title': [
+                {'selector': 'h2[color="#30183F"]'},
+                {'selector': 'h2.sc-fcd630a4-20'},
+            ],
+            'url': [
+                {'selector': 'a[href*="/view?id="]', 'attr': 'href'},
+                {'selector': 'a.sc-d93925ca-5', 'attr': 'href'},
+            ],
+            'company': [
+                {'selector': 'span[color="#691F74"]'},
+                {'selector': 'span.sc-fcd630a4-12'},
+            ],
+            'location': [
+                {'selector': 'span[color="#222222"]'},
+                {'selector': 'span.sc-fcd630a4-11'},
+            ],
+            # "Last updated: X day ago" in the card header
+            'date_text': [
+                {'selector': 'span.sc-fcd630a4-5', 'contains': ['ago']},
+                {'selector': 'span.sc-fcd630a4-6', 'contains': ['ago']},
+                {'selector': 'span', 'contains': ['ago', 'day', 'hour'], 'max_len': 50},
+            ],
+            'salary': [
+                {'regex': r'\$[\d,]+(?:\s*-\s*\$[\d,]+)?(?:\s*(?:per|/)\s*(?:hour|year|annum))?'},
+            ],
+            'snippet': [{'selector': 'span[class*="sc-fcd630a4-5"]', 'split': 'Show more'}],
+        },
+    },
+    # One results list that grows in place ("Show more jobs"); no detail pages
+    'Glassdoor': {
+        'card': 'li[data-test="jobListing"]',
+        'required': ['title'],
+        'load_more': ['button:has-text("Show more jobs")', 'button.button_Button__o_a9q'],
+        # Bot walls (Cloudflare challenge, PerimeterX, hCaptcha) checked instead of the page HTML
+        'block': ', '.join([
+            'iframe[src*="challenges.cloudflare.com"]', '#challenge-form', '#challenge-running',
+            '.cf-turnstile', '#px-captcha', 'iframe[src*="captcha"]', 'iframe[title*="hCaptcha"]',
+        ]),
+        'fields': {
+            'listing_id': [{'attr': 'data-jobid'}],
+            'title': [
+                {'selector': 'a[data-test="job-title"]'},
+                {'selector': 'a.JobCard_jobTitle__GLyJ1'},
+            ],
+            'url': [
+                {'selector': 'a[data-test="job-title"]', 'attr': 'href'},
+                {'selector': 'a.JobCard_jobTitle__GLyJ1', 'attr': 'href'},
+            ],
+            'company': [
+                {'selector': 'span[data-test="employer-name"]'},
+                {'selector': 'div.EmployerProfile_profileContainer__28h9t span'},
+            ],
+            'location': [
+                {'selector': 'div[data-test="emp-location"]'},
+                {'selector': 'div.JobCard_location__Ds1fM'},
+            ],
+            'salary': [
+                {'selector': 'div[data-test="detailSalary"]'},
+                {'selector': 'div.JobCard_salaryEstimate__OpbTW'},
+            ],
+            'snippet': [
+                {'selector': 'div[data-test="descSnippet"]'},
+                {'selector': 'div.JobCard_jobDescriptionSnippet__l1tnl'},
+            ],
+        },
+    },
+}
+
+_EXTRACT_CARDS_JS = """
+([cardSelector, fields, start]) => {
+    const filtered = rule => rule.contains || rule.max_len;
+    const accepts = (el, rule) => {
+        const text = el.innerText || '';
+        if (rule.contains && !rule.contains.some(c => text.toLowerCase().includes(c.toLowerCase()))) return false;
+        if (rule.max_len && text.length >= rule.max_len) return false;
+        return true;
+    };
+    const valueOf = (el, rule) => {
+        let value = rule.attr ? el.getAttribute(rule.attr) : el.innerText;
+        if (value == null) return null;
+        if (rule.split) value = value.split(rule.split)[0].trim();
+        if (rule.regex) {
+            const match = value.match(new RegExp(rule.regex));
+            return match ? match[0] : undefined;
+        }
+        return value;
+    };
+    const extract = (card, rules) => {
+        for (const rule of rules) {
+            let candidates;
+            if (!rule.selector) candidates = [card];
+            else if (filtered(rule)) candidates = Array.from(card.querySelectorAll(rule.selector));
+            else candidates = [card.querySelector(rule.selector)].filter(Boolean);
+            for (const el of candidates) {
+                if (!accepts(el, rule)) continue;
+                const value = valueOf(el, rule);
+                if (value !== undefined) return value;
+            }
+        }
+        return null;
+    };
+    return Array.from(document.querySelectorAll(cardSelector)).slice(start).map(card => {
+        const out = {};
+        for (const [name, rules] of Object.entries(fields)) out[name] = extract(card, rules);
+        return out;
+    });
+}
+"""
+
+
+async def extract_cards(page: Page, platform: str, start: int = 0) -> List[Dict]:
+    """
+    Return raw {title, url, company, location, salary, date_text, snippet} for
+    every card on the current results page in one browser round-trip. `start`
+    skips the cards before that index (already read from a growing list).
+    """
+    spec = CARD_SPECS[platform]
+    return await page.evaluate(_EXTRACT_CARDS_JS, [spec['card'], spec['fields'], start])
+
+
+def normalise_card(card: Dict, platform: str, default_location: str,
+                   base_url: Optional[str] = None) -> Optional[Dict]:
+    """
+    Apply the scrapers' defaults to a raw card: absolute URL (on `base_url`,
+    default PLATFORM_BASE_URLS), "Unknown" company, search location, "Not
+    specified" salary. Returns None when a required field (title, and URL for
+    Talent.com) is missing. `posted_at` is the exact ISO timestamp, only
+    present for cards read from the page state.
+    """
+    spec = CARD_SPECS[platform]
+    if any(not card.get(field) for field in spec['required']):
+        return None
+
+    url = card.get('url')
+    if url and not url.startswith('http'):
+        url = f"{base_url or PLATFORM_BASE_URLS[platform]}{url}"
+
+    return {
+        'title': card['title'],
+        'url': url,
+        'company': card.get('company') or "Unknown",
+        'location': card.get('location') or default_location,
+        'salary': card.get('salary') or "Not specified",
+        'date_text': card.get('date_text'),
+        'snippet': card.get('snippet') or "",
+        'posted_at': card.get('posted_at'),
+        'listing_id': card.get('listing_id'),
+    }
+
+
+# Detail page selector chains (used by the HTTP fast path and the browser waits):
+# the first match longer than `min_chars` wins, otherwise the last non-empty text.
+DETAIL_SPECS = {
+    'SimplyHired': {
+        'description': [
+            'aside[class*="css-"] div[class*="scroll"]',
+            'aside[class*="css-"]',
+            'div[tabindex="0"][class*="scroll"]',
+            'div.css-10747oj',
+            'div[data-testid="viewJobBodyContainer"]',
+        ],
+        'min_chars': 300,
+        'date': 'span[data-testid="viewJobBodyPostingTimestamp"]',
+    },
+    'Talent.com': {
+        'description': [
+            'div.sc-fcd630a4-10.sc-fcd630a4-11.sc-6cde2aa1-10.cgBMEk.iroSSa.bEMPBB',
+            'div[class*="fcd630a4"]',
+            'div[class*="cgBMEk"]',
+            'span[class*="sc-fcd630a4-15"]',
+            'article, main, div[class*="jobcard"]',
+        ],
+        'min_chars': 100,
+        'date': None,
+    },
+}
@@ -0,0 +1,114 @@
+"""
+Scrape Checkpoints
+Durable per-(platform, keyword) progress so an interrupted run can resume where it stopped
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, Iterable, Optional
+
+from config import CHECKPOINT_FILE, CHECKPOINT_MAX_AGE_HOURS
+from event_log import get_logger
+
+log = get_logger(__name__)
+
+
+def checkpoint_path(base: str, *parts: str) -> str:
+    """
+    Checkpoint file of one scrape configuration (e.g. platform, location and
+    keywords): concurrent scrapes of different searches never share a file,
+    and a resumed request finds the progress of the same search
+    """
+    digest = hashlib.sha1('|'.join(part.lower().strip() for part in parts).encode()).hexdigest()[:12]
+    root, ext = os.path.splitext(base)
+    return f"{root}-{digest}{ext}"
+
+
+class ScrapeCheckpoint:
+    """
+    JSON file of keyword progress
+
+    Each (platform, keyword, location) entry holds the URL and number of the
+    next results page, the unique keys of the jobs already scraped, and
+    whether the keyword finished. Entries older than `max_age_hours` are
+    ignored, so yesterday's finished run does not stop today's.
+
+    update() only changes the entries in memory; save() rewrites the file
+    atomically (the scraper saves once per keyword and at the end of a run).
+    """
+
+    def __init__(self, path: str = CHECKPOINT_FILE, max_age_hours: float = CHECKPOINT_MAX_AGE_HOURS):
+        self.path = path
+        self.max_age = max_age_hours * 3600
+        self.entries: Dict[str, Dict] = self._load()
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(platform: str, keyword: str, location: str) -> str:
+        return f"{platform}|{keyword.lower().strip()}|{location.lower().strip()}"
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f).get('entries', {})
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            log.warning("⚠️ Ignoring unreadable checkpoint %s: %s", self.path, e)
+            return {}
+
+    def save(self):
+        """Write the entries if they changed since the last save"""
+        with self._lock:
+            if not self._dirty:
+                return
+            tmp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'updated_at': time.time(), 'entries': self.entries}, f)
+            os.replace(tmp_path, self.path)  # Atomic: a crash leaves the old or the new file
+            self._dirty = False
+
+    def get(self, platform: str, keyword: str, location: str) -> Optional[Dict]:
+        """Progress of a keyword, or None when there is no recent entry"""
+        entry = self.entries.get(self._key(platform, keyword, location))
+        if entry is None or time.time() - entry['updated_at'] > self.max_age:
+            return None
+        return entry
+
+    def update(self, platform: str, keyword: str, location: str, next_url: Optional[str],
+               page_num: int, new_keys: Iterable[str], done: bool = False):
+        """
+        Record that `page_num` (at `next_url`) is the next page to scrape and
+        add the keys of the page just scraped (in memory, see save). An update
+        for page 2 starts the keyword over, dropping the keys of older runs.
+        """
+        key = self._key(platform, keyword, location)
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None or page_num <= 2:
+                entry = self.entries[key] = {'seen_keys': []}
+            entry['seen_keys'].extend(new_keys)
+            entry.update(next_url=next_url, page_num=page_num, done=done or not next_url, updated_at=time.time())
+            self._dirty = True
+
+    def clear(self):
+        """Forget all progress (e.g. after a run completed and was saved)"""
+        with self._lock:
+            self.entries = {}
+            self._dirty = False
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+    def summary(self) -> Dict:
+        entries = [entry for entry in self.entries.values() if time.time() - entry['updated_at'] <= self.max_age]
+        return {
+            'keywords': len(entries),
+            'done': sum(1 for entry in entries if entry['done']),
+            'seen_keys': sum(len(entry['seen_keys']) for entry in entries),
+        }
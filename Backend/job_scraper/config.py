@@ -1,5 +1,7 @@
 # Configuration file for job scraper
 
+import os
+
 SEARCH_KEYWORDS = [
     'python developer',
     'data scientist',
@@ -17,10 +19,128 @@ LOCATIONS = {
     'Remote': 'Remote'
 }
 
+# Site roots; the env vars point the scraper at a staging or fixture server (see fixture_server.py)
+PLATFORM_BASE_URLS = {
+    'SimplyHired': os.getenv('SIMPLYHIRED_BASE_URL', 'https://www.simplyhired.com'),
+    'Talent.com': os.getenv('TALENT_BASE_URL', 'https://www.talent.com'),
+    'Glassdoor': os.getenv('GLASSDOOR_BASE_URL', 'https://www.glassdoor.com'),
+}
+
 # Scraping settings
 HEADLESS_MODE = False  # Set to True for production
 MAX_PAGES_PER_KEYWORD = 2
 MAX_JOBS_GLASSDOOR = 20
+KEYWORD_CONCURRENCY = 4  # Keyword searches run at once (pages in one shared browser)
+STREAM_BUFFER = 50  # Finished jobs stream_jobs holds for a slow consumer before scraping pauses
+
+# Memory-budget scheduler for (platform, keyword) tasks (scrape_all_platforms)
+MEMORY_BUDGET_MB = 450  # Process tree RSS (Chromium included) to stay under; Render free tier has 512
+MEMORY_TASK_ESTIMATE_MB = 60  # Initial guess per running task, raised to the growth actually observed
+MEMORY_MAX_PARALLEL_TASKS = 8  # Upper bound even when memory is plentiful
+MEMORY_SAMPLE_INTERVAL = 1.0  # Seconds between RSS samples / admission checks
+
+# Incremental crawl: stop paginating a keyword once a page is mostly known or stale
+INCREMENTAL_STOP_FRACTION = 0.8  # Share of known/stale cards on a page that ends the keyword
+INCREMENTAL_CUTOFF_HOURS = 24  # Cards posted before this are stale (matches filter_last_24_hours)
+
+# Detail page fetch pool (full descriptions)
+DETAIL_POOL_SIZE = {  # Reusable tabs per platform = max concurrent detail pages
+    'SimplyHired': 4,
+    'Talent.com': 6,
+}
+DETAIL_FETCH_TIMEOUT = 25  # Seconds per detail URL (navigation + extraction)
+
+# Description cache (skips detail pages already read in earlier runs)
+DESCRIPTION_CACHE = True
+DESCRIPTION_CACHE_PATH = 'description_cache.db'
+DESCRIPTION_CACHE_TTL_HOURS = 72  # Re-fetch descriptions older than this
+DESCRIPTION_CACHE_MAX_ENTRIES = 20000  # Least recently used entries beyond this are evicted
+DESCRIPTION_CACHE_TOUCH_BATCH = 100  # New entries / hit access times written in one commit (flush() writes sooner)
+
+# HTTP fast path: plain HTTP + HTML parsing, browser only when blocked
+HTTP_FAST_PATH = True  # No effect unless httpx and selectolax are installed
+HTTP_MAX_CONNECTIONS = 10  # Pooled keep-alive connections
+HTTP_TIMEOUT = 20  # Seconds per HTTP request
+HTTP_ESCALATE_AFTER = 3  # Failed detail fetches in a row (not blocks) before details go to the browser
+
+# Adaptive per-domain rate limiting: additive increase while healthy, multiplicative decrease on blocks
+RATE_LIMIT_INITIAL_RPS = 2.0  # Requests/second per domain at the start of a run
+RATE_LIMIT_MIN_RPS = 0.1
+RATE_LIMIT_MAX_RPS = 8.0
+RATE_LIMIT_INCREASE = 0.1  # Requests/second added per healthy response
+RATE_LIMIT_DECREASE = 0.5  # Rate multiplier on a 429 / CAPTCHA / empty results page
+RATE_LIMIT_BLOCK_COOLDOWN = 15  # Seconds a domain pauses after a block (doubles per consecutive block)
+RATE_LIMIT_MAX_COOLDOWN = 240
+RATE_LIMIT_JITTER = 0.3  # +/- share of the interval, so requests do not arrive on a fixed beat
+
+# Shared warm browser (API service)
+BROWSER_LAUNCH_ARGS = [
+    '--disable-blink-features=AutomationControlled',
+    '--disable-dev-shm-usage',
+]
+# Glassdoor's bot checks need more (a browser shared with it gets these too)
+GLASSDOOR_LAUNCH_ARGS = BROWSER_LAUNCH_ARGS + [
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-web-security',
+    '--disable-features=IsolateOrigins,site-per-process',
+]
+BROWSER_RECYCLE_PAGES = 300  # Relaunch Chromium after this many pages
+BROWSER_RECYCLE_RSS_MB = 420  # ...or when process tree RSS exceeds this
+BROWSER_HEALTH_INTERVAL = 60  # Seconds between background health checks
+WATCHDOG_INTERVAL = 15  # Seconds between pings of a browser in use (0 disables the watchdog)
+WATCHDOG_TIMEOUT = 10  # A ping unanswered this long means Chromium is hung and gets killed
+
+# Network resource blocking (we only read text from result cards / detail pages)
+_BLOCKED_TYPES = ['image', 'media', 'font', 'stylesheet']
+_TRACKER_DOMAINS = [
+    'google-analytics.com', 'googletagmanager.com', 'doubleclick.net',
+    'googlesyndication.com', 'googleadservices.com', 'adservice.google.com',
+    'facebook.net', 'facebook.com', 'bat.bing.com', 'clarity.ms', 'hotjar.com',
+    'amazon-adsystem.com', 'criteo.com', 'criteo.net', 'taboola.com',
+    'outbrain.com', 'segment.io', 'nr-data.net', 'newrelic.com', 'quantserve.com',
+]
+# Set a platform's allowed_domains to None to allow all non-denied hosts; the host of its
+# PLATFORM_BASE_URLS entry is always allowed (ResourceBlocker adds it)
+RESOURCE_BLOCKING = {
+    'SimplyHired': {
+        'blocked_types': _BLOCKED_TYPES,
+        'blocked_domains': _TRACKER_DOMAINS,
+        'allowed_domains': ['simplyhired.com', 'indeed.com', 'indeed.net'],
+    },
+    'Talent.com': {
+        'blocked_types': _BLOCKED_TYPES,
+        'blocked_domains': _TRACKER_DOMAINS,
+        'allowed_domains': ['talent.com'],
+    },
+    'Glassdoor': {  # Its bot checks load scripts from third-party hosts, so only trackers are denied
+        'blocked_types': _BLOCKED_TYPES,
+        'blocked_domains': _TRACKER_DOMAINS,
+        'allowed_domains': None,
+    },
+}
+ESTIMATED_RESOURCE_BYTES = {  # Typical transfer size per aborted request, for the savings report
+    'image': 40000,
+    'media': 200000,
+    'font': 30000,
+    'stylesheet': 25000,
+    'script': 60000,
+    'other': 5000,
+}
+
+# Checkpoint / resume of interrupted runs
+CHECKPOINT_FILE = 'scrape_checkpoint.json'
+CHECKPOINT_MAX_AGE_HOURS = 12  # Older progress is ignored (the next daily run starts fresh)
+
+# Session record / replay (offline benchmarks and regression runs)
+SESSION_ARCHIVE_PATH = 'session_archive.db'
+REPLAY_LATENCY_MS = 0  # Per replayed response: ms, a (min, max) range, or None for the recorded timing
+
+# Logging (event_log.configure_logging)
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
+LOG_LEVELS = os.getenv('LOG_LEVELS', '')  # Per subsystem, e.g. "scraper.jobs=DEBUG,browser_manager=WARNING"
+LOG_FORMAT = os.getenv('LOG_FORMAT', 'json')  # 'json' lines or human-readable 'text'
+LOG_MODE = os.getenv('LOG_MODE', 'full')  # 'summary': one line per results page, no per-job events
 
 # Output settings
 OUTPUT_FILE = 'jobs_output.json'
\ No newline at end of file
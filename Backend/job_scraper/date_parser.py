@@ -0,0 +1,171 @@
+"""
+Posted-Date Parsing
+Turns the date texts job boards show ("2d", "3 hours ago", "Last updated: 1
+day ago", "Posted Jan 5, 2025") into datetimes against one reference time per
+run. Every pattern is compiled once, the parse of each distinct normalised
+text is memoised, and nothing is printed.
+"""
+
+import re
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple, Union
+
+# Relative ages. One alternation, longer unit names first so "2 months"
+# is not read as 2 minutes ("m"); "30+ days" counts as 30 days and a unit
+# must end its word, so "5 dec 2025" is not 5 days.
+_RELATIVE_RE = re.compile(
+    r'(\d+)\+?\s*(?:'
+    r'(?P<months>months?|mo)|'
+    r'(?P<minutes>minutes?|mins?|m)|'
+    r'(?P<hours>hours?|hrs?|h)|'
+    r'(?P<days>days?|d)|'
+    r'(?P<weeks>weeks?|wks?|w)'
+    r')(?![a-z])'
+)
+_UNIT_SECONDS = {
+    'minutes': 60,
+    'hours': 3600,
+    'days': 86400,
+    'weeks': 7 * 86400,
+    'months': 30 * 86400,  # approximate
+}
+
+# Absolute dates: "jan 5, 2025" / "january 5th", "5 jan 2025", "01/05/2025" (US order)
+_MONTHS = {name: number for number, name in enumerate(
+    ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'], start=1)}
+_MONTH = r'(?P<month>jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?'
+_DAY = r'(?P<day>\d{1,2})(?:st|nd|rd|th)?'
+_YEAR = r'(?:,?\s*(?P<year>\d{4}))?'
+_ABSOLUTE_RES = (
+    re.compile(r'\b' + _MONTH + r'\s+' + _DAY + r'\b' + _YEAR),
+    re.compile(r'\b' + _DAY + r'\s+' + _MONTH + _YEAR),
+    re.compile(r'\b(?P<month>\d{1,2})/(?P<day>\d{1,2})/(?P<year>\d{4}|\d{2})\b'),
+)
+_ISO_RE = re.compile(r'\d{4}-\d{2}-\d{2}(?:[t ][\d:.]+)?')
+
+_NOW_TEXTS = ('just posted', 'today')
+_PREFIX = 'last updated:'
+MAX_DATE_TEXT = 100  # longer texts are page content, not a date
+
+# What a normalised text means: ('ago', seconds), ('at', datetime),
+# ('on', (month, day)) or ('now', 0)
+Parsed = Tuple[str, object]
+
+
+def normalise(date_text: str) -> str:
+    """Lower-cased, prefix-free form the parse is memoised on"""
+    text = date_text.lower().strip()
+    if text.startswith(_PREFIX):
+        text = text[len(_PREFIX):].strip()
+    return text
+
+
+def _absolute(text: str) -> Union[datetime, Tuple[int, int], None]:
+    """Datetime of an absolute date, (month, day) when it has no year, or None"""
+    iso = _ISO_RE.search(text)
+    if iso:
+        try:
+            return datetime.fromisoformat(iso.group(0).replace('t', 'T'))
+        except ValueError:
+            pass
+    for pattern in _ABSOLUTE_RES:
+        match = pattern.search(text)
+        if not match:
+            continue
+        month = match.group('month')
+        month = _MONTHS[month] if month in _MONTHS else int(month)
+        day, year = int(match.group('day')), match.group('year')
+        if year is None:
+            # "Jan 5": the year is resolved against the reference time
+            if 1 <= month <= 12 and 1 <= day <= 31:
+                return month, day
+            continue
+        year = int(year)
+        try:
+            return datetime(year + 2000 if year < 100 else year, month, day)
+        except ValueError:
+            continue
+    return None
+
+
+@lru_cache(maxsize=4096)
+def parse_normalised(text: str) -> Optional[Parsed]:
+    """Meaning of a normalise()d date text, independent of the reference time (None if unparseable)"""
+    if not text or len(text) > MAX_DATE_TEXT:
+        return None
+    if any(marker in text for marker in _NOW_TEXTS):
+        return ('now', 0)
+    if 'yesterday' in text:
+        return ('ago', _UNIT_SECONDS['days'])
+    match = _RELATIVE_RE.search(text)
+    if match:
+        return ('ago', int(match.group(1)) * _UNIT_SECONDS[match.lastgroup])
+    absolute = _absolute(text)
+    if isinstance(absolute, datetime):
+        return ('at', absolute)
+    if absolute is not None:
+        return ('on', absolute)
+    return None
+
+
+class DateParser:
+    """
+    Posted-date parser bound to one reference time
+
+    Every relative date of a run is measured from the same `now` (set at
+    construction or by reset()), so two cards showing "3 hours ago" get the
+    same timestamp. Unparseable and empty texts resolve to `now`, like the
+    old parser, and are counted in `stats`.
+    """
+
+    def __init__(self, now: Optional[datetime] = None):
+        self.stats = {'parsed': 0, 'unparsed': 0}
+        self.reset(now)
+
+    def reset(self, now: Optional[datetime] = None):
+        """Start a new run measured from `now` (the current time by default)"""
+        self.now = now or datetime.now()
+        self._now_epoch = self.now.timestamp()
+
+    def parse(self, date_text: Optional[str]) -> datetime:
+        parsed = parse_normalised(normalise(date_text)) if date_text else None
+        if parsed is None:
+            self.stats['unparsed'] += 1
+            return self.now
+        self.stats['parsed'] += 1
+        kind, value = parsed
+        if kind == 'ago':
+            return self.now - timedelta(seconds=value)
+        if kind == 'at':
+            return value
+        if kind == 'on':
+            return self._latest(*value)
+        return self.now
+
+    def _latest(self, month: int, day: int) -> datetime:
+        """Latest `month`/`day` up to now (Feb 29 goes back to a leap year)"""
+        for year in range(self.now.year, self.now.year - 8, -1):
+            try:
+                candidate = datetime(year, month, day)
+            except ValueError:
+                continue
+            if candidate <= self.now:
+                return candidate
+        return self.now
+
+    def parse_iso(self, date_text: Optional[str]) -> str:
+        """Naive local ISO string, the format stored in job['posted_date']"""
+        return self.parse(date_text).isoformat()
+
+    def epoch(self, date_text: Optional[str]) -> float:
+        """Epoch seconds (relative ages skip the datetime arithmetic)"""
+        parsed = parse_normalised(normalise(date_text)) if date_text else None
+        if parsed is not None and parsed[0] == 'ago':
+            self.stats['parsed'] += 1
+            return self._now_epoch - parsed[1]
+        return self.parse(date_text).timestamp()
+
+    def epochs(self, date_texts: Iterable[Optional[str]]) -> List[float]:
+        """Epoch seconds of every text, in order"""
+        return [self.epoch(text) for text in date_texts]
@@ -0,0 +1,94 @@
+"""
+Request Deadlines
+A request-scoped time budget that every navigation, wait and fetch is capped by
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+_current: ContextVar[Optional['Deadline']] = ContextVar('scrape_deadline', default=None)
+
+
+class DeadlineExceeded(Exception):
+    """The request's time budget is spent; `reason` says why ('deadline', 'browser_hung', ...)"""
+
+    def __init__(self, reason: str = 'deadline'):
+        super().__init__(reason)
+        self.reason = reason
+
+
+class Deadline:
+    """
+    Point in time a scrape has to finish by
+
+    Set it with deadline_scope(); tasks started inside the scope inherit it
+    (contextvars), so the browser waits, detail pool and HTTP client all see
+    the same object. expire() ends it early, e.g. when the watchdog kills a
+    hung browser.
+    """
+
+    def __init__(self, seconds: float, reason: str = 'deadline'):
+        self.expires_at = time.monotonic() + seconds
+        self.reason = reason
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def check(self):
+        """Raise DeadlineExceeded when no time is left"""
+        if self.expired:
+            raise DeadlineExceeded(self.reason)
+
+    def cap(self, seconds: float) -> float:
+        """`seconds`, shortened to what is left of the budget"""
+        self.check()
+        return min(seconds, self.remaining())
+
+    def expire(self, reason: str):
+        """End the deadline now (the first reason wins)"""
+        if not self.expired:
+            self.reason = reason
+            self.expires_at = time.monotonic()
+
+
+def current_deadline() -> Optional[Deadline]:
+    return _current.get()
+
+
+@contextmanager
+def deadline_scope(seconds: float) -> Iterator[Deadline]:
+    """
+    Run the enclosed scrape (and every task it starts) under a `seconds`
+    budget; a nested scope never outlasts the enclosing one
+    """
+    outer = _current.get()
+    deadline = Deadline(min(seconds, outer.remaining()) if outer is not None else seconds)
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current.reset(token)
+
+
+def check_deadline():
+    """Raise DeadlineExceeded when the current deadline has passed"""
+    deadline = _current.get()
+    if deadline is not None:
+        deadline.check()
+
+
+def cap_seconds(seconds: float) -> float:
+    """Timeout in seconds capped by the current deadline (unchanged without one)"""
+    deadline = _current.get()
+    return deadline.cap(seconds) if deadline is not None else seconds
+
+
+def cap_ms(milliseconds: float) -> float:
+    """Playwright timeout in ms capped by the current deadline (never 0, which means no timeout)"""
+    return max(1.0, cap_seconds(milliseconds / 1000) * 1000)
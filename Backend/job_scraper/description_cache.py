@@ -0,0 +1,173 @@
+"""
+Description Cache
+SQLite cache of full job descriptions so repeated runs skip detail pages they already read
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from config import (
+    DESCRIPTION_CACHE_PATH, DESCRIPTION_CACHE_TTL_HOURS, DESCRIPTION_CACHE_MAX_ENTRIES,
+    DESCRIPTION_CACHE_TOUCH_BATCH,
+)
+from event_log import get_logger
+
+log = get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS descriptions (
+    url          TEXT PRIMARY KEY,
+    job_id       TEXT,
+    snippet_hash TEXT NOT NULL,
+    details      TEXT NOT NULL,
+    fetched_at   REAL NOT NULL,
+    accessed_at  REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_descriptions_job_id ON descriptions (job_id);
+CREATE INDEX IF NOT EXISTS idx_descriptions_accessed_at ON descriptions (accessed_at);
+CREATE INDEX IF NOT EXISTS idx_descriptions_fetched_at ON descriptions (fetched_at);
+"""
+
+
+def snippet_hash(snippet: Optional[str]) -> str:
+    """Fingerprint of a listing snippet (whitespace-insensitive)"""
+    normalised = ' '.join((snippet or '').split()).lower()
+    return hashlib.sha1(normalised.encode()).hexdigest()
+
+
+class DescriptionCache:
+    """
+    URL / job_id -> {'full_description': ...}
+
+    Only the description is kept: a detail page's date is relative ("3 hours
+    ago") and would be wrong when the entry is read on a later run.
+    An entry is a hit only while it is younger than `ttl_hours` and the
+    listing snippet still hashes the same; a changed snippet means the
+    posting was edited, so the detail page is fetched again. When the table
+    grows past `max_entries` the least recently used rows are evicted.
+
+    Neither hits nor put() write on their own: new entries and the access
+    times of hits are kept in memory and written in one transaction every
+    `touch_batch` of them and on flush() (the scraper flushes once per
+    results page) and close(). Eviction runs on flush() and close().
+    """
+
+    def __init__(self, path: str = DESCRIPTION_CACHE_PATH, ttl_hours: float = DESCRIPTION_CACHE_TTL_HOURS,
+                 max_entries: int = DESCRIPTION_CACHE_MAX_ENTRIES, touch_batch: int = DESCRIPTION_CACHE_TOUCH_BATCH):
+        self.path = path
+        self.ttl = ttl_hours * 3600
+        self.max_entries = max_entries
+        self.touch_batch = max(1, touch_batch)
+        self.stats = {'hits': 0, 'misses': 0, 'expired': 0, 'changed': 0, 'stored': 0, 'evicted': 0}
+        self._lock = threading.Lock()
+        self._touched: Dict[str, float] = {}  # url -> access time not yet written
+        self._pending: Dict[str, Tuple] = {}  # url -> row not yet written
+        # The API runs scrapes on the browser manager's loop thread
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+
+    def get(self, url: Optional[str], snippet: Optional[str], job_id: Optional[str] = None) -> Optional[Dict]:
+        """Cached details for a listing, or None when it must be fetched"""
+        with self._lock:
+            if self._pending:  # put() without a flush() since
+                self._write()
+            row = None
+            if url:
+                row = self._conn.execute(
+                    'SELECT url, snippet_hash, details, fetched_at FROM descriptions WHERE url = ?', (url,)
+                ).fetchone()
+            if row is None and job_id:
+                row = self._conn.execute(
+                    'SELECT url, snippet_hash, details, fetched_at FROM descriptions WHERE job_id = ? '
+                    'ORDER BY fetched_at DESC LIMIT 1', (job_id,)
+                ).fetchone()
+
+            if row is None:
+                self.stats['misses'] += 1
+                return None
+            key, cached_hash, details, fetched_at = row
+            if time.time() - fetched_at > self.ttl:
+                self.stats['expired'] += 1
+                self.stats['misses'] += 1
+                return None
+            if cached_hash != snippet_hash(snippet):
+                self.stats['changed'] += 1
+                self.stats['misses'] += 1
+                return None
+
+            self._touched[key] = time.time()
+            if len(self._touched) >= self.touch_batch:
+                self._write()
+            self.stats['hits'] += 1
+            # Rows written before dates were dropped may still hold one
+            return {'full_description': json.loads(details)['full_description']}
+
+    def put(self, url: str, snippet: Optional[str], details: Dict, job_id: Optional[str] = None):
+        """Store the description read from a detail page (empty descriptions are not cached)"""
+        if not url or not details.get('full_description'):
+            return
+        now = time.time()
+        with self._lock:
+            self._pending[url] = (url, job_id, snippet_hash(snippet),
+                                  json.dumps({'full_description': details['full_description']}), now, now)
+            self._touched.pop(url, None)
+            self.stats['stored'] += 1
+            if len(self._pending) >= self.touch_batch:
+                self._write()
+
+    def _write(self):
+        """Write pending entries and access times in one transaction"""
+        if self._pending:
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO descriptions (url, job_id, snippet_hash, details, fetched_at, accessed_at) '
+                'VALUES (?, ?, ?, ?, ?, ?)', list(self._pending.values())
+            )
+            self._pending.clear()
+        if self._touched:
+            self._conn.executemany('UPDATE descriptions SET accessed_at = ? WHERE url = ?',
+                                   [(accessed_at, url) for url, accessed_at in self._touched.items()])
+            self._touched.clear()
+        self._conn.commit()
+
+    def flush(self):
+        """Write new entries and the access times of recent hits, then evict"""
+        with self._lock:
+            self._write()
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        """Drop expired rows, then the least recently used rows beyond max_entries"""
+        cursor = self._conn.execute('DELETE FROM descriptions WHERE fetched_at < ?', (time.time() - self.ttl,))
+        self.stats['evicted'] += cursor.rowcount
+        count = self._conn.execute('SELECT COUNT(*) FROM descriptions').fetchone()[0]
+        if count > self.max_entries:
+            cursor = self._conn.execute(
+                'DELETE FROM descriptions WHERE url IN '
+                '(SELECT url FROM descriptions ORDER BY accessed_at ASC LIMIT ?)',
+                (count - self.max_entries,)
+            )
+            self.stats['evicted'] += cursor.rowcount
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._write()
+            return self._conn.execute('SELECT COUNT(*) FROM descriptions').fetchone()[0]
+
+    def print_report(self):
+        lookups = self.stats['hits'] + self.stats['misses']
+        rate = self.stats['hits'] / lookups * 100 if lookups else 0
+        log.info("💾 Description cache: %d/%d hits (%.0f%%), %d changed, %d expired, %d stored, %d evicted",
+                 self.stats['hits'], lookups, rate, self.stats['changed'], self.stats['expired'],
+                 self.stats['stored'], self.stats['evicted'])
+
+    def close(self):
+        with self._lock:
+            self._write()
+            self._evict()
+            self._conn.commit()
+            self._conn.close()
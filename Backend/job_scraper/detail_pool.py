@@ -0,0 +1,220 @@
+"""
+Detail Page Fetch Pool
+Fetches full job descriptions through a bounded set of reusable browser tabs
+"""
+
+import asyncio
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+from playwright.async_api import BrowserContext, Page
+
+from config import HTTP_ESCALATE_AFTER
+from deadline import DeadlineExceeded, cap_seconds
+from event_log import get_logger
+from http_fetcher import BLOCK_REASONS
+
+log = get_logger('scraper.details')  # per detail page (silenced in summary mode)
+run_log = get_logger('scraper')
+
+
+class DetailFetchPool:
+    """
+    Bounded pool of reusable tabs that pull job URLs from a shared queue
+    
+    One pool serves every keyword of a platform run, so `size` is the
+    per-platform limit on concurrent detail pages. Results are returned in
+    completion order; a URL that fails or exceeds `timeout` yields {}. The
+    timeout is capped by the request deadline, and once it has passed the
+    remaining URLs are answered with {} without being loaded. Each URL first
+    waits for its domain's slot in the optional rate limiter.
+    
+    The context may be given as a coroutine function that opens it; it is
+    then only called when the first tab is needed, so a run served entirely
+    by `http_loader` never starts a browser.
+    """
+    
+    def __init__(
+        self,
+        context: Union[BrowserContext, Callable[[], Awaitable[BrowserContext]]],
+        extractor: Callable[[Page], Awaitable[Dict]],
+        size: int = 4,
+        timeout: float = 25,
+        name: str = 'details',
+        http_loader: Optional[Callable[[str], Awaitable[Dict]]] = None,
+        rate_limiter=None,
+        escalate_after: int = HTTP_ESCALATE_AFTER
+    ):
+        """
+        Args:
+            context: Browser context the tabs are opened in, or a coroutine
+                     function opening it on first use
+            extractor: Coroutine reading the details dict from a loaded detail page
+            size: Number of tabs (max concurrent detail fetches)
+            timeout: Seconds allowed per URL (navigation + extraction)
+            name: Label used in log output
+            http_loader: Optional fast path tried before a tab. A block (see
+                         http_fetcher.BLOCK_REASONS) or `escalate_after`
+                         failures in a row send the rest of the run to the
+                         browser; a single other failure only loses that URL
+            rate_limiter: Optional DomainRateLimiter; each URL waits for its slot
+                          before the timeout starts (http_loader must not pace again)
+            escalate_after: Consecutive non-block http_loader failures before escalating
+        """
+        self.context: Optional[BrowserContext] = None if callable(context) else context
+        self._open_context = context if callable(context) else None
+        self.extractor = extractor
+        self.size = max(1, size)
+        self.timeout = timeout
+        self.name = name
+        self.http_loader = http_loader
+        self.rate_limiter = rate_limiter
+        self.escalate_after = max(1, escalate_after)
+        self.stats = {'http': 0, 'http_failed': 0, 'fetched': 0, 'failed': 0, 'timed_out': 0, 'skipped': 0,
+                      'escalations': {}}
+        self._http_failures = 0  # consecutive http_loader failures
+        self._context_lock = asyncio.Lock()
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._workers: List[asyncio.Task] = []
+        self._tabs: List[Page] = []
+    
+    async def __aenter__(self) -> 'DetailFetchPool':
+        self.start()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    def start(self):
+        """Start the tab workers (idempotent)"""
+        if not self._workers:
+            self._workers = [asyncio.create_task(self._worker()) for _ in range(self.size)]
+    
+    def submit(self, url: str) -> asyncio.Future:
+        """Queue a URL; the returned future resolves to (url, details)"""
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((url, future))
+        return future
+    
+    async def fetch(self, urls: List[str]) -> AsyncIterator[Tuple[str, Dict]]:
+        """Yield (url, details) for each URL as soon as its page is done"""
+        futures = [self.submit(url) for url in dict.fromkeys(u for u in urls if u)]
+        try:
+            for next_done in asyncio.as_completed(futures):
+                yield await next_done
+        finally:
+            for future in futures:
+                future.cancel()
+    
+    async def fetch_all(self, urls: List[str]) -> Dict[str, Dict]:
+        """Fetch every URL and return {url: details}"""
+        results = {}
+        async for url, details in self.fetch(urls):
+            results[url] = details
+        return results
+    
+    async def close(self):
+        """Stop the workers and close their tabs"""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        for tab in self._tabs:
+            try:
+                await tab.close()
+            except Exception:
+                pass
+        self._tabs = []
+        run_log.info("📑 Detail pool '%s': %d via http (%d failed), %d via browser, %d failed, %d timed out, "
+                     "%d skipped (deadline)", self.name, self.stats['http'], self.stats['http_failed'],
+                     self.stats['fetched'], self.stats['failed'], self.stats['timed_out'], self.stats['skipped'])
+    
+    async def _get_context(self) -> BrowserContext:
+        if self.context is None:
+            async with self._context_lock:
+                if self.context is None:
+                    self.context = await self._open_context()
+        return self.context
+    
+    async def _load(self, tab: Page, url: str, timeout: float) -> Dict:
+        # The extractor waits for its own content, so only wait for the DOM here
+        await tab.goto(url, wait_until='domcontentloaded', timeout=timeout * 1000)
+        details = await self.extractor(tab)
+        if self.rate_limiter is not None and details.get('full_description'):
+            self.rate_limiter.success(url)
+        return details
+    
+    async def _worker(self):
+        tab: Optional[Page] = None
+        while True:
+            url, future = await self._queue.get()
+            if future.done():  # Caller stopped waiting for this one
+                continue
+            
+            try:
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire(url)
+                timeout = cap_seconds(self.timeout)
+            except DeadlineExceeded:
+                self.stats['skipped'] += 1
+                future.set_result((url, {}))
+                continue
+            
+            details: Dict = {}
+            if self.http_loader is not None:
+                try:
+                    details = await asyncio.wait_for(self.http_loader(url), timeout=timeout)
+                    self.stats['http'] += 1
+                    self._http_failures = 0
+                    if not future.done():
+                        future.set_result((url, details))
+                    continue
+                except asyncio.CancelledError:
+                    raise
+                except DeadlineExceeded:
+                    self.stats['skipped'] += 1
+                    if not future.done():
+                        future.set_result((url, {}))
+                    continue
+                except Exception as e:
+                    reason = getattr(e, 'reason', None) or type(e).__name__
+                    self._http_failures += 1
+                    if reason not in BLOCK_REASONS and self._http_failures < self.escalate_after:
+                        self.stats['http_failed'] += 1
+                        log.info("⚠️ Detail page over HTTP failed (%s): %.80s", reason, url)
+                        if not future.done():
+                            future.set_result((url, {}))
+                        continue
+                    escalations = self.stats['escalations']
+                    escalations[reason] = escalations.get(reason, 0) + 1
+                    if self.http_loader is not None:
+                        self.http_loader = None
+                        run_log.warning("🔁 Detail pages over HTTP unusable (%s), escalating to browser", reason)
+            
+            try:
+                if tab is None or tab.is_closed():
+                    tab = await (await self._get_context()).new_page()
+                    self._tabs.append(tab)
+                details = await asyncio.wait_for(self._load(tab, url, timeout), timeout=timeout)
+                self.stats['fetched'] += 1
+            except asyncio.TimeoutError:
+                self.stats['timed_out'] += 1
+                log.info("⏱️ Detail page timed out after %.0fs: %.80s", timeout, url)
+                tab = await self._discard(tab)
+            except Exception as e:
+                self.stats['failed'] += 1
+                log.info("❌ Error opening detail page %.80s: %s", url, e)
+                tab = await self._discard(tab)
+            
+            if not future.done():
+                future.set_result((url, details or {}))
+    
+    async def _discard(self, tab: Optional[Page]) -> None:
+        """Close a tab that may still be mid-navigation so the next URL gets a clean one"""
+        if tab is not None:
+            if tab in self._tabs:
+                self._tabs.remove(tab)
+            try:
+                await tab.close()
+            except Exception:
+                pass
+        return None
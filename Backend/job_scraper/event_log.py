@@ -0,0 +1,160 @@
+"""
+Structured Event Logging
+Level-gated events written as JSON lines by a background thread, so the
+scrape loop never waits on stdout or the log file.
+
+Subsystems log under their own logger ('scraper.jobs' per job,
+'scraper.pages' per results page, 'api', ...), each with its own level.
+Messages use %-style arguments and are only formatted when the level is
+enabled. httpx and httpcore only log warnings (one INFO line per request
+otherwise). Summary mode silences the per-job subsystems and leaves one line
+per results page with its counts and timings.
+"""
+
+import atexit
+import copy
+import json
+import logging
+import queue
+import sys
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional, Union
+
+from config import LOG_LEVEL, LOG_LEVELS, LOG_FORMAT, LOG_MODE
+
+# Per-job and per-detail-page chatter; summary mode raises these to WARNING
+PER_JOB_SUBSYSTEMS = ('scraper.jobs', 'scraper.details')
+# Libraries logging every HTTP request at INFO; always WARNING unless `levels` names them
+QUIET_LIBRARIES = ('httpx', 'httpcore')
+
+TEXT_FORMAT = '%(asctime)s - %(levelname)s - %(name)s - %(message)s'
+
+_listener: Optional[QueueListener] = None
+_subsystem_levels: Dict[str, int] = {}  # levels set by the last configure_logging
+
+
+class EventLogger(logging.LoggerAdapter):
+    """Logger with event(): a named event and structured fields next to the message"""
+
+    def __init__(self, logger: logging.Logger):
+        super().__init__(logger, {})
+
+    def process(self, msg, kwargs):
+        return msg, kwargs
+
+    def event(self, level: int, name: str, msg: str, *args, **fields):
+        """Log event `name`; `fields` become keys of the JSON line"""
+        if self.logger.isEnabledFor(level):
+            self.logger.log(level, msg, *args, extra={'event': name, 'fields': fields})
+
+
+def get_logger(subsystem: str) -> EventLogger:
+    return EventLogger(logging.getLogger(subsystem))
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """One JSON object per record: ts, level, logger, msg, event and its fields"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'ts': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'msg': record.getMessage(),
+        }
+        event = getattr(record, 'event', None)
+        if event:
+            entry['event'] = event
+        for key, value in (getattr(record, 'fields', None) or {}).items():
+            entry.setdefault(key, value)
+        if record.exc_text:
+            entry['exc'] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """Queues the record with its message merged (args may change later) but unformatted"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg, record.args = record.getMessage(), None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def to_level(level: Union[str, int]) -> int:
+    """Numeric logging level of a name ("debug", "WARNING") or number ("10" too)"""
+    if isinstance(level, int):
+        return level
+    if level.strip().isdigit():
+        return int(level)
+    number = logging.getLevelName(level.upper())
+    if not isinstance(number, int):  # getLevelName returns "Level X" for unknown names
+        raise ValueError(f"Unknown log level: {level}")
+    return number
+
+
+def parse_levels(spec: Union[str, Dict[str, Union[str, int]]]) -> Dict[str, int]:
+    """"scraper.jobs=DEBUG,api=WARNING" (or a dict) -> {logger name: level}"""
+    if isinstance(spec, str):
+        spec = dict(item.split('=', 1) for item in spec.replace(' ', '').split(',') if '=' in item)
+    return {name: to_level(level) for name, level in spec.items()}
+
+
+def configure_logging(log_file: Optional[str] = None, level: Union[str, int] = LOG_LEVEL,
+                      levels: Union[str, Dict] = LOG_LEVELS, fmt: str = LOG_FORMAT, mode: str = LOG_MODE,
+                      console: bool = True) -> QueueListener:
+    """
+    Route every logger through one queue to stdout and/or `log_file`
+
+    Replaces an earlier configuration (handlers and listener), so it is safe
+    to call from more than one entry point.
+    """
+    global _listener, _subsystem_levels
+    if mode not in ('full', 'summary'):
+        raise ValueError(f"Unknown log mode: {mode}. Use 'full' or 'summary'")
+    shutdown_logging()
+
+    formatter = JsonLinesFormatter() if fmt == 'json' else logging.Formatter(TEXT_FORMAT)
+    handlers = []
+    if console:
+        handlers.append(logging.StreamHandler(sys.stdout))
+    if log_file:
+        handlers.append(logging.FileHandler(log_file, encoding='utf-8'))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    records = queue.SimpleQueue()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(_DeferredQueueHandler(records))
+    root.setLevel(to_level(level))
+
+    for name in _subsystem_levels:
+        logging.getLogger(name).setLevel(logging.NOTSET)
+    quiet = QUIET_LIBRARIES + (PER_JOB_SUBSYSTEMS if mode == 'summary' else ())
+    _subsystem_levels = {name: logging.WARNING for name in quiet}
+    _subsystem_levels.update(parse_levels(levels))
+    for name, subsystem_level in _subsystem_levels.items():
+        logging.getLogger(name).setLevel(subsystem_level)
+
+    _listener = QueueListener(records, *handlers)
+    _listener.start()
+    return _listener
+
+
+def shutdown_logging():
+    """Write out every queued record and stop the writer thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(shutdown_logging)
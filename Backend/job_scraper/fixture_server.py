@@ -0,0 +1,224 @@
+"""
+Fixture Job Board
+Local stand-in for SimplyHired and Talent.com: generates result and detail
+pages with the same data-testid / class hooks the scraper reads, at a
+configurable size and injected latency, for repeatable benchmarks.
+
+Point a scraper at it with JobScraper(base_urls=board.base_urls) or the
+SIMPLYHIRED_BASE_URL / TALENT_BASE_URL env vars (see config.py).
+"""
+
+import html
+import json
+import math
+import random
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+_ROLES = ['Python Developer', 'Data Scientist', 'Backend Engineer', 'Frontend Developer', 'DevOps Engineer',
+          'Machine Learning Engineer', 'Full Stack Developer', 'Data Engineer', 'Site Reliability Engineer']
+_COMPANIES = ['Acme', 'Globex', 'Initech', 'Umbrella', 'Hooli', 'Stark Industries', 'Wayne Enterprises',
+              'Wonka', 'Cyberdyne', 'Soylent', 'Tyrell', 'Aperture']
+_CITIES = ['New York, NY', 'Austin, TX', 'Seattle, WA', 'Remote', 'Chicago, IL', 'Denver, CO', 'Boston, MA']
+_WORDS = ('design build maintain scalable services python api cloud data pipeline team product customers '
+          'testing deployment monitoring performance security review mentor collaborate deliver').split()
+
+PAGE_SIZE = {'SimplyHired': 20, 'Talent.com': 15}
+_PREFIX = {'SimplyHired': '/simplyhired', 'Talent.com': '/talent'}
+
+
+class FixtureJobBoard:
+    """
+    Deterministic synthetic job board served over HTTP on 127.0.0.1
+
+    Every search returns `jobs` postings per platform (paginated like the
+    real sites: SimplyHired by cursor tokens in __NEXT_DATA__, Talent.com
+    by ?p=N), each with a detail page of `description_words` words. Every
+    response is delayed by `latency_ms`. `served_at` records when each job
+    first appeared on a results page, for per-job latency measurements.
+    """
+
+    def __init__(self, jobs: int = 100, latency_ms: float = 0, description_words: int = 350,
+                 seed: int = 42, port: int = 0):
+        self.jobs = jobs
+        self.latency_ms = latency_ms
+        self.description_words = description_words
+        self.seed = seed
+        self.port = port
+        self.served_at: Dict[str, float] = {}  # job URL -> wall time its results page was served
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    # ==================== LIFECYCLE ====================
+    def start(self) -> 'FixtureJobBoard':
+        board = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                board._handle(self)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', self.port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name='fixture-job-board', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> 'FixtureJobBoard':
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    @property
+    def root(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    @property
+    def base_urls(self) -> Dict[str, str]:
+        return {platform: f"{self.root}{prefix}" for platform, prefix in _PREFIX.items()}
+
+    def pages(self, platform: str) -> int:
+        """Results pages per search"""
+        return max(1, math.ceil(self.jobs / PAGE_SIZE[platform]))
+
+    # ==================== DATA ====================
+    def _job(self, platform: str, keyword: str, index: int) -> Dict:
+        rng = random.Random(f"{self.seed}|{platform}|{keyword}|{index}")
+        job_id = f"{zlib.crc32(f'{platform}|{keyword}'.encode()) % 10**6:06d}{index:06d}"
+        path = '/job/' if platform == 'SimplyHired' else '/view?id='
+        return {
+            'id': job_id,
+            'title': f"{rng.choice(_ROLES)} ({keyword.title()}) #{index}",
+            'company': f"{rng.choice(_COMPANIES)} {index // len(_COMPANIES)}",
+            'location': rng.choice(_CITIES),
+            'salary': f"${rng.randrange(70, 200) * 1000:,} per year",
+            'hours_ago': rng.randrange(1, 20),
+            'snippet': ' '.join(rng.choice(_WORDS) for _ in range(25)),
+            'url': f"{self.base_urls[platform]}{path}{job_id}",
+        }
+
+    def _description(self, job_id: str) -> str:
+        rng = random.Random(f"{self.seed}|desc|{job_id}")
+        words = [rng.choice(_WORDS) for _ in range(self.description_words)]
+        sentences = [' '.join(words[i:i + 15]).capitalize() + '.' for i in range(0, len(words), 15)]
+        return ' '.join(sentences)
+
+    def _page_jobs(self, platform: str, keyword: str, page_num: int) -> List[Dict]:
+        size = PAGE_SIZE[platform]
+        start = (page_num - 1) * size
+        jobs = [self._job(platform, keyword, i) for i in range(start, min(start + size, self.jobs))]
+        now = time.time()
+        with self._lock:
+            for job in jobs:
+                self.served_at.setdefault(job['url'], now)
+        return jobs
+
+    # ==================== PAGES ====================
+    def _simplyhired_results(self, query: Dict[str, str]) -> str:
+        keyword = query.get('q', '')
+        page_num = int(query.get('cursor', 'c1')[1:] or 1)
+        first_url = f"{self.base_urls['SimplyHired']}/search?" + urlencode(
+            {k: v for k, v in query.items() if k != 'cursor'})
+        cards = ''.join(f"""
+<div data-testid="searchSerpJob">
+  <h2 data-testid="searchSerpJobTitle"><a href="{job['url']}">{html.escape(job['title'])}</a></h2>
+  <p class="chakra-text"><span data-testid="companyName">{html.escape(job['company'])}</span> —
+    <span data-testid="searchSerpJobLocation">{job['location']}</span></p>
+  <p data-testid="searchSerpJobSalaryConfirmed">{job['salary']}</p>
+  <p data-testid="searchSerpJobSnippet">{job['snippet']}</p>
+  <p data-testid="searchSerpJobDateStamp">{job['hours_ago']} hours ago</p>
+</div>""" for job in self._page_jobs('SimplyHired', keyword, page_num))
+        last = self.pages('SimplyHired')
+        # Like the real site: cursors for the next few pages in the page state
+        cursors = {str(n): f"c{n}" for n in range(max(1, page_num - 2), min(last, page_num + 4) + 1)}
+        state = json.dumps({'props': {'pageProps': {'pageCursors': cursors}}})
+        next_link = (f'<a data-testid="pageNumberBlockNext" class="chakra-link css-16mmgjw" '
+                     f'href="{html.escape(first_url)}&amp;cursor=c{page_num + 1}">Next</a>') if page_num < last else ''
+        return f"""<!DOCTYPE html><html><head><title>{html.escape(keyword)} jobs | SimplyHired</title>
+<script id="__NEXT_DATA__" type="application/json">{state}</script></head>
+<body><main>{cards}</main><nav>{next_link}</nav></body></html>"""
+
+    def _talent_results(self, query: Dict[str, str]) -> str:
+        keyword = query.get('k', '').replace('-', ' ')
+        page_num = int(query.get('p', 1))
+        cards = ''.join(f"""
+<section data-testid="jobcard-container-{job['id']}">
+  <a href="{job['url']}" class="sc-d93925ca-5"><h2 color="#30183F">{html.escape(job['title'])}</h2></a>
+  <span color="#691F74">{html.escape(job['company'])}</span>
+  <span color="#222222">{job['location']}</span>
+  <span class="sc-fcd630a4-6">Last updated: {job['hours_ago']} hours ago</span>
+  <span class="sc-fcd630a4-5">{job['snippet']}</span>
+  <div>{job['salary']}</div>
+</section>""" for job in self._page_jobs('Talent.com', keyword, page_num))
+        last = self.pages('Talent.com')
+        # Numbered links for a window of pages around the current one
+        links = ''.join(f'<a title="{n}" href="{self.base_urls["Talent.com"]}/jobs?'
+                        f'{html.escape(urlencode(dict(query, p=n)))}">{n}</a>'
+                        for n in range(max(1, page_num - 2), min(last, page_num + 4) + 1))
+        return f"""<!DOCTYPE html><html><head><title>{html.escape(keyword)} jobs | Talent.com</title></head>
+<body><main>{cards}</main><nav class="sc-5ec0130d-0 eRQgGg">{links}</nav></body></html>"""
+
+    def _detail(self, platform: str, job_id: str) -> str:
+        description = html.escape(self._description(job_id))
+        if platform == 'SimplyHired':
+            body = f"""<aside class="css-1u3q0w0" aria-label="Job">
+  <div tabindex="0" class="css-1u3q0w0 scroll"><div class="css-10747oj" data-testid="viewJobBodyContainer">
+    <span data-testid="viewJobBodyPostingTimestamp">3 hours ago</span><p>{description}</p>
+  </div></div></aside>"""
+        else:
+            body = f'<div class="sc-fcd630a4-10 sc-fcd630a4-11 cgBMEk"><p>{description}</p></div>'
+        return f"<!DOCTYPE html><html><head><title>Job {job_id}</title></head><body>{body}</body></html>"
+
+    def _route(self, path: str, query: Dict[str, str]) -> Tuple[int, str]:
+        if path == '/simplyhired/search':
+            return 200, self._simplyhired_results(query)
+        if path.startswith('/simplyhired/job/'):
+            return 200, self._detail('SimplyHired', path.rsplit('/', 1)[1])
+        if path == '/talent/jobs':
+            return 200, self._talent_results(query)
+        if path == '/talent/view' and query.get('id'):
+            return 200, self._detail('Talent.com', query['id'])
+        return 404, '<html><head><title>Not found</title></head><body></body></html>'
+
+    def _handle(self, request: BaseHTTPRequestHandler):
+        with self._lock:
+            self.requests += 1
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+        parts = urlsplit(request.path)
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        status, body = self._route(parts.path, query)
+        payload = body.encode('utf-8')
+        request.send_response(status)
+        request.send_header('Content-Type', 'text/html; charset=utf-8')
+        request.send_header('Content-Length', str(len(payload)))
+        request.end_headers()
+        request.wfile.write(payload)
+
+
+if __name__ == "__main__":
+    with FixtureJobBoard(jobs=100, port=8765) as board:
+        print(f"🧪 Fixture job board on {board.root} ({board.jobs} jobs per search)")
+        for platform, url in board.base_urls.items():
+            print(f"   {platform}: {url}")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
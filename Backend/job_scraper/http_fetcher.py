@@ -0,0 +1,282 @@
+"""
+HTTP Fast Path
+Fetches search and detail pages with a pooled async HTTP client and parses them
+without a browser; callers escalate to Playwright when a page is blocked or
+only renders client-side.
+
+Optional dependencies: httpx (HTTP/2 via the h2 package) and selectolax.
+When they are not installed the fast path is simply unavailable.
+"""
+
+import random
+import re
+import time
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+from card_extraction import CARD_SPECS, DETAIL_SPECS
+from config import HTTP_MAX_CONNECTIONS, HTTP_TIMEOUT, PLATFORM_BASE_URLS
+from deadline import cap_seconds
+from page_state import extract_state_cards
+from pagination import linked_pages
+from rate_limiter import THROTTLE_REASONS
+
+HTTP_FAST_PATH_AVAILABLE = httpx is not None and HTMLParser is not None
+
+# Markers of a bot wall / challenge page (Cloudflare, PerimeterX, DataDome)
+BLOCK_MARKERS = ('cf-challenge', 'challenge-platform', 'px-captcha', 'captcha-delivery', 'geo.captcha')
+BLOCK_TITLES = ('just a moment', 'attention required', 'access denied', 'are you a robot', 'captcha',
+                'too many requests')
+# Responses that refuse clients like ours: the browser takes over at once.
+# Other failures (404, timeouts, a page without the expected content) may
+# be one bad URL, so callers only escalate after several in a row.
+BLOCK_REASONS = ('status_403', 'status_429', 'status_503', 'captcha')
+# Texts of a results page that has no jobs for the search (not a block)
+NO_RESULTS_MARKERS = ('no jobs found', 'no results found', 'did not match any jobs', "didn't match any jobs",
+                      'no matching jobs', 'no jobs match', "we couldn't find any", 'we could not find any')
+_TITLE_RE = re.compile(r'<title[^>]*>(.*?)</title>', re.IGNORECASE | re.DOTALL)
+
+
+class FetchBlocked(Exception):
+    """The HTTP response cannot be used; `reason` says why (the caller escalates to the browser)"""
+
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+def _node_text(node) -> str:
+    return node.text(separator=' ').strip() if node is not None else ""
+
+
+def _apply_rule(card, rule: Dict) -> Tuple[bool, Optional[str]]:
+    """Evaluate one CARD_SPECS rule against a selectolax node -> (matched, value)"""
+    if rule.get('selector'):
+        if rule.get('contains') or rule.get('max_len'):
+            candidates = card.css(rule['selector'])
+        else:
+            first = card.css_first(rule['selector'])
+            candidates = [first] if first is not None else []
+    else:
+        candidates = [card]
+
+    for node in candidates:
+        text = _node_text(node)
+        if rule.get('contains') and not any(c.lower() in text.lower() for c in rule['contains']):
+            continue
+        if rule.get('max_len') and len(text) >= rule['max_len']:
+            continue
+
+        value = node.attributes.get(rule['attr']) if rule.get('attr') else text
+        if value is None:
+            return True, None
+        if rule.get('split'):
+            value = value.split(rule['split'])[0].strip()
+        if rule.get('regex'):
+            match = re.search(rule['regex'], value)
+            if not match:
+                continue
+            value = match.group(0)
+        return True, value
+    return False, None
+
+
+def parse_cards(html: str, platform: str) -> List[Dict]:
+    """Server-side equivalent of card_extraction.extract_cards"""
+    spec = CARD_SPECS[platform]
+    tree = HTMLParser(html)
+    cards = []
+    for card in tree.css(spec['card']):
+        out = {}
+        for name, rules in spec['fields'].items():
+            out[name] = None
+            for rule in rules:
+                matched, value = _apply_rule(card, rule)
+                if matched:
+                    out[name] = value
+                    break
+        cards.append(out)
+    return cards
+
+
+def parse_detail(html: str, platform: str) -> Dict:
+    """Read the description (and posting timestamp) from a detail page"""
+    spec = DETAIL_SPECS[platform]
+    tree = HTMLParser(html)
+    description = ""
+    for selector in spec['description']:
+        node = tree.css_first(selector)
+        text = _node_text(node)
+        if text:
+            description = text
+            if len(text) > spec['min_chars']:
+                break
+
+    details = {'full_description': description}
+    if spec.get('date'):
+        details['posted_date_text'] = _node_text(tree.css_first(spec['date'])) or None
+    return details
+
+
+def parse_next_url(html: str, platform: str, page_num: int, base_url: str) -> Optional[str]:
+    """URL of results page `page_num + 1` from the pagination links, if present (paths are put on `base_url`)"""
+    tree = HTMLParser(html)
+    href = None
+
+    if platform == 'SimplyHired':
+        for selector in ('a[data-testid="pageNumberBlockNext"]', 'a.chakra-link.css-16mmgjw'):
+            node = tree.css_first(selector)
+            if node is not None:
+                href = node.attributes.get('href')
+                break
+    elif platform == 'Talent.com':
+        nav = tree.css_first('nav.sc-5ec0130d-0') or tree.css_first('nav[class*="eRQgGg"]')
+        if nav is not None:
+            for link in nav.css('a'):
+                if link.attributes.get('title') == str(page_num + 1):
+                    href = link.attributes.get('href')
+                    break
+        if href:
+            href = href.replace('&showSignInModal=true', '').replace('showSignInModal=true&', '')
+
+    if not href:
+        return None
+    return href if href.startswith('http') else f"{base_url}{href}"
+
+
+def detect_block(status: int, html: str) -> Optional[str]:
+    """Return a block reason for an HTTP response, or None if it looks usable"""
+    if status >= 400:
+        return f'status_{status}'
+    head = html[:20000].lower()
+    title_match = _TITLE_RE.search(head)
+    title = title_match.group(1) if title_match else ''
+    if any(marker in title for marker in BLOCK_TITLES) or any(marker in head for marker in BLOCK_MARKERS):
+        return 'captcha'
+    return None
+
+
+def is_empty_results(html: str) -> bool:
+    """True for a results page that says the search has no jobs"""
+    text = _node_text(HTMLParser(html).body).lower().replace('\u2019', "'")  # curly apostrophes
+    return any(marker in text for marker in NO_RESULTS_MARKERS)
+
+
+class HttpFetcher:
+    """
+    Pooled keep-alive HTTP client (HTTP/2 when h2 is installed) shared by all
+    keywords and detail fetches of a scraper; requests are paced by the
+    optional DomainRateLimiter, which is told how each response looked.
+    With a SessionArchive responses are recorded, or replayed without any
+    network when it is in replay mode. `base_urls` overrides
+    PLATFORM_BASE_URLS for the links read from pages.
+    """
+
+    def __init__(self, user_agents: List[str], max_connections: int = HTTP_MAX_CONNECTIONS,
+                 timeout: float = HTTP_TIMEOUT, rate_limiter=None, archive=None,
+                 base_urls: Optional[Dict[str, str]] = None):
+        if not HTTP_FAST_PATH_AVAILABLE:
+            raise RuntimeError("HTTP fast path needs httpx and selectolax (pip install -r requirement.txt)")
+        self.user_agents = user_agents
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.archive = archive
+        self.base_urls = dict(PLATFORM_BASE_URLS, **(base_urls or {}))
+        self._client = None
+
+    def _get_client(self):
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                follow_redirects=True,
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+                headers={
+                    'User-Agent': random.choice(self.user_agents),
+                    'Accept-Language': 'en-US,en;q=0.9',
+                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+                },
+            )
+        return self._client
+
+    async def get_html(self, url: str, pace: bool = True) -> str:
+        """
+        GET a page; raises FetchBlocked when the response is an error or a bot wall.
+        `pace=False` skips waiting for the rate limiter (the caller already did).
+        """
+        if self.rate_limiter is not None and pace:
+            await self.rate_limiter.acquire(url)
+        timeout = cap_seconds(self.timeout)  # DeadlineExceeded once the request budget is spent
+        if self.archive is not None and self.archive.replaying:
+            replayed = await self.archive.replay_http(url)
+            if replayed is None:
+                raise FetchBlocked('not_recorded')
+            status, text = replayed
+        else:
+            started = time.monotonic()
+            try:
+                response = await self._get_client().get(url, timeout=timeout)
+            except httpx.HTTPError as e:
+                raise FetchBlocked(f'error_{type(e).__name__}')
+            status, text = response.status_code, response.text
+            if self.archive is not None:
+                self.archive.store('GET', url, status, dict(response.headers), response.content,
+                                   (time.monotonic() - started) * 1000)
+        reason = detect_block(status, text)
+        if self.rate_limiter is not None:
+            if reason is None:
+                self.rate_limiter.success(url)
+            elif reason in THROTTLE_REASONS:
+                self.rate_limiter.backoff(url, reason)
+        if reason:
+            raise FetchBlocked(reason)
+        return text
+
+    async def fetch_results(self, url: str, platform: str,
+                            page_num: int) -> Tuple[List[Dict], Optional[str], Dict[int, Optional[str]]]:
+        """
+        Fetch one results page -> (raw cards, next page URL, pagination.linked_pages)
+
+        A page saying the search has no jobs returns no cards; a page with
+        neither cards nor that message raises FetchBlocked('no_cards').
+        """
+        html = await self.get_html(url)
+        # Prefer the embedded page state; the hashed-class selectors are the fallback
+        cards = extract_state_cards(html, platform) or parse_cards(html, platform)
+        if not cards:
+            if is_empty_results(html):
+                return [], None, {}
+            # Result list is rendered client-side (or the layout changed)
+            raise FetchBlocked('no_cards')
+        return cards, parse_next_url(html, platform, page_num, self.base_urls[platform]), linked_pages(html, platform)
+
+    async def fetch_detail(self, url: str, platform: str, pace: bool = True) -> Dict:
+        """Fetch one detail page; raises FetchBlocked when no description is in the HTML"""
+        details = parse_detail(await self.get_html(url, pace), platform)
+        if not details['full_description']:
+            raise FetchBlocked('no_description')
+        return details
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
@@ -0,0 +1,114 @@
+"""
+Process Memory Monitor
+Measures RSS of this process plus its children (the Chromium processes)
+"""
+
+import os
+from typing import List, Optional
+
+try:
+    import psutil
+except ImportError:  # Fall back to /proc on Linux (Render)
+    psutil = None
+
+
+def _proc_rss_kb(pid: int) -> int:
+    """Read VmRSS for one pid from /proc (0 if unavailable)"""
+    try:
+        with open(f'/proc/{pid}/status', 'r') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1])
+    except (OSError, ValueError, IndexError):
+        pass
+    return 0
+
+
+def _proc_children(pid: int) -> list:
+    """Return all descendant pids of `pid` by scanning /proc"""
+    parents = {}
+    try:
+        entries = os.listdir('/proc')
+    except OSError:
+        return []
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat', 'r') as f:
+                # comm may contain spaces, so split after the closing paren
+                ppid = int(f.read().rsplit(')', 1)[1].split()[1])
+            parents.setdefault(ppid, []).append(int(entry))
+        except (OSError, ValueError, IndexError):
+            continue
+    
+    descendants, stack = [], [pid]
+    while stack:
+        for child in parents.get(stack.pop(), []):
+            descendants.append(child)
+            stack.append(child)
+    return descendants
+
+
+def child_pids(pid: Optional[int] = None) -> List[int]:
+    """All descendant pids of a process (default: this one)"""
+    pid = pid or os.getpid()
+    if psutil is not None:
+        try:
+            return [child.pid for child in psutil.Process(pid).children(recursive=True)]
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return []
+    return _proc_children(pid)
+
+
+def process_name(pid: int) -> str:
+    """Executable name of a process ('' if it is gone)"""
+    try:
+        with open(f'/proc/{pid}/comm', 'r') as f:
+            return f.read().strip()
+    except OSError:
+        if psutil is not None:
+            try:
+                return psutil.Process(pid).name()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+    return ''
+
+
+def process_cmdline(pid: int) -> List[str]:
+    """Command line arguments of a process ([] if it is gone)"""
+    try:
+        with open(f'/proc/{pid}/cmdline', 'rb') as f:
+            return [arg.decode(errors='replace') for arg in f.read().split(b'\0') if arg]
+    except OSError:
+        if psutil is not None:
+            try:
+                return psutil.Process(pid).cmdline()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+    return []
+
+
+def process_tree_rss_mb(pid: Optional[int] = None) -> float:
+    """
+    Resident memory in MB of a process and all of its children
+    
+    Chromium runs as child processes of the Playwright driver, so this is
+    the number that has to stay under the instance memory limit.
+    """
+    pid = pid or os.getpid()
+    if psutil is not None:
+        try:
+            process = psutil.Process(pid)
+            total = process.memory_info().rss
+            for child in process.children(recursive=True):
+                try:
+                    total += child.memory_info().rss
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+            return total / 1024 / 1024
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return 0.0
+    
+    total_kb = _proc_rss_kb(pid) + sum(_proc_rss_kb(child) for child in _proc_children(pid))
+    return total_kb / 1024
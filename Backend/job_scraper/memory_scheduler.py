@@ -0,0 +1,119 @@
+"""
+Memory-Budget Task Scheduler
+Runs (platform, keyword) scrape tasks as parallel as the instance's memory allows
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from config import MEMORY_BUDGET_MB, MEMORY_TASK_ESTIMATE_MB, MEMORY_SAMPLE_INTERVAL, MEMORY_MAX_PARALLEL_TASKS
+from event_log import get_logger
+from memory_monitor import process_tree_rss_mb
+
+log = get_logger(__name__)
+
+
+class MemoryBudgetScheduler:
+    """
+    Admits queued tasks only while projected memory stays under a budget
+
+    Projected memory is the sampled RSS of this process and its children
+    (Chromium included) plus the estimated cost of one more task. The
+    estimate starts at `task_estimate_mb` and is replaced by the largest
+    per-task growth observed so far, so it adapts to what a task really
+    costs on this instance (HTTP-only tasks are far cheaper than browser
+    ones). One task always runs, however tight the budget.
+    """
+
+    def __init__(self, budget_mb: float = MEMORY_BUDGET_MB, task_estimate_mb: float = MEMORY_TASK_ESTIMATE_MB,
+                 max_parallel: int = MEMORY_MAX_PARALLEL_TASKS, sample_interval: float = MEMORY_SAMPLE_INTERVAL,
+                 rss_sampler: Callable[[], float] = process_tree_rss_mb):
+        self.budget_mb = budget_mb
+        self.task_estimate_mb = task_estimate_mb
+        self.max_parallel = max(1, max_parallel)
+        self.sample_interval = sample_interval
+        self.rss_sampler = rss_sampler
+        self.stats = {
+            'tasks': 0,
+            'completed': 0,
+            'failed': 0,
+            'deferrals': 0,  # Admission checks that had to wait for memory
+            'max_parallel': 0,
+            'peak_rss_mb': 0.0,
+            'baseline_rss_mb': 0.0,
+            'task_estimate_mb': task_estimate_mb,
+        }
+
+    def _sample(self) -> float:
+        rss = self.rss_sampler()
+        self.stats['peak_rss_mb'] = max(self.stats['peak_rss_mb'], rss)
+        return rss
+
+    def _learn(self, rss: float, running: int):
+        """Raise the per-task estimate to the growth observed per running task"""
+        if running:
+            per_task = (rss - self.stats['baseline_rss_mb']) / running
+            if per_task > self.task_estimate_mb:
+                self.task_estimate_mb = per_task
+                self.stats['task_estimate_mb'] = round(per_task, 1)
+
+    def can_admit(self, rss: float, running: int) -> bool:
+        if running == 0:
+            return True
+        if running >= self.max_parallel:
+            return False
+        return rss + self.task_estimate_mb <= self.budget_mb
+
+    async def run(self, tasks: List[Tuple[str, Callable[[], Awaitable]]],
+                  chooser: Optional[Callable[[List[Tuple[str, Callable]], List[str]], int]] = None):
+        """
+        Run every (name, coroutine factory) task, admitting them as memory
+        allows: in order, or the index `chooser(pending, running_names)` picks.
+        Task errors are logged and counted, not raised; cancelling run()
+        cancels the running tasks.
+        """
+        pending = list(tasks)
+        running: Dict[asyncio.Task, str] = {}
+        self.stats['tasks'] += len(pending)
+        self.stats['baseline_rss_mb'] = self._sample()
+        log.info("🧮 Memory scheduler: %d tasks, budget %.0f MB, baseline %.0f MB",
+                 len(pending), self.budget_mb, self.stats['baseline_rss_mb'])
+
+        try:
+            while pending or running:
+                rss = self._sample()
+                self._learn(rss, len(running))
+
+                while pending and self.can_admit(rss, len(running)):
+                    index = chooser(pending, list(running.values())) if chooser else 0
+                    name, factory = pending.pop(index)
+                    running[asyncio.ensure_future(factory())] = name
+                    self.stats['max_parallel'] = max(self.stats['max_parallel'], len(running))
+                    # Count the new task before sampling again
+                    rss += self.task_estimate_mb
+                if pending and len(running) < self.max_parallel:
+                    self.stats['deferrals'] += 1
+
+                done, _ = await asyncio.wait(running, timeout=self.sample_interval,
+                                             return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    name = running.pop(task)
+                    if task.exception() is not None:
+                        self.stats['failed'] += 1
+                        log.warning("❌ Task %s failed: %s", name, task.exception())
+                    else:
+                        self.stats['completed'] += 1
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+    def report(self) -> Dict:
+        return dict(self.stats)
+
+    def print_report(self):
+        log.info("🧮 Memory scheduler: %d/%d tasks done, max %d in parallel, peak %.0f MB "
+                 "(budget %.0f MB, ~%.0f MB/task), %d deferrals",
+                 self.stats['completed'], self.stats['tasks'], self.stats['max_parallel'], self.stats['peak_rss_mb'],
+                 self.budget_mb, self.stats['task_estimate_mb'], self.stats['deferrals'])
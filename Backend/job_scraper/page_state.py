@@ -0,0 +1,152 @@
+"""
+Embedded Page State Extraction
+Reads job results from the JSON blob server-rendered React pages embed in a
+<script> tag (__NEXT_DATA__ and similar) instead of walking the rendered DOM.
+Callers fall back to the DOM selectors when no blob is found.
+"""
+
+import json
+import re
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+# Script tags that carry the initial page state
+_STATE_SCRIPT_RES = [
+    re.compile(r'<script[^>]+id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.DOTALL),
+    re.compile(r'window\.__INITIAL_STATE__\s*=\s*(\{.*?\})\s*;?\s*</script>', re.DOTALL),
+    re.compile(r'window\.__PRELOADED_STATE__\s*=\s*(\{.*?\})\s*;?\s*</script>', re.DOTALL),
+]
+
+# Candidate keys per field, tried in order (dotted keys reach into nested objects)
+_FIELD_KEYS = {
+    'title': ['title', 'jobTitle', 'displayTitle', 'name'],
+    'company': ['company', 'companyName', 'employer', 'employerName', 'hiringOrganization.name', 'company.name'],
+    'location': ['location', 'formattedLocation', 'jobLocation', 'locationName', 'location.name', 'city'],
+    'salary': ['salaryInfo', 'formattedSalary', 'salary', 'salarySnippet.text', 'salary.text'],
+    'snippet': ['snippet', 'jobSnippet', 'summary', 'shortDescription', 'description'],
+    'url': ['url', 'link', 'jobUrl', 'viewJobLink', 'detailUrl'],
+    'date_text': ['formattedRelativeTime', 'relativeTime', 'postedAgo', 'lastUpdated', 'datePostedText'],
+    'timestamp': ['dateOnIndeed', 'datePosted', 'postedDate', 'pubDate', 'publishedAt', 'createDate', 'date'],
+}
+
+# How to build a detail URL from the job's id when the blob has no URL
+# (a path: normalise_card puts it on the platform's base URL)
+_ID_KEYS = ['jobKey', 'jobkey', 'key', 'id', 'jobId', 'legacyId']
+_URL_TEMPLATES = {
+    'SimplyHired': '/job/{id}',
+    'Talent.com': '/view?id={id}',
+}
+
+_TAG_RE = re.compile(r'<[^>]+>')
+
+
+def extract_state(html: str) -> Optional[Dict]:
+    """Return the embedded page state blob, or None"""
+    for pattern in _STATE_SCRIPT_RES:
+        match = pattern.search(html)
+        if match:
+            try:
+                return json.loads(match.group(1))
+            except ValueError:
+                continue
+    return None
+
+
+def _get(obj: Dict, dotted_key: str) -> Any:
+    for part in dotted_key.split('.'):
+        if not isinstance(obj, dict) or part not in obj:
+            return None
+        obj = obj[part]
+    return obj
+
+
+def _first(obj: Dict, keys: List[str]) -> Any:
+    for key in keys:
+        value = _get(obj, key)
+        if value not in (None, '', [], {}):
+            return value
+    return None
+
+
+def _as_text(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, dict):  # e.g. {"text": "...", "min": ..}
+        value = _first(value, ['text', 'name', 'formatted', 'value'])
+    if isinstance(value, list):
+        value = ', '.join(str(v) for v in value if v)
+    text = _TAG_RE.sub(' ', str(value)).strip()
+    return text or None
+
+
+def _looks_like_job(item: Any) -> bool:
+    return (
+        isinstance(item, dict)
+        and _first(item, _FIELD_KEYS['title']) is not None
+        and (_first(item, _FIELD_KEYS['company']) is not None or _first(item, _ID_KEYS) is not None)
+    )
+
+
+def find_job_list(state: Any, _depth: int = 0) -> Optional[List[Dict]]:
+    """Depth-first search for the first list whose items look like job postings"""
+    if _depth > 12:
+        return None
+    if isinstance(state, list):
+        if state and sum(_looks_like_job(item) for item in state) >= max(1, len(state) // 2):
+            return [item for item in state if _looks_like_job(item)]
+        children = state
+    elif isinstance(state, dict):
+        children = state.values()
+    else:
+        return None
+
+    for child in children:
+        if isinstance(child, (dict, list)):
+            found = find_job_list(child, _depth + 1)
+            if found:
+                return found
+    return None
+
+
+def _timestamp_to_iso(value: Any) -> Optional[str]:
+    """Epoch seconds/milliseconds or an ISO string -> naive local ISO (like parse_posted_date)"""
+    try:
+        if isinstance(value, (int, float)) or (isinstance(value, str) and value.isdigit()):
+            seconds = float(value)
+            if seconds > 1e11:  # milliseconds
+                seconds /= 1000
+            return datetime.fromtimestamp(seconds).isoformat()
+        if isinstance(value, str):
+            parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+            if parsed.tzinfo is not None:
+                parsed = parsed.astimezone().replace(tzinfo=None)
+            return parsed.isoformat()
+    except (ValueError, OverflowError, OSError):
+        pass
+    return None
+
+
+def map_job(item: Dict, platform: str) -> Dict:
+    """Map one blob entry to the raw card dict used by card_extraction.normalise_card"""
+    card = {field: _as_text(_first(item, keys)) for field, keys in _FIELD_KEYS.items()
+            if field != 'timestamp'}
+
+    if not card['url']:
+        job_id = _first(item, _ID_KEYS)
+        if job_id is not None and platform in _URL_TEMPLATES:
+            card['url'] = _URL_TEMPLATES[platform].format(id=job_id)
+
+    # An exact timestamp makes the relative date text (and the detail page date) unnecessary
+    card['posted_at'] = _timestamp_to_iso(_first(item, _FIELD_KEYS['timestamp']))
+    return card
+
+
+def extract_state_cards(html: str, platform: str) -> Optional[List[Dict]]:
+    """Raw cards from the embedded state blob, or None when the page has no usable blob"""
+    state = extract_state(html)
+    if state is None:
+        return None
+    jobs = find_job_list(state)
+    if not jobs:
+        return None
+    return [map_job(item, platform) for item in jobs]
@@ -0,0 +1,89 @@
+"""
+Pagination Planning
+Builds results-page URLs directly (page numbers or cursor tokens) so later
+pages can be fetched at once instead of clicking through them one by one.
+Callers fall back to the next-page link or button when no URL can be built.
+"""
+
+import re
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from page_state import extract_state
+
+# Talent.com numbers its pages in the pagination nav (<a title="2">) and takes ?p=N
+_TALENT_NAV_RE = re.compile(r'<nav[^>]*class="[^"]*(?:sc-5ec0130d-0|eRQgGg)[^"]*"[^>]*>(.*?)</nav>', re.DOTALL)
+_PAGE_TITLE_RE = re.compile(r'<a[^>]*\btitle="(\d+)"')
+
+
+def with_query(url: str, **params) -> str:
+    """`url` with the given query parameters set (replacing existing values)"""
+    parts = urlsplit(url)
+    query = [(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True) if key not in params]
+    query.extend((key, str(value)) for key, value in params.items())
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def _find_key(obj: Any, key: str) -> Any:
+    """First value stored under `key` anywhere in a nested JSON object"""
+    if isinstance(obj, dict):
+        if key in obj:
+            return obj[key]
+        children = obj.values()
+    elif isinstance(obj, list):
+        children = obj
+    else:
+        return None
+    for child in children:
+        found = _find_key(child, key)
+        if found is not None:
+            return found
+    return None
+
+
+def linked_pages(html: str, platform: str) -> Dict[int, Optional[str]]:
+    """
+    Page numbers a results page links to -> cursor token (None when the
+    platform addresses pages by number)
+    """
+    if platform == 'SimplyHired':
+        # SimplyHired pages by opaque cursors, listed per page number in __NEXT_DATA__
+        cursors = _find_key(extract_state(html), 'pageCursors')
+        if not isinstance(cursors, dict):
+            return {}
+        return {int(number): token for number, token in cursors.items() if str(number).isdigit() and token}
+    if platform == 'Talent.com':
+        nav = _TALENT_NAV_RE.search(html)
+        if not nav:
+            return {}
+        return {int(number): None for number in _PAGE_TITLE_RE.findall(nav.group(1))}
+    return {}
+
+
+def page_url(platform: str, first_url: str, page_num: int, token: Optional[str] = None) -> Optional[str]:
+    """URL of results page `page_num` of the search whose first page is `first_url`"""
+    if page_num == 1:
+        return first_url
+    if platform == 'SimplyHired':
+        return with_query(first_url, cursor=token) if token else None
+    if platform == 'Talent.com':
+        return with_query(first_url, p=page_num)
+    return None
+
+
+def plan_pages(platform: str, first_url: str, links: Dict[int, Optional[str]],
+               after: int, last: int) -> Dict[int, str]:
+    """
+    URLs of pages `after + 1`..`last` that the links of page `after` make
+    addressable; stops at the first page that is not linked (a later results
+    page usually links further ahead)
+    """
+    plan = {}
+    for number in range(after + 1, last + 1):
+        if number not in links:
+            break
+        url = page_url(platform, first_url, number, links[number])
+        if not url:
+            break
+        plan[number] = url
+    return plan
@@ -0,0 +1,147 @@
+"""
+Adaptive Per-Domain Rate Limiting
+Paces every request to a job board by how the site is responding instead of fixed sleeps
+"""
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from config import (
+    RATE_LIMIT_INITIAL_RPS, RATE_LIMIT_MIN_RPS, RATE_LIMIT_MAX_RPS, RATE_LIMIT_INCREASE,
+    RATE_LIMIT_DECREASE, RATE_LIMIT_BLOCK_COOLDOWN, RATE_LIMIT_MAX_COOLDOWN, RATE_LIMIT_JITTER,
+)
+from deadline import cap_seconds
+from event_log import get_logger
+
+log = get_logger(__name__)
+
+# Block reasons (http_fetcher.detect_block) that mean the site is pushing back, not a broken page
+THROTTLE_REASONS = ('status_429', 'status_403', 'status_503', 'captcha', 'empty')
+
+
+def domain_of(url: str) -> str:
+    """Host a request is paced under ('www.' stripped, so both forms share a rate)"""
+    host = urlparse(url).hostname or url
+    return host[4:] if host.startswith('www.') else host
+
+
+class _DomainState:
+    __slots__ = ('rate', 'next_at', 'blocked_until', 'consecutive_blocks', 'requests', 'healthy', 'blocks',
+                 'last_block')
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.next_at = 0.0
+        self.blocked_until = 0.0
+        self.consecutive_blocks = 0
+        self.requests = 0
+        self.healthy = 0
+        self.blocks: Dict[str, int] = {}
+        self.last_block: Optional[str] = None
+
+
+class DomainRateLimiter:
+    """
+    AIMD request pacing per domain, shared by every page, tab and HTTP request
+
+    acquire(url) waits for the domain's next slot (1 / rate seconds apart,
+    jittered). Each healthy response adds `increase` requests/second, up to
+    `max_rps`; a block (429, CAPTCHA or an empty results page) multiplies the
+    rate by `decrease` and pauses the domain for a cooldown that doubles with
+    every consecutive block. Blocks reported during a cooldown are counted but
+    do not cut the rate again (requests in flight all see the same block).
+    The result is the highest rate the site accepts. Safe to share between
+    scrapes running on different threads.
+    """
+
+    def __init__(self, initial_rps: float = RATE_LIMIT_INITIAL_RPS, min_rps: float = RATE_LIMIT_MIN_RPS,
+                 max_rps: float = RATE_LIMIT_MAX_RPS, increase: float = RATE_LIMIT_INCREASE,
+                 decrease: float = RATE_LIMIT_DECREASE, block_cooldown: float = RATE_LIMIT_BLOCK_COOLDOWN,
+                 max_cooldown: float = RATE_LIMIT_MAX_COOLDOWN, jitter: float = RATE_LIMIT_JITTER):
+        self.initial_rps = initial_rps
+        self.min_rps = min_rps
+        self.max_rps = max_rps
+        self.increase = increase
+        self.decrease = decrease
+        self.block_cooldown = block_cooldown
+        self.max_cooldown = max_cooldown
+        self.jitter = jitter
+        self._domains: Dict[str, _DomainState] = {}
+        self._lock = threading.Lock()
+
+    def _state(self, url: str) -> _DomainState:
+        domain = domain_of(url)
+        if domain not in self._domains:
+            self._domains[domain] = _DomainState(self.initial_rps)
+        return self._domains[domain]
+
+    def reserve(self, url: str) -> float:
+        """Claim the domain's next slot; returns the seconds to wait for it"""
+        with self._lock:
+            state = self._state(url)
+            now = time.monotonic()
+            slot = max(now, state.next_at, state.blocked_until)
+            interval = 1.0 / state.rate
+            state.next_at = slot + interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+            state.requests += 1
+            return slot - now
+
+    async def acquire(self, url: str):
+        """Wait until a request to `url`'s domain may be sent (capped by the request deadline)"""
+        delay = self.reserve(url)
+        if delay > 0:
+            await asyncio.sleep(cap_seconds(delay))
+
+    def success(self, url: str):
+        """The response was healthy: raise the rate additively"""
+        with self._lock:
+            state = self._state(url)
+            state.healthy += 1
+            state.consecutive_blocks = 0
+            state.rate = min(self.max_rps, state.rate + self.increase)
+
+    def backoff(self, url: str, reason: str):
+        """The site pushed back (`reason`: one of THROTTLE_REASONS): slow down"""
+        with self._lock:
+            state = self._state(url)
+            state.blocks[reason] = state.blocks.get(reason, 0) + 1
+            state.last_block = reason
+            now = time.monotonic()
+            if now < state.blocked_until:
+                return
+            state.rate = max(self.min_rps, state.rate * self.decrease)
+            state.consecutive_blocks += 1
+            cooldown = min(self.max_cooldown, self.block_cooldown * 2 ** (state.consecutive_blocks - 1))
+            state.blocked_until = now + cooldown
+        log.event(logging.INFO, 'backoff', "🐢 %s: backing off (%s), now %.2f req/s, paused %.0fs",
+                  domain_of(url), reason, state.rate, cooldown,
+                  domain=domain_of(url), reason=reason, rate_rps=round(state.rate, 2), paused_s=round(cooldown, 1))
+
+    def rate(self, url: str) -> float:
+        with self._lock:
+            return self._state(url).rate
+
+    def rates(self) -> Dict[str, Dict]:
+        """Current rate and counters per domain"""
+        with self._lock:
+            return {
+                domain: {
+                    'rate_rps': round(state.rate, 2),
+                    'requests': state.requests,
+                    'healthy': state.healthy,
+                    'blocks': dict(state.blocks),
+                    'last_block': state.last_block,
+                    'paused_for_s': round(max(0.0, state.blocked_until - time.monotonic()), 1),
+                }
+                for domain, state in self._domains.items()
+            }
+
+    def print_report(self):
+        for domain, stats in self.rates().items():
+            log.info("🚦 %s: %s req/s after %d requests%s", domain, stats['rate_rps'], stats['requests'],
+                     f", blocks {stats['blocks']}" if stats['blocks'] else "")
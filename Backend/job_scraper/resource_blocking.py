@@ -0,0 +1,123 @@
+"""
+Network Resource Blocking
+Aborts images, fonts, stylesheets, trackers and ads on scrape pages via request interception
+"""
+
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+from playwright.async_api import BrowserContext, Route
+
+from config import RESOURCE_BLOCKING, ESTIMATED_RESOURCE_BYTES, PLATFORM_BASE_URLS
+from event_log import get_logger
+
+log = get_logger(__name__)
+
+
+def _host_matches(host: str, domains: List[str]) -> bool:
+    """True if host is one of the domains or a subdomain of one"""
+    return any(host == domain or host.endswith('.' + domain) for domain in domains)
+
+
+def _allow_base_host(profile: Dict, base_url: Optional[str]) -> Dict:
+    """`profile` with the host of `base_url` added to its allowed_domains (if it has an allow list)"""
+    host = (urlparse(base_url).hostname or '').lower() if base_url else ''
+    allowed = profile.get('allowed_domains')
+    if not allowed or not host or _host_matches(host, allowed):
+        return profile
+    return dict(profile, allowed_domains=list(allowed) + [host])
+
+
+class ResourceBlocker:
+    """
+    Per-platform request filter installed with context.route
+
+    A profile (see RESOURCE_BLOCKING in config.py) has:
+        blocked_types:   resource types to abort (image, font, stylesheet, media, ...)
+        blocked_domains: hosts always aborted (analytics, ads)
+        allowed_domains: when set, any other host is treated as third party and aborted
+
+    The host of each platform's base URL (PLATFORM_BASE_URLS, or the scraper's
+    base_urls) is always allowed, so a staging or fixture server is not
+    treated as third party. Document requests are never blocked. Aborted
+    requests never download, so bytes saved are estimated from
+    ESTIMATED_RESOURCE_BYTES per resource type.
+    """
+
+    def __init__(self, profiles: Optional[Dict[str, Dict]] = None, base_urls: Optional[Dict[str, str]] = None):
+        profiles = RESOURCE_BLOCKING if profiles is None else profiles
+        base_urls = dict(PLATFORM_BASE_URLS, **(base_urls or {}))
+        self.profiles = {platform: _allow_base_host(profile, base_urls.get(platform))
+                         for platform, profile in profiles.items()}
+        self.stats: Dict[str, Dict] = {}
+
+    def _platform_stats(self, platform: str) -> Dict:
+        return self.stats.setdefault(platform, {
+            'requests_allowed': 0,
+            'requests_blocked': 0,
+            'blocked_by_type': {},
+            'bytes_loaded': 0,
+            'estimated_bytes_saved': 0,
+        })
+
+    def block_reason(self, platform: str, resource_type: str, url: str) -> Optional[str]:
+        """Return why a request should be aborted, or None to let it through"""
+        profile = self.profiles.get(platform)
+        if not profile or resource_type == 'document':
+            return None
+
+        if resource_type in profile.get('blocked_types', []):
+            return resource_type
+
+        host = (urlparse(url).hostname or '').lower()
+        if not host:  # data: / blob: URLs
+            return None
+        if _host_matches(host, profile.get('blocked_domains', [])):
+            return 'denied_domain'
+
+        allowed = profile.get('allowed_domains')
+        if allowed and not _host_matches(host, allowed):
+            return 'third_party'
+        return None
+
+    async def attach(self, context: BrowserContext, platform: str):
+        """Install the platform's profile on every page of a context"""
+        if platform not in self.profiles:
+            return
+        stats = self._platform_stats(platform)
+
+        async def handle(route: Route):
+            request = route.request
+            reason = self.block_reason(platform, request.resource_type, request.url)
+            if reason:
+                stats['requests_blocked'] += 1
+                stats['blocked_by_type'][reason] = stats['blocked_by_type'].get(reason, 0) + 1
+                stats['estimated_bytes_saved'] += ESTIMATED_RESOURCE_BYTES.get(
+                    request.resource_type, ESTIMATED_RESOURCE_BYTES.get('other', 0)
+                )
+                await route.abort()
+            else:
+                stats['requests_allowed'] += 1
+                await route.continue_()
+
+        def on_response(response):
+            try:
+                stats['bytes_loaded'] += int(response.headers.get('content-length', 0))
+            except (TypeError, ValueError):
+                pass
+
+        await context.route('**/*', handle)
+        context.on('response', on_response)
+
+    def report(self, platform: Optional[str] = None) -> Dict:
+        """Blocking stats for one platform, or all platforms keyed by name"""
+        if platform is not None:
+            return dict(self._platform_stats(platform))
+        return {name: dict(stats) for name, stats in self.stats.items()}
+
+    def print_report(self, platform: str):
+        stats = self._platform_stats(platform)
+        total = stats['requests_allowed'] + stats['requests_blocked']
+        log.info("🛡️ %s resource blocking: %d/%d requests blocked, ~%.1f MB saved, %.1f MB loaded",
+                 platform, stats['requests_blocked'], total, stats['estimated_bytes_saved'] / 1024 / 1024,
+                 stats['bytes_loaded'] / 1024 / 1024)
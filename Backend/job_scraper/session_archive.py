@@ -0,0 +1,177 @@
+"""
+Session Record / Replay
+Captures every response a scrape session receives into a SQLite archive and
+serves it back later (browser via context.route, HTTP fast path via the
+fetcher) with no network, so scraper changes can be measured repeatably.
+"""
+
+import asyncio
+import json
+import random
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional, Set, Tuple, Union
+from urllib.parse import urldefrag
+
+from playwright.async_api import BrowserContext, Response, Route
+
+from config import SESSION_ARCHIVE_PATH, REPLAY_LATENCY_MS
+from event_log import get_logger
+
+log = get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key         TEXT PRIMARY KEY,
+    url         TEXT NOT NULL,
+    status      INTEGER NOT NULL,
+    headers     TEXT NOT NULL,
+    body        BLOB NOT NULL,
+    elapsed_ms  REAL NOT NULL,
+    recorded_at REAL NOT NULL
+);
+"""
+
+# Headers that describe the original transfer, not the (decoded) body we store
+_DROPPED_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding', 'connection', 'set-cookie'}
+
+Latency = Union[None, float, Tuple[float, float]]
+
+
+def archive_key(method: str, url: str) -> str:
+    return f"{method.upper()} {urldefrag(url)[0]}"
+
+
+class SessionArchive:
+    """
+    Recorded responses of scrape sessions, keyed by method + URL
+
+    mode='record': the live responses are stored as they arrive (the last
+    one per URL wins). mode='replay': requests are answered from the archive
+    and never reach the network; a request that was not recorded is aborted
+    (browser) or raises FetchBlocked('not_recorded') (HTTP fast path).
+
+    `latency_ms` sets how long a replayed response takes: a fixed number of
+    ms, a (min, max) range drawn per response, or None to replay the time
+    each response took when it was recorded.
+    """
+
+    def __init__(self, path: str = SESSION_ARCHIVE_PATH, mode: str = 'replay',
+                 latency_ms: Latency = REPLAY_LATENCY_MS):
+        if mode not in ('record', 'replay'):
+            raise ValueError(f"Unknown archive mode: {mode}. Use 'record' or 'replay'")
+        self.path = path
+        self.mode = mode
+        self.latency_ms = latency_ms
+        self.stats = {'recorded': 0, 'replayed': 0, 'missed': 0, 'bytes': 0}
+        self._recording: Set[asyncio.Task] = set()  # _record tasks not finished yet
+        self._lock = threading.Lock()
+        # Scrapes may run on the browser manager's loop thread
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == 'replay'
+
+    # ==================== STORAGE ====================
+    def store(self, method: str, url: str, status: int, headers: Dict[str, str], body: bytes,
+              elapsed_ms: float = 0.0):
+        headers = {name.lower(): value for name, value in headers.items() if name.lower() not in _DROPPED_HEADERS}
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO responses (key, url, status, headers, body, elapsed_ms, recorded_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (archive_key(method, url), url, status, json.dumps(headers), body, elapsed_ms, time.time())
+            )
+            self._conn.commit()
+            self.stats['recorded'] += 1
+            self.stats['bytes'] += len(body)
+
+    def lookup(self, method: str, url: str) -> Optional[Tuple[int, Dict[str, str], bytes, float]]:
+        """(status, headers, body, recorded elapsed ms) of a recorded response, or None"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT status, headers, body, elapsed_ms FROM responses WHERE key = ?', (archive_key(method, url),)
+            ).fetchone()
+            if row is None:
+                self.stats['missed'] += 1
+                return None
+            self.stats['replayed'] += 1
+            self.stats['bytes'] += len(row[2])
+        status, headers, body, elapsed_ms = row
+        return status, json.loads(headers), body, elapsed_ms
+
+    async def _delay(self, recorded_ms: float):
+        if self.latency_ms is None:
+            delay = recorded_ms
+        elif isinstance(self.latency_ms, tuple):
+            delay = random.uniform(*self.latency_ms)
+        else:
+            delay = self.latency_ms
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+
+    # ==================== HTTP FAST PATH ====================
+    async def replay_http(self, url: str) -> Optional[Tuple[int, str]]:
+        """(status, text) of a recorded GET after the replay latency, or None when not recorded"""
+        found = self.lookup('GET', url)
+        if found is None:
+            return None
+        status, headers, body, elapsed_ms = found
+        await self._delay(elapsed_ms)
+        return status, body.decode('utf-8', errors='replace')
+
+    # ==================== BROWSER ====================
+    async def attach(self, context: BrowserContext):
+        """Record the context's responses, or serve its requests from the archive"""
+        if self.replaying:
+            await context.route('**/*', self._fulfill)
+        else:
+            context.on('response', self._on_response)
+
+    def _on_response(self, response: Response):
+        task = asyncio.ensure_future(self._record(response))
+        self._recording.add(task)
+        task.add_done_callback(self._recording.discard)
+
+    async def _fulfill(self, route: Route):
+        request = route.request
+        found = self.lookup(request.method, request.url)
+        if found is None:
+            await route.abort()
+            return
+        status, headers, body, elapsed_ms = found
+        await self._delay(elapsed_ms)
+        await route.fulfill(status=status, headers=headers, body=body)
+
+    async def _record(self, response: Response):
+        try:
+            body = await response.body()  # Fails for redirects and aborted requests
+        except Exception:
+            return
+        timing = response.request.timing
+        elapsed_ms = max(0.0, timing.get('responseEnd', 0) - max(0, timing.get('requestStart', 0)))
+        self.store(response.request.method, response.url, response.status, await response.all_headers(), body,
+                   elapsed_ms)
+
+    # ==================== REPORTING ====================
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+
+    def print_report(self):
+        if self.replaying:
+            log.info("📼 Session archive (replay): %d responses served, %d not recorded",
+                     self.stats['replayed'], self.stats['missed'])
+        else:
+            log.info("📼 Session archive (record): %d responses, %.1f MB -> %s",
+                     self.stats['recorded'], self.stats['bytes'] / 1e6, self.path)
+
+    async def close(self):
+        """Wait for the responses still being recorded, then close the archive"""
+        if self._recording:
+            await asyncio.gather(*self._recording, return_exceptions=True)
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,115 @@
+"""
+Tests for checkpoint
+Keyword progress survives a restart, merges page keys and clears once done
+
+Run: python -m pytest test_checkpoint.py
+"""
+
+import asyncio
+import json
+import os
+
+import pytest
+
+from Screp import JobScraper
+from checkpoint import ScrapeCheckpoint, checkpoint_path
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / 'checkpoint.json')
+
+
+def test_progress_is_read_back_after_a_restart(path):
+    checkpoint = ScrapeCheckpoint(path)
+    checkpoint.update('SimplyHired', 'Python Developer', 'United States', 'https://x/search?p=2', 2, ['a', 'b'])
+    checkpoint.save()
+
+    resumed = ScrapeCheckpoint(path).get('SimplyHired', ' python developer', 'united states')
+    assert resumed['next_url'] == 'https://x/search?p=2'
+    assert resumed['page_num'] == 2
+    assert resumed['seen_keys'] == ['a', 'b']
+    assert not resumed['done']
+
+
+def test_page_keys_are_merged(path):
+    checkpoint = ScrapeCheckpoint(path)
+    checkpoint.update('SimplyHired', 'python', 'US', 'u2', 2, ['a', 'b'])
+    checkpoint.update('SimplyHired', 'python', 'US', 'u3', 3, ['c'])
+    assert checkpoint.get('SimplyHired', 'python', 'US')['seen_keys'] == ['a', 'b', 'c']
+    # A new run's first page starts the keyword over
+    checkpoint.update('SimplyHired', 'python', 'US', 'u2', 2, ['d'])
+    assert checkpoint.get('SimplyHired', 'python', 'US')['seen_keys'] == ['d']
+
+
+def test_keyword_without_next_page_is_done(path):
+    checkpoint = ScrapeCheckpoint(path)
+    checkpoint.update('Talent.com', 'python', 'US', None, 4, [])
+    assert checkpoint.get('Talent.com', 'python', 'US')['done']
+
+
+def test_update_is_written_only_by_save(path):
+    checkpoint = ScrapeCheckpoint(path)
+    checkpoint.update('SimplyHired', 'python', 'US', 'u2', 2, ['a'])
+    assert not os.path.exists(path)
+    checkpoint.save()
+    with open(path, encoding='utf-8') as f:
+        assert list(json.load(f)['entries']) == ['SimplyHired|python|us']
+
+
+def test_old_entries_are_ignored(path):
+    checkpoint = ScrapeCheckpoint(path, max_age_hours=0)
+    checkpoint.update('SimplyHired', 'python', 'US', 'u2', 2, ['a'])
+    assert checkpoint.get('SimplyHired', 'python', 'US') is None
+
+
+def test_clear_removes_the_file(path):
+    checkpoint = ScrapeCheckpoint(path)
+    checkpoint.update('SimplyHired', 'python', 'US', 'u2', 2, ['a'])
+    checkpoint.save()
+    checkpoint.clear()
+    assert not os.path.exists(path)
+    assert ScrapeCheckpoint(path).get('SimplyHired', 'python', 'US') is None
+
+
+def test_unreadable_file_is_ignored(path):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('{not json')
+    assert ScrapeCheckpoint(path).entries == {}
+
+
+def test_each_search_has_its_own_file():
+    first = checkpoint_path('scrape_checkpoint.json', 'all', 'US', 'java', 'python')
+    assert first == checkpoint_path('scrape_checkpoint.json', 'ALL', 'us', 'Java', 'python')
+    assert first != checkpoint_path('scrape_checkpoint.json', 'all', 'US', 'python')
+    assert first.startswith('scrape_checkpoint-') and first.endswith('.json')
+
+
+def test_stream_applies_updates_after_their_page_was_consumed(path):
+    scraper = JobScraper(description_cache=False, http_fast_path=False, checkpoint=path)
+    events = []
+
+    async def fake_platform(platform, keywords, location, max_pages, concurrency, emit):
+        for page in (1, 2):
+            for number in range(3):
+                await emit({'title': f'{page}.{number}', 'company': 'Acme', 'source': platform})
+            await emit(lambda page=page: events.append(('checkpoint', page)))
+
+    scraper._scrape_platform = fake_platform
+
+    async def consume(stop_after):
+        stream = scraper.stream_jobs(['python'], platforms=['SimplyHired'])
+        async for job in stream:
+            events.append(('job', job['title']))
+            if len([e for e in events if e[0] == 'job']) == stop_after:
+                await stream.aclose()
+                break
+
+    asyncio.run(consume(stop_after=2))
+    assert ('checkpoint', 1) not in events  # Its page was not fully consumed
+
+    events.clear()
+    asyncio.run(consume(stop_after=None))
+    update = events.index(('checkpoint', 1))
+    assert events[update - 1] == ('job', '1.2')
+    assert events[update + 1] == ('job', '2.0')
@@ -0,0 +1,98 @@
+"""
+Tests for date_parser
+Pins how posted-date texts resolve against a fixed reference time
+
+Run: python -m pytest test_date_parser.py
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from date_parser import DateParser, normalise, parse_normalised
+
+NOW = datetime(2025, 3, 10, 12, 0, 0)
+
+
+@pytest.fixture
+def parser():
+    return DateParser(now=NOW)
+
+
+@pytest.mark.parametrize('text, age', [
+    ('3 hours ago', timedelta(hours=3)),
+    ('2h', timedelta(hours=2)),
+    ('45 minutes ago', timedelta(minutes=45)),
+    ('5m', timedelta(minutes=5)),
+    ('2d', timedelta(days=2)),
+    ('1 day ago', timedelta(days=1)),
+    ('Last updated: 1 day ago', timedelta(days=1)),
+    ('yesterday', timedelta(days=1)),
+    ('3 weeks ago', timedelta(weeks=3)),
+    ('1w', timedelta(weeks=1)),
+    # Months were read as minutes ("m") before
+    ('2 months ago', timedelta(days=60)),
+    ('1 month ago', timedelta(days=30)),
+    ('3 mo ago', timedelta(days=90)),
+    ('3mo', timedelta(days=90)),
+    # "30+ days" did not parse before
+    ('30+ days ago', timedelta(days=30)),
+    ('Posted 30+ days ago', timedelta(days=30)),
+])
+def test_relative_ages(parser, text, age):
+    assert parser.parse(text) == NOW - age
+
+
+@pytest.mark.parametrize('text', ['Just posted', 'Today', 'just posted today'])
+def test_now_texts(parser, text):
+    assert parser.parse(text) == NOW
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('Posted Jan 5, 2025', datetime(2025, 1, 5)),
+    ('January 5th 2025', datetime(2025, 1, 5)),
+    ('5 Dec 2024', datetime(2024, 12, 5)),
+    ('12/05/2024', datetime(2024, 12, 5)),  # US order
+    ('01/05/25', datetime(2025, 1, 5)),
+    ('2025-02-28', datetime(2025, 2, 28)),
+    ('2025-02-28T08:30:00', datetime(2025, 2, 28, 8, 30)),
+])
+def test_absolute_dates(parser, text, expected):
+    assert parser.parse(text) == expected
+
+
+def test_day_number_is_not_an_age(parser):
+    # "5 dec 2025" once matched the "d" unit as 5 days
+    assert parse_normalised('5 dec 2024') == ('at', datetime(2024, 12, 5))
+
+
+def test_date_without_year_is_the_latest_one_up_to_now(parser):
+    assert parser.parse('Posted Mar 1') == datetime(2025, 3, 1)
+    assert parser.parse('Posted Dec 24') == datetime(2024, 12, 24)
+    assert parser.parse('Feb 29') == datetime(2024, 2, 29)
+
+
+@pytest.mark.parametrize('text', [None, '', 'Hiring now', 'x' * 200])
+def test_unparseable_texts_resolve_to_now(parser, text):
+    assert parser.parse(text) == NOW
+    assert parser.stats['unparsed'] == 1
+
+
+def test_relative_ages_share_the_reference_time():
+    parser = DateParser(now=NOW)
+    assert parser.parse('3 hours ago') == parser.parse('3 hours ago')
+    parser.reset(NOW + timedelta(days=1))
+    assert parser.parse('3 hours ago') == NOW + timedelta(days=1, hours=-3)
+
+
+def test_epoch_matches_parse(parser):
+    texts = ['2d', '3 mo ago', 'Jan 5, 2025', None, 'Just posted']
+    assert parser.epochs(texts) == [parser.parse(text).timestamp() for text in texts]
+
+
+def test_parse_iso(parser):
+    assert parser.parse_iso('1 day ago') == (NOW - timedelta(days=1)).isoformat()
+
+
+def test_normalise_strips_prefix_and_case():
+    assert normalise('  Last updated: 2 Days ago ') == '2 days ago'
@@ -0,0 +1,66 @@
+"""
+Tests for deadline
+Request budgets cap timeouts, nest, and end early on expire()
+
+Run: python -m pytest test_deadline.py
+"""
+
+import asyncio
+
+import pytest
+
+from deadline import (
+    Deadline, DeadlineExceeded, cap_ms, cap_seconds, check_deadline, current_deadline, deadline_scope,
+)
+
+
+def test_timeouts_are_unchanged_without_a_deadline():
+    assert current_deadline() is None
+    check_deadline()
+    assert cap_seconds(30) == 30
+    assert cap_ms(5000) == 5000
+
+
+def test_timeouts_are_capped_by_the_remaining_budget():
+    with deadline_scope(2):
+        assert cap_seconds(1) == 1
+        assert 1.5 < cap_seconds(30) <= 2
+        assert 1500 < cap_ms(60000) <= 2000
+    assert current_deadline() is None
+
+
+def test_nested_scope_never_outlasts_the_outer_one():
+    with deadline_scope(1) as outer:
+        with deadline_scope(60) as inner:
+            assert inner.expires_at == pytest.approx(outer.expires_at)
+        assert current_deadline() is outer
+
+
+def test_expired_deadline_raises_with_its_reason():
+    deadline = Deadline(0, 'deadline')
+    assert deadline.expired
+    with pytest.raises(DeadlineExceeded) as error:
+        deadline.cap(5)
+    assert error.value.reason == 'deadline'
+
+
+def test_first_expire_reason_wins():
+    deadline = Deadline(60)
+    deadline.expire('browser_hung')
+    deadline.expire('deadline')
+    assert deadline.expired and deadline.reason == 'browser_hung'
+
+
+def test_tasks_inherit_the_deadline():
+    async def check():
+        check_deadline()
+        return current_deadline()
+
+    async def run():
+        with deadline_scope(60) as deadline:
+            assert await asyncio.create_task(check()) is deadline
+            deadline.expire('browser_hung')
+            with pytest.raises(DeadlineExceeded):
+                await asyncio.create_task(check())
+
+    asyncio.run(run())
@@ -0,0 +1,96 @@
+"""
+Tests for description_cache
+Hits, misses and what a cached entry may override in a built job
+
+Run: python -m pytest test_description_cache.py
+"""
+
+import sqlite3
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+import description_cache
+from Screp import JobScraper
+from description_cache import DescriptionCache
+
+URL = 'https://www.simplyhired.com/job/abc'
+SNIPPET = 'Build data pipelines in Python'
+DETAILS = {'full_description': 'Full description ' * 40, 'posted_date_text': '3 hours ago'}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = DescriptionCache(path=str(tmp_path / 'cache.db'), touch_batch=2)
+    yield cache
+    cache.close()
+
+
+def test_hit_returns_the_description(cache):
+    cache.put(URL, SNIPPET, DETAILS, 'job-1')
+    assert cache.get(URL, SNIPPET) == {'full_description': DETAILS['full_description']}
+    assert cache.get(None, SNIPPET, 'job-1') == {'full_description': DETAILS['full_description']}
+    assert cache.stats['hits'] == 2
+
+
+def test_changed_snippet_is_a_miss(cache):
+    cache.put(URL, SNIPPET, DETAILS)
+    assert cache.get(URL, SNIPPET + ' and Go') is None
+    assert cache.stats['changed'] == 1
+
+
+def test_expired_entry_is_a_miss(cache, monkeypatch):
+    cache.put(URL, SNIPPET, DETAILS)
+    later = time.time() + cache.ttl + 1
+    monkeypatch.setattr(description_cache.time, 'time', lambda: later)
+    assert cache.get(URL, SNIPPET) is None
+    assert cache.stats['expired'] == 1
+
+
+def test_empty_description_is_not_stored(cache):
+    cache.put(URL, SNIPPET, {'full_description': ''})
+    assert len(cache) == 0
+
+
+def test_relative_date_is_not_cached(cache):
+    cache.put(URL, SNIPPET, DETAILS)
+    assert 'posted_date_text' not in cache.get(URL, SNIPPET)
+
+
+def test_cached_hit_does_not_override_the_card_date(cache):
+    # The detail page said "3 hours ago" when it was cached; the card of a
+    # later run shows the posting's real age
+    cache.put(URL, SNIPPET, DETAILS)
+    scraper = JobScraper(description_cache=cache, http_fast_path=False)
+    listing = {'title': 'Data Engineer', 'company': 'Acme', 'location': 'Remote', 'salary': 'Not specified',
+               'url': URL, 'snippet': SNIPPET, 'date_text': '3 days ago', 'posted_at': None}
+    cached = scraper._cached_details('SimplyHired', [listing])
+    job = scraper._build_job('SimplyHired', listing, cached[URL])
+    posted = datetime.fromisoformat(job['posted_date'])
+    assert abs(datetime.now() - timedelta(days=3) - posted) < timedelta(minutes=5)
+    assert job['description'].startswith('Full description')
+
+
+def test_puts_are_written_on_flush(cache):
+    other = sqlite3.connect(cache.path)
+    cache.put(URL, SNIPPET, DETAILS)
+    assert other.execute('SELECT COUNT(*) FROM descriptions').fetchone()[0] == 0
+    cache.flush()
+    assert other.execute('SELECT COUNT(*) FROM descriptions').fetchone()[0] == 1
+    other.close()
+
+
+def test_unflushed_put_is_a_hit(cache):
+    cache.put(URL, SNIPPET, DETAILS)
+    assert cache.get(URL, SNIPPET) is not None
+
+
+def test_flush_evicts_least_recently_used(tmp_path):
+    cache = DescriptionCache(path=str(tmp_path / 'cache.db'), max_entries=2)
+    for number in range(4):
+        cache.put(f'{URL}{number}', SNIPPET, DETAILS)
+    cache.flush()
+    assert len(cache) == 2
+    assert cache.stats['evicted'] == 2
+    cache.close()
@@ -6,6 +6,7 @@ import asyncio
 import traceback
 from datetime import datetime
 from Screp import JobScraper
+from event_log import configure_logging
 
 async def test_local():
     """Test scraping locally with visible browser"""
@@ -103,6 +104,7 @@ if __name__ == "__main__":
     
     input("Press ENTER to start test...")
     
+    configure_logging(fmt='text')  # Scraper progress on the console
     try:
         asyncio.run(test_local())
     except KeyboardInterrupt:
@@ -6,6 +6,7 @@ import asyncio
 import psutil
 import os
 from Screp import JobScraper
+from event_log import configure_logging
 
 def get_memory_usage():
     """Get current memory usage in MB"""
@@ -86,6 +87,7 @@ async def test_sequential_scraping():
     }
 
 if __name__ == "__main__":
+    configure_logging(fmt='text')  # Scraper progress on the console
     try:
         result = asyncio.run(test_sequential_scraping())
         print(f"\n🎯 Test Result: {'PASS ✅' if result['success'] else 'FAIL ❌'}")
@@ -0,0 +1,98 @@
+"""
+Tests for memory_scheduler
+Admission under a memory budget, with a scripted RSS sampler
+
+Run: python -m pytest test_memory_scheduler.py
+"""
+
+import asyncio
+
+from memory_scheduler import MemoryBudgetScheduler
+
+
+def make_scheduler(rss, **kwargs) -> MemoryBudgetScheduler:
+    kwargs.setdefault('sample_interval', 0.001)
+    return MemoryBudgetScheduler(rss_sampler=lambda: rss[0], **kwargs)
+
+
+def run_tasks(scheduler: MemoryBudgetScheduler, count: int, rss=None, per_task_mb: float = 0, **run_kwargs):
+    """Run `count` tasks that each add `per_task_mb` to rss while they run; returns the peak parallelism"""
+    running, peak = [0], [0]
+
+    async def task():
+        running[0] += 1
+        peak[0] = max(peak[0], running[0])
+        if rss is not None:
+            rss[0] += per_task_mb
+        await asyncio.sleep(0.01)
+        if rss is not None:
+            rss[0] -= per_task_mb
+        running[0] -= 1
+
+    asyncio.run(scheduler.run([(f'task{n}', task) for n in range(count)], **run_kwargs))
+    return peak[0]
+
+
+def test_admission_stops_at_the_budget():
+    scheduler = make_scheduler([100.0], budget_mb=300, task_estimate_mb=50, max_parallel=10)
+    assert scheduler.can_admit(100, 0)
+    assert scheduler.can_admit(200, 2)
+    assert not scheduler.can_admit(260, 3)
+
+
+def test_one_task_always_runs():
+    scheduler = make_scheduler([900.0], budget_mb=300, task_estimate_mb=50)
+    assert scheduler.can_admit(900, 0)
+    assert run_tasks(scheduler, 3) == 1
+    assert scheduler.stats['completed'] == 3
+
+
+def test_parallelism_is_capped():
+    scheduler = make_scheduler([0.0], budget_mb=10000, task_estimate_mb=1, max_parallel=2)
+    assert run_tasks(scheduler, 6) == 2
+
+
+def test_estimate_learns_the_observed_task_cost():
+    scheduler = make_scheduler([100.0], budget_mb=400, task_estimate_mb=10, max_parallel=10)
+    scheduler.stats['baseline_rss_mb'] = 100
+    assert scheduler.can_admit(340, 2)
+    scheduler._learn(340, 2)  # Two tasks grew RSS by 240 MB
+    assert scheduler.task_estimate_mb == 120
+    assert not scheduler.can_admit(340, 2)
+    scheduler._learn(200, 2)  # Never lowered
+    assert scheduler.task_estimate_mb == 120
+
+
+def test_tasks_wait_for_memory():
+    rss = [100.0]
+    scheduler = make_scheduler(rss, budget_mb=300, task_estimate_mb=100, max_parallel=10)
+    assert run_tasks(scheduler, 6, rss, per_task_mb=100) == 2
+    assert scheduler.stats['completed'] == 6
+    assert scheduler.stats['deferrals'] > 0
+
+
+def test_failed_task_is_counted_not_raised():
+    async def fails():
+        raise RuntimeError('boom')
+
+    async def works():
+        pass
+
+    scheduler = make_scheduler([0.0])
+    asyncio.run(scheduler.run([('bad', fails), ('good', works)]))
+    assert scheduler.stats['failed'] == 1
+    assert scheduler.stats['completed'] == 1
+
+
+def test_chooser_picks_the_next_task():
+    order = []
+
+    def record(name):
+        async def task():
+            order.append(name)
+        return task
+
+    scheduler = make_scheduler([0.0], max_parallel=1)
+    tasks = [(name, record(name)) for name in ('a', 'b', 'c')]
+    asyncio.run(scheduler.run(tasks, chooser=lambda pending, running: len(pending) - 1))
+    assert order == ['c', 'b', 'a']
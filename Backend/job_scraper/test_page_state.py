@@ -0,0 +1,65 @@
+"""
+Tests for page_state
+Cards read from the embedded __NEXT_DATA__ blob instead of the rendered DOM
+
+Run: python -m pytest test_page_state.py
+"""
+
+import json
+from datetime import datetime
+
+from page_state import extract_state, extract_state_cards, find_job_list, map_job
+
+
+def next_data(state: dict) -> str:
+    return f'<html><script id="__NEXT_DATA__" type="application/json">{json.dumps(state)}</script></html>'
+
+
+JOBS = [
+    {'jobKey': 'abc123', 'title': 'Python Developer', 'company': 'Acme',
+     'location': 'Remote', 'salaryInfo': {'text': '$100k - $120k'}, 'snippet': '<b>Python</b> and SQL',
+     'formattedRelativeTime': '2 days ago', 'datePosted': 1700000000000},
+    {'jobKey': 'def456', 'jobTitle': 'Data Engineer', 'companyName': 'Globex', 'formattedLocation': 'Austin, TX'},
+]
+
+
+def test_cards_come_from_the_job_list():
+    state = {'props': {'pageProps': {'filters': [{'name': 'Remote'}], 'jobs': JOBS}}}
+    cards = extract_state_cards(next_data(state), 'SimplyHired')
+    assert [card['title'] for card in cards] == ['Python Developer', 'Data Engineer']
+    assert [card['company'] for card in cards] == ['Acme', 'Globex']
+    assert cards[0]['salary'] == '$100k - $120k'
+    assert cards[0]['snippet'] == 'Python  and SQL'
+    assert cards[0]['date_text'] == '2 days ago'
+    assert cards[1]['location'] == 'Austin, TX'
+
+
+def test_url_is_built_from_the_job_id():
+    assert map_job(JOBS[0], 'SimplyHired')['url'] == '/job/abc123'
+    assert map_job(JOBS[0], 'Talent.com')['url'] == '/view?id=abc123'
+    assert map_job(dict(JOBS[0], url='https://x/job/1'), 'SimplyHired')['url'] == 'https://x/job/1'
+    assert map_job(JOBS[0], 'Glassdoor')['url'] is None
+
+
+def test_timestamps_become_posted_at():
+    assert map_job(JOBS[0], 'SimplyHired')['posted_at'] == datetime.fromtimestamp(1700000000).isoformat()
+    assert map_job({'title': 'a', 'company': 'b', 'datePosted': '2024-03-01T09:30:00'},
+                   'SimplyHired')['posted_at'] == '2024-03-01T09:30:00'
+    assert map_job({'title': 'a', 'company': 'b', 'datePosted': 'yesterday'}, 'SimplyHired')['posted_at'] is None
+    assert map_job(JOBS[1], 'SimplyHired')['posted_at'] is None
+
+
+def test_other_state_scripts_are_read():
+    html = '<script>window.__INITIAL_STATE__ = {"results": {"list": []}};</script>'
+    assert extract_state(html) == {'results': {'list': []}}
+
+
+def test_pages_without_a_usable_blob_fall_back():
+    assert extract_state_cards('<html><div class="job">x</div></html>', 'SimplyHired') is None
+    assert extract_state_cards(next_data({'props': {'pageProps': {'jobs': []}}}), 'SimplyHired') is None
+    assert extract_state_cards('<script id="__NEXT_DATA__">{broken</script>', 'SimplyHired') is None
+
+
+def test_lists_that_are_not_jobs_are_skipped():
+    state = {'nav': [{'title': 'Home'}, {'title': 'About'}], 'results': JOBS}
+    assert find_job_list(state) == JOBS
@@ -0,0 +1,60 @@
+"""
+Tests for pagination
+Page URLs are built from the links a results page carries, never past a gap
+
+Run: python -m pytest test_pagination.py
+"""
+
+import json
+
+from pagination import linked_pages, page_url, plan_pages, with_query
+
+SIMPLYHIRED = 'https://www.simplyhired.com/search?q=python&l=Remote'
+TALENT = 'https://www.talent.com/jobs?k=python&l=Remote'
+
+
+def test_query_parameters_are_replaced():
+    assert with_query(TALENT, p=3) == 'https://www.talent.com/jobs?k=python&l=Remote&p=3'
+    assert with_query(with_query(TALENT, p=3), p=4).count('p=') == 1
+
+
+def test_page_urls_per_platform():
+    assert page_url('SimplyHired', SIMPLYHIRED, 1) == SIMPLYHIRED
+    assert page_url('SimplyHired', SIMPLYHIRED, 2, 'abc') == with_query(SIMPLYHIRED, cursor='abc')
+    assert page_url('SimplyHired', SIMPLYHIRED, 2) is None  # No cursor token yet
+    assert page_url('Talent.com', TALENT, 5) == with_query(TALENT, p=5)
+    assert page_url('Glassdoor', 'https://www.glassdoor.com/Job/x.htm', 2) is None
+
+
+def test_plan_stops_at_the_first_unlinked_page():
+    links = {2: None, 3: None, 5: None}
+    assert plan_pages('Talent.com', TALENT, links, after=1, last=6) == {
+        2: with_query(TALENT, p=2), 3: with_query(TALENT, p=3),
+    }
+    assert plan_pages('Talent.com', TALENT, links, after=3, last=6) == {}
+
+
+def test_plan_stops_at_the_last_page():
+    links = {number: None for number in range(2, 10)}
+    assert list(plan_pages('Talent.com', TALENT, links, after=1, last=3)) == [2, 3]
+
+
+def test_plan_stops_at_a_page_without_a_cursor():
+    links = {2: 'two', 3: None, 4: 'four'}
+    assert plan_pages('SimplyHired', SIMPLYHIRED, links, after=1, last=4) == {
+        2: with_query(SIMPLYHIRED, cursor='two'),
+    }
+
+
+def test_simplyhired_cursors_come_from_next_data():
+    state = {'props': {'pageProps': {'pageCursors': {'1': None, '2': 'abc', '3': 'def', 'next': 'x'}}}}
+    html = f'<script id="__NEXT_DATA__" type="application/json">{json.dumps(state)}</script>'
+    assert linked_pages(html, 'SimplyHired') == {2: 'abc', 3: 'def'}
+    assert linked_pages('<html></html>', 'SimplyHired') == {}
+
+
+def test_talent_pages_come_from_the_pagination_nav():
+    html = ('<nav class="sc-5ec0130d-0 eRQgGg"><a title="1">1</a><a title="2">2</a>'
+            '<a title="3">3</a><a title="Next">›</a></nav><a title="9">unrelated</a>')
+    assert linked_pages(html, 'Talent.com') == {1: None, 2: None, 3: None}
+    assert linked_pages('<nav class="other"><a title="2">2</a></nav>', 'Talent.com') == {}
@@ -0,0 +1,55 @@
+"""
+Tests for the card pre-filter / incremental crawl screen
+Cards must be keyed like the jobs they become
+
+Run: python -m pytest test_prefilter.py
+"""
+
+import json
+
+import pytest
+
+from Screp import JobScraper
+
+
+def listing(title: str, company: str, date_text: str = 'just posted') -> dict:
+    return {'title': title, 'company': company, 'location': 'Remote', 'salary': 'Not specified',
+            'url': f'https://www.simplyhired.com/job/{abs(hash(title + company))}', 'snippet': '',
+            'date_text': date_text, 'posted_at': None}
+
+
+@pytest.fixture
+def scraper():
+    return JobScraper(description_cache=False, http_fast_path=False, prefilter=True, incremental=True)
+
+
+def test_card_key_matches_the_built_job(scraper):
+    card = listing('  Senior   Python\tDeveloper ', 'Acme   Corp')
+    job = scraper._build_job('SimplyHired', card, {})
+    assert scraper.listing_key(card) == job.key
+
+
+def test_stored_job_with_irregular_whitespace_is_known(scraper, tmp_path):
+    stored = scraper._build_job('SimplyHired', listing('Senior Python Developer', 'Acme Corp'), {})
+    path = tmp_path / 'jobs_output.json'
+    path.write_text(json.dumps({'jobs': [dict(stored)]}))
+    scraper.load_known_jobs(str(path))
+
+    cards = [listing('Senior  Python Developer', 'Acme\nCorp'), listing('Data Engineer', 'Acme Corp')]
+    kept, exhausted = scraper._screen_cards('SimplyHired', 'python', cards)
+    assert [card['title'] for card in kept] == ['Data Engineer']
+    assert scraper.prefilter_stats['SimplyHired']['existing'] == 1
+
+
+def test_page_of_known_cards_stops_the_keyword(scraper):
+    cards = [listing(f'Engineer {number}', 'Acme') for number in range(4)]
+    kept, exhausted = scraper._screen_cards('SimplyHired', 'python', cards)
+    assert len(kept) == 4 and not exhausted
+    kept, exhausted = scraper._screen_cards('SimplyHired', 'python', cards)
+    assert kept == [] and exhausted
+
+
+def test_stale_cards_are_dropped(scraper):
+    kept, _ = scraper._screen_cards('SimplyHired', 'python', [listing('Engineer', 'Acme', '3 days ago')])
+    assert kept == []
+    assert scraper.prefilter_stats['SimplyHired']['stale'] == 1
@@ -0,0 +1,85 @@
+"""
+Tests for rate_limiter
+AIMD pacing: additive recovery, multiplicative backoff, doubling cooldowns
+
+Run: python -m pytest test_rate_limiter.py
+"""
+
+import pytest
+
+import rate_limiter
+from rate_limiter import DomainRateLimiter, domain_of
+
+URL = 'https://www.simplyhired.com/search?q=python'
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(rate_limiter.time, 'monotonic', lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def limiter(clock):
+    return DomainRateLimiter(initial_rps=1.0, min_rps=0.25, max_rps=2.0, increase=0.25, decrease=0.5,
+                             block_cooldown=10, max_cooldown=30, jitter=0)
+
+
+def test_www_and_bare_host_share_a_rate(limiter):
+    assert domain_of(URL) == domain_of('https://simplyhired.com/job/1') == 'simplyhired.com'
+    limiter.success('https://simplyhired.com/job/1')
+    assert limiter.rate(URL) == 1.25
+    assert limiter.rate('https://www.talent.com/jobs') == 1.0
+
+
+def test_slots_are_one_interval_apart(limiter):
+    assert limiter.reserve(URL) == 0
+    assert limiter.reserve(URL) == 1.0
+    assert limiter.reserve(URL) == 2.0
+    assert limiter.reserve('https://www.talent.com/jobs') == 0
+
+
+def test_healthy_responses_raise_the_rate_up_to_the_max(limiter):
+    for _ in range(3):
+        limiter.success(URL)
+    assert limiter.rate(URL) == 1.75
+    for _ in range(10):
+        limiter.success(URL)
+    assert limiter.rate(URL) == 2.0
+
+
+def test_block_halves_the_rate_and_pauses_the_domain(limiter, clock):
+    limiter.backoff(URL, 'status_429')
+    assert limiter.rate(URL) == 0.5
+    assert limiter.reserve(URL) == 10
+    assert limiter.rates()['simplyhired.com']['blocks'] == {'status_429': 1}
+
+
+def test_blocks_during_a_cooldown_do_not_cut_again(limiter, clock):
+    limiter.backoff(URL, 'status_429')
+    clock[0] += 5
+    limiter.backoff(URL, 'captcha')
+    assert limiter.rate(URL) == 0.5
+    assert limiter.rates()['simplyhired.com']['blocks'] == {'status_429': 1, 'captcha': 1}
+
+
+def test_consecutive_blocks_double_the_cooldown(limiter, clock):
+    pauses = []
+    for _ in range(4):
+        limiter.backoff(URL, 'status_429')
+        pauses.append(limiter.rates()['simplyhired.com']['paused_for_s'])
+        clock[0] += pauses[-1]
+    assert pauses == [10, 20, 30, 30]  # Capped at max_cooldown
+    assert limiter.rate(URL) == 0.25  # Never below min_rps
+
+
+def test_recovery_after_a_block(limiter, clock):
+    limiter.backoff(URL, 'status_429')
+    clock[0] += 10
+    for _ in range(6):
+        limiter.success(URL)
+    assert limiter.rate(URL) == 2.0
+    # The streak was reset, so the next block starts from the base cooldown
+    limiter.backoff(URL, 'status_429')
+    assert limiter.rates()['simplyhired.com']['paused_for_s'] == 10
@@ -0,0 +1,28 @@
+"""
+Tests for resource_blocking
+Assets, trackers and third-party hosts are aborted; the configured site never is
+
+Run: python -m pytest test_resource_blocking.py
+"""
+
+from resource_blocking import ResourceBlocker
+
+
+def test_assets_and_trackers_are_blocked():
+    blocker = ResourceBlocker()
+    assert blocker.block_reason('SimplyHired', 'image', 'https://www.simplyhired.com/logo.png') == 'image'
+    assert blocker.block_reason('SimplyHired', 'script', 'https://www.google-analytics.com/a.js') == 'denied_domain'
+    assert blocker.block_reason('Talent.com', 'script', 'https://cdn.example.net/widget.js') == 'third_party'
+    assert blocker.block_reason('Talent.com', 'script', 'https://static.talent.com/app.js') is None
+    assert blocker.block_reason('Talent.com', 'document', 'https://cdn.example.net/page') is None
+
+
+def test_configured_base_host_is_allowed():
+    blocker = ResourceBlocker(base_urls={'SimplyHired': 'http://127.0.0.1:8765',
+                                         'Talent.com': 'https://staging.jobs.example.com'})
+    assert blocker.block_reason('SimplyHired', 'script', 'http://127.0.0.1:8765/static/app.js') is None
+    assert blocker.block_reason('SimplyHired', 'script', 'https://www.indeed.com/x.js') is None
+    assert blocker.block_reason('Talent.com', 'xhr', 'https://staging.jobs.example.com/api/jobs') is None
+    assert blocker.block_reason('Talent.com', 'xhr', 'https://www.talent.com/api/jobs') is None
+    assert blocker.block_reason('Talent.com', 'script', 'http://127.0.0.1:8765/static/app.js') == 'third_party'
+    assert blocker.profiles['Glassdoor']['allowed_domains'] is None
@@ -0,0 +1,55 @@
+"""
+Tests for JobScraper.stream_jobs
+Jobs are handed over as they are built, platform by platform
+
+Run: python -m pytest test_stream_jobs.py
+"""
+
+import asyncio
+
+import pytest
+
+from Screp import JobScraper
+
+
+@pytest.fixture
+def scraper():
+    scraper = JobScraper(description_cache=False, http_fast_path=False)
+    scraper.built = []
+    scraper.jobs_per_keyword = 3
+
+    async def fake_platform(platform, keywords, location, max_pages, concurrency, emit):
+        for keyword in keywords:
+            for number in range(scraper.jobs_per_keyword):
+                scraper.built.append(f'{platform} {keyword} {number}')
+                await emit({'title': f'{platform} {keyword} {number}', 'company': 'Acme', 'source': platform})
+
+    scraper._scrape_platform = fake_platform
+    return scraper
+
+
+def collect(scraper, platforms, stop_after=None):
+    async def run():
+        titles = []
+        stream = scraper.stream_jobs(['python', 'java'], platforms=platforms)
+        async for job in stream:
+            titles.append(job['title'])
+            if stop_after and len(titles) == stop_after:
+                await stream.aclose()
+                break
+        return titles
+    return asyncio.run(run())
+
+
+def test_jobs_of_every_platform_are_streamed_in_order(scraper):
+    titles = collect(scraper, ['SimplyHired', 'Talent.com'])
+    assert len(titles) == 12
+    assert titles == scraper.built
+    assert titles[0] == 'SimplyHired python 0' and titles[-1] == 'Talent.com java 2'
+
+
+def test_closing_early_stops_the_scrape(scraper):
+    scraper.jobs_per_keyword = 100  # More than the stream buffer holds
+    titles = collect(scraper, ['SimplyHired', 'Talent.com'], stop_after=2)
+    assert titles == ['SimplyHired python 0', 'SimplyHired python 1']
+    assert len(scraper.built) < 400  # The producer was cancelled, not run to the end
@@ -0,0 +1,84 @@
+"""
+Tests for text_normalise
+Pins clean_text and the duplicate key to the regexes they replaced
+
+Run: python -m pytest test_text_normalise.py
+"""
+
+import json
+import pickle
+import re
+
+import pytest
+
+from text_normalise import JobRecord, clean_text, clean_texts, job_key, unique_key, unique_keys
+
+
+def old_clean_text(text: str) -> str:
+    if not text:
+        return ""
+    return re.sub(r'[^\w\s.,;:()\-$€£¥]', '', re.sub(r'\s+', ' ', text)).strip()
+
+
+def old_key_part(text: str) -> str:
+    return re.sub(r'[^\w\s]', '', text.lower().strip())
+
+
+SAMPLES = [
+    '',
+    'Senior Python Developer',
+    '  Senior   Python\tDeveloper \n',
+    'C++ / C# Engineer (Remote)',
+    'Data & Analytics - Lead',
+    'Salary: $120,000 - $150,000; €90k; £70k; ¥10m',
+    'Café Müller GmbH',
+    'Ingénieur logiciel – Montréal',
+    'Über Engineer™ ★★★ 100% remote!!!',
+    'naïve   façade résumé',
+    '日本語の求人 (東京)',
+    'emoji 🚀 rocket 💼',
+    'tabs\t\tand\r\nnewlines',
+    'under_score and hy-phen',
+    'a & b',
+]
+
+
+@pytest.mark.parametrize('text', SAMPLES)
+def test_clean_text_matches_old_regexes(text):
+    assert clean_text(text) == old_clean_text(text)
+
+
+@pytest.mark.parametrize('text', SAMPLES)
+def test_unique_key_matches_old_regexes(text):
+    assert unique_key(text, 'Acme, Inc.') == f"{old_key_part('Acme, Inc.')}||{old_key_part(text)}"
+    assert unique_key('Engineer', text) == f"{old_key_part(text)}||{old_key_part('Engineer')}"
+
+
+def test_clean_text_keeps_double_space_of_removed_symbol():
+    assert clean_text('a & b') == 'a  b'
+
+
+def test_clean_texts_in_order():
+    assert clean_texts(SAMPLES) == [old_clean_text(text) for text in SAMPLES]
+
+
+def test_keys_ignore_case_and_punctuation():
+    assert unique_key('Python Developer!', 'ACME, Inc.') == unique_key('python developer', 'acme inc')
+
+
+def test_job_record_key_matches_plain_dict():
+    job = {'title': 'Senior Engineer (Remote)', 'company': 'Café Ltd.', 'url': 'https://example.com/1'}
+    record = JobRecord(job)
+    assert record.key == job_key(job) == job_key(record)
+    assert unique_keys([job, record]) == [record.key, record.key]
+
+
+def test_job_record_key_without_fields():
+    assert JobRecord().key == '||'
+
+
+def test_job_record_serialises_like_a_dict():
+    record = JobRecord(title='Engineer', company='Acme')
+    assert json.loads(json.dumps(record)) == dict(record)
+    restored = pickle.loads(pickle.dumps(record))
+    assert restored == record
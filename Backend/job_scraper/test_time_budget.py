@@ -0,0 +1,64 @@
+"""
+Tests for time_budget
+Unused time rolls over to later platforms; free slots go to the most remaining work
+
+Run: python -m pytest test_time_budget.py
+"""
+
+import pytest
+
+import time_budget
+from time_budget import TimeBudgetAllocator
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time_budget.time, 'monotonic', lambda: now[0])
+    return now
+
+
+def test_unused_time_rolls_over(clock):
+    budget = TimeBudgetAllocator(300, ['SimplyHired', 'Talent.com', 'Glassdoor'])
+    assert budget.allot('SimplyHired') == 100
+    clock[0] += 40  # Finished 60 s early
+    budget.finish('SimplyHired', 40)
+    assert budget.allot('Talent.com') == 130
+    clock[0] += 130
+    budget.finish('Talent.com', 130)
+    assert budget.allot('Glassdoor') == 130
+    assert budget.report()['allotted'] == {'SimplyHired': 100, 'Talent.com': 130, 'Glassdoor': 130}
+
+
+def test_share_never_drops_below_the_minimum(clock):
+    budget = TimeBudgetAllocator(30, ['SimplyHired', 'Talent.com', 'Glassdoor'], min_share=15)
+    assert budget.allot('SimplyHired') == 15
+    clock[0] += 25
+    assert budget.allot('Talent.com') == 5  # Not more than is left
+    clock[0] += 10
+    assert budget.remaining() == 0 and budget.allot('Glassdoor') == 0
+
+
+def test_task_seconds_fall_back_to_the_overall_mean(clock):
+    budget = TimeBudgetAllocator(300, ['SimplyHired', 'Talent.com'])
+    assert budget.seconds_per_task('SimplyHired') == 1.0
+    budget.record_task('Talent.com', 2)
+    budget.record_task('Talent.com', 4)
+    assert budget.seconds_per_task('Talent.com') == 3
+    assert budget.seconds_per_task('SimplyHired') == 3
+
+
+def test_slot_goes_to_the_most_remaining_work(clock):
+    budget = TimeBudgetAllocator(300, ['SimplyHired', 'Talent.com'])
+    budget.record_task('SimplyHired', 1)
+    budget.record_task('Talent.com', 5)
+    # 6 x 1 s against 2 x 5 s
+    assert budget.pick({'SimplyHired': 6, 'Talent.com': 2}, {}) == 'Talent.com'
+    # Running tasks are remaining work too
+    assert budget.pick({'SimplyHired': 6, 'Talent.com': 1}, {'SimplyHired': 5}) == 'SimplyHired'
+    assert budget.pick({'SimplyHired': 0, 'Talent.com': 0}, {'SimplyHired': 1}) is None
+
+
+def test_ties_go_to_the_platform_with_fewer_slots(clock):
+    budget = TimeBudgetAllocator(300, ['SimplyHired', 'Talent.com'])
+    assert budget.pick({'SimplyHired': 2, 'Talent.com': 3}, {'SimplyHired': 2, 'Talent.com': 1}) == 'Talent.com'
@@ -0,0 +1,102 @@
+r"""
+Text Normalisation
+clean_text and the duplicate-detection key without per-call regex passes.
+Whitespace runs collapse with str.split/join and the characters the old
+patterns removed are deleted with a bytes.translate table (the rare
+non-ASCII ones with str.replace). The output is identical to:
+
+    clean_text:  re.sub(r'[^\w\s.,;:()\-$€£¥]', '', re.sub(r'\s+', ' ', text)).strip()
+    key part:    re.sub(r'[^\w\s]', '', text.lower().strip())
+
+Jobs built by the scraper are JobRecords carrying their key, computed once
+at construction; job_key() / unique_keys() compute it for plain dicts (jobs
+loaded from the output file).
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List
+
+_ASCII = frozenset(map(chr, range(128)))
+
+
+class _Deleter:
+    """Deletes every character `pattern` (one character class) matches"""
+
+    def __init__(self, pattern: str):
+        self.pattern = re.compile(pattern)
+        self.ascii_bytes = bytes(c for c in range(128) if self.pattern.match(chr(c)))
+        self._non_ascii: Dict[str, bool] = {}  # character -> deleted
+
+    def __call__(self, text: str) -> str:
+        if not text.isascii():
+            for char in set(text).difference(_ASCII):
+                deleted = self._non_ascii.get(char)
+                if deleted is None:
+                    deleted = self._non_ascii[char] = self.pattern.match(char) is not None
+                if deleted:
+                    text = text.replace(char, '')
+        # What is left outside ASCII is kept, and ASCII bytes never occur
+        # inside a multi-byte UTF-8 sequence
+        return text.encode('utf-8').translate(None, self.ascii_bytes).decode('utf-8')
+
+
+_clean_deleter = _Deleter(r'[^\w\s.,;:()\-$€£¥]')
+_key_deleter = _Deleter(r'[^\w\s]')
+
+
+def clean_text(text: str) -> str:
+    """Collapse whitespace runs to one space, drop symbols, strip"""
+    if not text:
+        return ""
+    # Collapsing before deleting matters: "a & b" keeps two spaces, as before.
+    # The ends are stripped early, which the final strip() makes equivalent
+    return _clean_deleter(' '.join(text.split())).strip()
+
+
+def clean_texts(texts: Iterable[str]) -> List[str]:
+    """clean_text of every text, in order"""
+    return [clean_text(text) for text in texts]
+
+
+@lru_cache(maxsize=65536)
+def key_part(text: str) -> str:
+    """Lower-cased title / company without punctuation (titles and companies repeat, so it is memoised)"""
+    return _key_deleter(text.lower().strip())
+
+
+def unique_key(title: str, company: str) -> str:
+    """Key for duplicate detection: same company + title -> same key"""
+    return f"{key_part(company)}||{key_part(title)}"
+
+
+class JobRecord(dict):
+    """
+    A job dict carrying its unique_key, computed once at construction
+
+    Serialises (JSON, pickle) like the plain dict. The key is not updated
+    when 'title' or 'company' change afterwards.
+    """
+
+    __slots__ = ('key',)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.key = unique_key(self.get('title', ''), self.get('company', ''))
+
+
+def job_key(job: Dict) -> str:
+    """unique_key of a job (a JobRecord's precomputed one)"""
+    if isinstance(job, JobRecord):
+        return job.key
+    return unique_key(job.get('title', ''), job.get('company', ''))
+
+
+def unique_keys(jobs: Iterable[Dict]) -> List[str]:
+    """job_key of every job, in order"""
+    return [job_key(job) for job in jobs]
+
+
+def normalise_jobs(jobs: Iterable[Dict]) -> List[JobRecord]:
+    """Jobs as JobRecords (already-built records are kept as they are)"""
+    return [job if isinstance(job, JobRecord) else JobRecord(job) for job in jobs]
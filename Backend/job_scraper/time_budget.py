@@ -0,0 +1,69 @@
+"""
+Run-Level Time Budget
+Shares one time budget between platforms instead of a fixed timeout per platform
+"""
+
+import time
+from typing import Dict, List, Optional
+
+
+class TimeBudgetAllocator:
+    """
+    Splits a run's total time between platforms as they go
+
+    Sequential mode: allot() gives the next platform an equal share of what
+    is left, so time a fast platform did not use rolls over to the ones
+    after it. Parallel mode: pick() chooses which platform the next free
+    worker slot goes to, favouring the one with the most estimated remaining
+    work (queued tasks x observed seconds per task).
+    """
+
+    def __init__(self, total_seconds: float, platforms: List[str], min_share: float = 10):
+        self.total = total_seconds
+        self.platforms = list(platforms)
+        self.min_share = min_share
+        self.started_at = time.monotonic()
+        self.finished: Dict[str, float] = {}  # platform -> seconds used
+        self.allotted: Dict[str, float] = {}
+        self._task_seconds: Dict[str, List[float]] = {platform: [] for platform in platforms}
+
+    def remaining(self) -> float:
+        return max(0.0, self.total - (time.monotonic() - self.started_at))
+
+    # ==================== SEQUENTIAL ====================
+    def allot(self, platform: str) -> float:
+        """Seconds for `platform`: an equal share of the time left among the unfinished platforms"""
+        left = [p for p in self.platforms if p not in self.finished]
+        share = self.remaining() / max(1, len(left))
+        self.allotted[platform] = max(min(self.min_share, self.remaining()), share)
+        return self.allotted[platform]
+
+    def finish(self, platform: str, seconds_used: float):
+        self.finished[platform] = seconds_used
+
+    # ==================== PARALLEL ====================
+    def record_task(self, platform: str, seconds: float):
+        self._task_seconds.setdefault(platform, []).append(seconds)
+
+    def seconds_per_task(self, platform: str) -> float:
+        """Observed mean task duration; platforms without data use the overall mean"""
+        samples = self._task_seconds.get(platform) or [s for all_s in self._task_seconds.values() for s in all_s]
+        return sum(samples) / len(samples) if samples else 1.0
+
+    def pick(self, pending: Dict[str, int], running: Dict[str, int]) -> Optional[str]:
+        """Platform that should get the next free worker slot"""
+        candidates = [platform for platform, count in pending.items() if count]
+        if not candidates:
+            return None
+        # Remaining work counts the tasks still running too; ties go to the platform with fewer slots
+        return max(candidates, key=lambda p: ((pending[p] + running.get(p, 0)) * self.seconds_per_task(p),
+                                              -running.get(p, 0)))
+
+    def report(self) -> Dict:
+        return {
+            'total_seconds': self.total,
+            'used_seconds': round(self.total - self.remaining(), 1),
+            'allotted': {p: round(s, 1) for p, s in self.allotted.items()},
+            'used': {p: round(s, 1) for p, s in self.finished.items()},
+            'seconds_per_task': {p: round(self.seconds_per_task(p), 1) for p in self.platforms},
+        }
@@ -0,0 +1,95 @@
+"""
+Event-Driven Waits
+Waits on concrete page readiness signals instead of fixed sleeps and networkidle.
+Every timeout is capped by the current request deadline (see deadline.py).
+"""
+
+from typing import List
+
+from playwright.async_api import Page
+
+from deadline import cap_ms
+
+# Resolves once the selector count has stayed the same for `settle` ms.
+# State lives on window so the whole wait runs in the browser (one round-trip).
+_STABLE_COUNT_JS = """
+([selector, settle, minCount]) => {
+    const count = document.querySelectorAll(selector).length;
+    const state = window.__scraperStableCount = window.__scraperStableCount || {};
+    const now = Date.now();
+    if (!state[selector] || state[selector].count !== count) {
+        state[selector] = {count, since: now};
+        return false;
+    }
+    return count >= minCount && now - state[selector].since >= settle ? count : false;
+}
+"""
+
+_TEXT_CHANGED_JS = """
+([selector, previous]) => {
+    const el = document.querySelector(selector);
+    if (!el) return false;
+    const text = el.innerText.trim();
+    return text.length > 0 && text !== previous;
+}
+"""
+
+_TEXT_PRESENT_JS = """
+([selectors, minChars]) => selectors.some(selector => {
+    const el = document.querySelector(selector);
+    return el && el.innerText.trim().length >= minChars;
+})
+"""
+
+
+async def goto_ready(page: Page, url: str, selector: str, timeout: float = 60000):
+    """Navigate and return as soon as the DOM is parsed and `selector` is attached"""
+    await page.goto(url, wait_until='domcontentloaded', timeout=cap_ms(timeout))
+    await page.wait_for_selector(selector, state='attached', timeout=cap_ms(timeout))
+
+
+async def wait_for_stable_count(page: Page, selector: str, timeout: float = 30000,
+                                settle: int = 400, min_count: int = 1) -> int:
+    """Wait until at least `min_count` elements match and the count stops changing; return it"""
+    handle = await page.wait_for_function(
+        _STABLE_COUNT_JS, arg=[selector, settle, min_count], polling=100, timeout=cap_ms(timeout)
+    )
+    return await handle.json_value()
+
+
+async def read_text(page: Page, selector: str) -> str:
+    """Current innerText of the first match ('' if absent)"""
+    try:
+        elem = await page.query_selector(selector)
+        return (await elem.inner_text()).strip() if elem else ""
+    except Exception:
+        return ""
+
+
+async def wait_for_text_change(page: Page, selector: str, previous: str, timeout: float = 30000) -> bool:
+    """Wait until the first match of `selector` shows text different from `previous`"""
+    try:
+        await page.wait_for_function(_TEXT_CHANGED_JS, arg=[selector, previous], polling=100,
+                                     timeout=cap_ms(timeout))
+        return True
+    except Exception:
+        return False
+
+
+async def wait_for_any_text(page: Page, selectors: List[str], min_chars: int = 1,
+                            timeout: float = 10000) -> bool:
+    """Wait until any selector has at least `min_chars` characters of text"""
+    try:
+        await page.wait_for_function(_TEXT_PRESENT_JS, arg=[selectors, min_chars], polling=100,
+                                     timeout=cap_ms(timeout))
+        return True
+    except Exception:
+        return False
+
+
+async def wait_until_hidden(element, timeout: float = 3000):
+    """Wait for an element (e.g. a closed popup) to disappear, ignoring timeouts"""
+    try:
+        await element.wait_for_element_state('hidden', timeout=cap_ms(timeout))
+    except Exception:
+        pass